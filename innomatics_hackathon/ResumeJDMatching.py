@@ -1,8 +1,16 @@
 import os
-import fitz  # PyMuPDF
 import json
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import text_extraction
+import resume_cache
+import metrics
+import hashlib
+import jd_parser
+from skill_matcher import SkillMatcher
+from score_cache import resolve_score_cache, scorer_version
+from jsonl_pipeline import RecordWriter
+
+# numpy / scipy / scikit-learn and PyMuPDF are imported on first use, so
+# importing this module (e.g. in a freshly started scoring worker) is cheap.
 
 # -----------------------------
 # Console colors
@@ -15,99 +23,542 @@ class bcolors:
     BOLD = '\033[1m'
 
 # -----------------------------
-# Helper: extract text from PDF
-def extract_text_from_pdf(pdf_path):
-    if not os.path.exists(pdf_path):
-        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ File not found: {pdf_path}{bcolors.ENDC}")
-    doc = fitz.open(pdf_path)
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
+# Console output: "full" prints every scored resume, "summary" (default)
+# prints a single evaluation in full but only the fit counts of a bulk run,
+# "off" prints neither (skipped-file warnings are always shown)
+CONSOLE = os.environ.get("RESUME_CONSOLE", "summary")
 
 # -----------------------------
-# Helper: clean keywords (remove duplicates & lowercase)
+# Helper: extract text from PDF (path, in-memory bytes or (name, bytes))
+def extract_text_from_pdf(pdf):
+    if isinstance(pdf, str) and not os.path.exists(pdf):
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ File not found: {pdf}{bcolors.ENDC}")
+    return text_extraction.extract_text_from_pdf(pdf)
+
+# Same for any supported format (PDF, DOCX, TXT, HTML; see text_extraction)
+def extract_text(document):
+    if isinstance(document, str) and not os.path.exists(document):
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ File not found: {document}{bcolors.ENDC}")
+    return text_extraction.extract_text(document)
+
+# -----------------------------
+# Helper: clean keywords (remove duplicates & lowercase, first occurrence wins)
 def clean_keywords(keywords):
-    return list({kw.strip().lower() for kw in keywords if kw.strip()})
+    return list(dict.fromkeys(" ".join(kw.lower().split()) for kw in keywords if kw.strip()))
+
+# -----------------------------
+# Requirement weights. A must-have counts MUST_HAVE_WEIGHT times as much as a
+# nice-to-have in the relevance score, and with HARD_FILTER on a resume that
+# lacks any must-have is rejected before it is scored at all
+# (RESUME_HARD_FILTER=0 turns the filter off and keeps only the weighting).
+MUST_HAVE_WEIGHT = 2.0
+NICE_TO_HAVE_WEIGHT = 1.0
+HARD_FILTER = os.environ.get("RESUME_HARD_FILTER", "1") != "0"
+
+# Fit thresholds on the relevance score (above HIGH_FIT = High fit, above
+# MEDIUM_FIT = Medium fit, else Low fit)
+HIGH_FIT = 70
+MEDIUM_FIT = 40
+FIT_LABELS = ["Low fit", "Medium fit", "High fit"]
+FIT_COLORS = {"High fit": bcolors.OKGREEN, "Medium fit": bcolors.WARNING, "Low fit": bcolors.FAIL, "Rejected": bcolors.FAIL}
+
+def requirement_weight(n_must_have, n_nice_to_have):
+    return n_must_have * MUST_HAVE_WEIGHT + n_nice_to_have * NICE_TO_HAVE_WEIGHT
+
+# JD key for the score cache: JDs with the same requirements score every
+# resume the same, whatever their file name, format or requirement order
+def requirements_hash(must_have, nice_to_have):
+    return hashlib.sha256(json.dumps([sorted(must_have), sorted(nice_to_have)]).encode("utf-8")).hexdigest()[:16]
 
 # -----------------------------
-# Load JD PDF and extract keywords (must-have + good-to-have)
+# Load JD (PDF or any other supported format) as structured requirements:
+# the same must_have_skills / nice_to_have_skills record JDParsingScript.py
+# writes to parsed_jds.json. Skills found outside a "must have" / "nice to
+# have" line count as nice-to-have; prose is not turned into keywords.
 def load_jd(jd_path):
-    jd_text = extract_text_from_pdf(jd_path)
-    # Split by line, comma, or semicolon
-    raw_keywords = []
-    for line in jd_text.splitlines():
-        raw_keywords.extend(line.replace(';', ',').split(','))
-    return clean_keywords(raw_keywords)
-
-# -----------------------------
-# Evaluate single resume
-def evaluate_single_resume(resume_path, jd_path):
-    resume_text = extract_text_from_pdf(resume_path)
-    jd_keywords = load_jd(jd_path)
-
-    if not jd_keywords:
-        raise ValueError(f"{bcolors.FAIL}⚠️ No keywords found in JD{bcolors.ENDC}")
-
-    # TF-IDF Vectorizer with JD keywords as vocabulary
-    vectorizer = TfidfVectorizer(vocabulary=jd_keywords)
-    tfidf_matrix = vectorizer.fit_transform([resume_text])
-    scores = tfidf_matrix.toarray()[0]
-
-    relevance_score = sum(scores) / len(jd_keywords) * 100
-
-    # Determine fit
-    if relevance_score > 70:
-        fit = "High fit"
-        color = bcolors.OKGREEN
-    elif relevance_score > 40:
-        fit = "Medium fit"
-        color = bcolors.WARNING
+    with metrics.timer("load_jd"):
+        jd_text = extract_text(jd_path)
+        parsed = jd_parser.parse_jd(text_extraction.source_name(jd_path), jd_text)
+        parsed["nice_to_have_skills"] += jd_parser.extract_skills(parsed["full_text"])
+        metrics.count("jds_loaded")
+        return parsed
+
+# -----------------------------
+# Compiled JD: requirements, weights and skill matchers built once and
+# reused for every resume. Keywords are counted with the same SkillMatcher
+# as the must-have filter, so "node.js" or "ci/cd" that passes the filter
+# is also scored. keywords = must-haves first, then the
+# nice-to-haves; a skill listed under both is a must-have. A JD built from a
+# plain keyword list has no must-haves and weighs every keyword the same.
+class CompiledJD:
+    def __init__(self, jd_name, keywords, must_have=()):
+        import numpy as np
+        must_have = clean_keywords(must_have)
+        nice_to_have = [kw for kw in clean_keywords(keywords) if kw not in set(must_have)]
+        if not must_have and not nice_to_have:
+            raise ValueError(f"{bcolors.FAIL}⚠️ No keywords found in JD{bcolors.ENDC}")
+        self.jd_name = jd_name
+        self.must_have = must_have
+        self.nice_to_have = nice_to_have
+        self.keywords = must_have + nice_to_have
+        self.weights = np.array([MUST_HAVE_WEIGHT] * len(must_have) + [NICE_TO_HAVE_WEIGHT] * len(nice_to_have))
+        self.total_weight = requirement_weight(len(must_have), len(nice_to_have))
+        self.jd_hash = requirements_hash(must_have, nice_to_have)
+        with metrics.timer("compile_jd"):
+            self.must_have_matcher = SkillMatcher(must_have) if must_have else None
+            self.keyword_matcher = SkillMatcher(self.keywords)
+
+    @classmethod
+    def from_parsed(cls, jd_name, jd_data):
+        return cls(jd_name, jd_data.get("nice_to_have_skills", []), jd_data.get("must_have_skills", []))
+
+    # Must-haves not found in the resume (one pass of the must-have matcher)
+    def missing_must_have(self, resume_text):
+        if self.must_have_matcher is None:
+            return []
+        found = set(self.must_have_matcher.find_skills(resume_text))
+        return [kw for kw in self.must_have if kw not in found]
+
+    # l2-normalised term frequencies over self.keywords (TF-IDF fitted on a
+    # single resume gives every present term an idf of 1, so this is the
+    # same score)
+    def score(self, resume_text):
+        import numpy as np
+        tf = np.array(self.keyword_matcher.counts(resume_text), dtype=np.float64)
+        norm = np.sqrt(tf @ tf)
+        return tf / norm if norm else tf
+
+def compile_jd(jd):
+    if isinstance(jd, CompiledJD):
+        return jd
+    if text_extraction.source_name(jd).lower().endswith((".json", ".jsonl")):
+        jds = load_jd_json(jd)
+        if len(jds) != 1:
+            raise ValueError(f"{bcolors.FAIL}⚠️ {text_extraction.source_name(jd)} holds {len(jds)} JDs; "
+                             f"evaluate them with evaluate_multiple_resumes(){bcolors.ENDC}")
+        return jds[0]
+    return CompiledJD.from_parsed(text_extraction.source_name(jd), load_jd(jd))
+
+# -----------------------------
+# Load parsed JD JSON / JSON Lines (output of JDParsingScript.py, also what
+# app.py's /upload_jd stores) as CompiledJDs. Path or (name, bytes) upload.
+def load_jd_json(jd_json):
+    if isinstance(jd_json, str):
+        if not os.path.exists(jd_json):
+            raise FileNotFoundError(f"{bcolors.FAIL}⚠️ File not found: {jd_json}{bcolors.ENDC}")
+        with open(jd_json, "r", encoding="utf-8") as f:
+            content = f.read()
+    else:
+        content = bytes(jd_json[1]).decode("utf-8")
+    jd_json_name = text_extraction.source_name(jd_json)
+    if jd_json_name.lower().endswith(".jsonl"):
+        parsed = [json.loads(line) for line in content.splitlines() if line.strip()]
     else:
-        fit = "Low fit"
-        color = bcolors.FAIL
+        parsed = json.loads(content)
+    if isinstance(parsed, dict):
+        parsed = [parsed]
+    return [CompiledJD.from_parsed(jd_data.get("file_name", jd_json_name), jd_data) for jd_data in parsed]
+
+def load_jds(jd_files):
+    jds = []
+    for jd_file in jd_files:
+        if not isinstance(jd_file, CompiledJD) and text_extraction.source_name(jd_file).lower().endswith((".json", ".jsonl")):
+            jds.extend(load_jd_json(jd_file))
+        else:
+            jds.append(compile_jd(jd_file))
+    return jds
+
+# -----------------------------
+# Evaluate single resume (jd can be a JD path, (name, bytes) or a CompiledJD).
+# The resume is a path or an in-memory (file name, bytes) upload in any
+# supported format, scored without being written to disk.
+# Extracted text is served from the content-hash cache when the same PDF
+# was seen before; pass cache=False to always re-parse. The result itself is
+# served from the score cache when this resume was already scored against
+# a JD with the same requirements; pass score_cache=False to always re-score.
+def evaluate_single_resume(resume, jd, cache=None, score_cache=None):
+    if isinstance(resume, str) and not os.path.exists(resume):
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ File not found: {resume}{bcolors.ENDC}")
+    jd = compile_jd(jd)
+    scores = resolve_score_cache(score_cache, current_scorer_version())
+    resume_hash = resume_cache.content_hash(resume)
+    result = cached_result(scores, resume, resume_hash, jd)
+    if result is None:
+        resume_text = resume_cache.load_resume(resume, cache)["text"]
+        result = score_and_cache(scores, resume, resume_hash, resume_text, jd)
+    if CONSOLE != "off":
+        print_result(result)
+    return result
 
-    # Missing keywords
-    missing_keywords = [jd_keywords[i] for i, val in enumerate(scores) if val == 0]
+# -----------------------------
+# Score cache helpers. Every result carries its cache key (resume_hash,
+# jd_hash, scorer_version), which the evaluation store uses to skip
+# duplicate rows.
+def current_scorer_version():
+    return scorer_version(HARD_FILTER)
 
-    feedback = f"Candidate is {fit}. Missing keywords: {', '.join(missing_keywords) if missing_keywords else 'None'}"
+def cached_result(scores, resume, resume_hash, jd):
+    cached = scores.get(resume_hash, jd.jd_hash) if scores else None
+    if cached is None:
+        return None
+    return {"candidate_name": text_extraction.source_name(resume), **cached}
+
+def score_and_cache(scores, resume, resume_hash, resume_text, jd):
+    result = score_resume_text(resume, resume_text, jd)
+    result.update(resume_hash=resume_hash, jd_hash=jd.jd_hash, scorer_version=current_scorer_version())
+    if scores:
+        scores.put(resume_hash, jd.jd_hash, result)
+    return result
 
-    result = {
-        "candidate_name": os.path.basename(resume_path),
-        "relevance_score": round(relevance_score),
-        "missing_keywords": missing_keywords,
-        "feedback": feedback
+# -----------------------------
+# Result for a resume rejected by the must-have filter (never scored)
+def rejected_result(candidate_name, missing_must_have):
+    return {
+        "candidate_name": candidate_name,
+        "relevance_score": 0,
+        "fit": "Rejected",
+        "missing_keywords": missing_must_have,
+        "feedback": f"Candidate is Rejected. Missing must-have skills: {', '.join(missing_must_have)}",
+        "rejected": True
     }
 
-    # Console output
+# -----------------------------
+# Score already-extracted resume text against a JD. Must-haves are checked
+# first; a resume missing one is rejected without being vectorized.
+def score_resume_text(resume_path, resume_text, jd):
+    jd = compile_jd(jd)
+    candidate_name = text_extraction.source_name(resume_path)
+
+    with metrics.timer("must_have_filter"):
+        missing_must_have = jd.missing_must_have(resume_text) if HARD_FILTER else []
+    if missing_must_have:
+        metrics.count("resumes_rejected")
+        return rejected_result(candidate_name, missing_must_have)
+
+    with metrics.timer("score"):
+        scores = jd.score(resume_text)
+    metrics.count("resumes_scored")
+
+    # Weighted: must-haves count MUST_HAVE_WEIGHT times
+    relevance_score = scores @ jd.weights / jd.total_weight * 100
+    return build_results([candidate_name], jd.keywords, [relevance_score], [scores > 0])[0]
+
+# -----------------------------
+# Batch post-processing: results for n resumes against one JD from their
+# relevance scores (n,) and keyword presence (n x len(keywords), column
+# order = the JD's keywords). Rounding, fit thresholds and missing-keyword masks
+# are array operations over the whole batch; the missing-keyword list and
+# feedback text are built once per distinct (missing keywords, fit) pair.
+# Rows with a non-empty missing_must_have[r] are rejected.
+def build_results(candidate_names, keywords, relevance, presence, missing_must_have=None):
+    import numpy as np
+
+    if not len(candidate_names):
+        return []
+    relevance = np.asarray(relevance, dtype=np.float64)
+    rounded = np.rint(relevance).astype(int)
+    fit_codes = (relevance > MEDIUM_FIT).astype(int) + (relevance > HIGH_FIT)
+    missing = ~np.asarray(presence, dtype=bool).reshape(len(candidate_names), len(keywords))
+
+    # One row per distinct missing-keyword pattern
+    _, first_rows, pattern_ids = np.unique(np.packbits(missing, axis=1), axis=0,
+                                           return_index=True, return_inverse=True)
+    pattern_ids = pattern_ids.reshape(-1)
+    keywords = np.array(keywords, dtype=object)
+    missing_lists = [keywords[missing[row]].tolist() for row in first_rows]
+    feedback = {}
+
+    results = []
+    for r, candidate_name in enumerate(candidate_names):
+        if missing_must_have is not None and missing_must_have[r]:
+            results.append(rejected_result(candidate_name, missing_must_have[r]))
+            continue
+        key = (pattern_ids[r], fit_codes[r])
+        if key not in feedback:
+            missing_keywords = missing_lists[key[0]]
+            feedback[key] = (f"Candidate is {FIT_LABELS[key[1]]}. Missing keywords: "
+                             f"{', '.join(missing_keywords) if missing_keywords else 'None'}")
+        results.append({
+            "candidate_name": candidate_name,
+            "relevance_score": int(rounded[r]),
+            "fit": FIT_LABELS[key[1]],
+            "missing_keywords": list(missing_lists[key[0]]),
+            "feedback": feedback[key],
+            "rejected": False
+        })
+    return results
+
+# -----------------------------
+# Console output for one result, and fit counts for a batch
+def print_result(result):
     print("\n---------------------------------")
-    print(f"Resume: {bcolors.BOLD}{os.path.basename(resume_path)}{bcolors.ENDC}")
-    print(f"Score: {color}{round(relevance_score)}% ({fit}){bcolors.ENDC}")
-    print(f"Missing Keywords: {missing_keywords}")
-    print(f"Feedback: {feedback}")
+    print(f"Resume: {bcolors.BOLD}{result['candidate_name']}{bcolors.ENDC}")
+    if result["rejected"]:
+        print(f"{bcolors.FAIL}Rejected: missing must-have skills {result['missing_keywords']}{bcolors.ENDC}")
+        return
+    color = FIT_COLORS.get(result.get("fit"), bcolors.ENDC)
+    print(f"Score: {color}{result['relevance_score']}% ({result.get('fit')}){bcolors.ENDC}")
+    print(f"Missing Keywords: {result['missing_keywords']}")
+    print(f"Feedback: {result['feedback']}")
 
-    return result
+def format_fit_counts(fit_counts):
+    return ", ".join(f"{FIT_COLORS[fit]}{fit_counts.get(fit, 0)} {fit}{bcolors.ENDC}"
+                     for fit in ["High fit", "Medium fit", "Low fit", "Rejected"])
 
 # -----------------------------
-# Evaluate multiple resumes in bulk
-def evaluate_bulk_resumes(resume_folder, jd_path):
+# Columns of a bulk result file (CSV output)
+RESULT_FIELDS = ["candidate_name", "relevance_score", "fit", "missing_keywords", "feedback", "rejected"]
+
+# -----------------------------
+# Stream bulk evaluation: yields one result per resume (already-scored
+# resumes first, straight from the score cache, then the rest in blocks of
+# BULK_BATCH as the extraction pool finishes them; each block is scored and
+# post-processed as one matrix)
+BULK_BATCH = 64
+
+def iter_bulk_evaluations(resume_paths, jd, workers=None, cache=None, score_cache=None):
+    # Parse and vectorize the JD once for the whole batch
+    jd = compile_jd(jd)
+    scores = resolve_score_cache(score_cache, current_scorer_version())
+    hashes = {}  # id(path) -> content hash; extract_texts yields the same objects back
+    misses = []
+    for resume_file in resume_paths:
+        resume_hash = resume_cache.content_hash(resume_file)
+        cached = cached_result(scores, resume_file, resume_hash, jd)
+        if cached is None:
+            hashes[id(resume_file)] = resume_hash
+            misses.append(resume_file)
+        else:
+            if CONSOLE == "full":
+                print_result(cached)
+            yield cached
+
+    batch = []
+    for resume_file, resume_text, error in resume_cache.extract_texts(misses, workers, cache):
+        if error:
+            metrics.count("resumes_skipped")
+            print(f"{bcolors.WARNING}⚠️ Skipping {text_extraction.source_name(resume_file)}: {error}{bcolors.ENDC}")
+            continue
+        batch.append((resume_file, resume_text))
+        if len(batch) >= BULK_BATCH:
+            yield from score_bulk_batch(scores, batch, hashes, jd)
+            batch = []
+    if batch:
+        yield from score_bulk_batch(scores, batch, hashes, jd)
+
+def score_bulk_batch(scores, batch, hashes, jd):
+    names = [text_extraction.source_name(resume_file) for resume_file, _ in batch]
+    results = score_texts(names, [resume_text for _, resume_text in batch], [jd])[0]
+    version = current_scorer_version()
+    for (resume_file, _), result in zip(batch, results):
+        result.update(resume_hash=hashes[id(resume_file)], jd_hash=jd.jd_hash, scorer_version=version)
+        if CONSOLE == "full":
+            print_result(result)
+    if scores:
+        scores.put_many([(result["resume_hash"], jd.jd_hash, result) for result in results])
+    return results
+
+# -----------------------------
+# Evaluate multiple resumes in bulk. Results are written one line at a time
+# to output_file (.jsonl by default, or .csv) and never held together in
+# memory; returns a summary with the top_k best candidates.
+def evaluate_bulk_resumes(resume_folder, jd, workers=None, cache=None, output_file=None, top_k=3, score_cache=None):
+    import heapq
+
     if not os.path.exists(resume_folder):
         raise FileNotFoundError(f"{bcolors.FAIL}⚠️ Resume folder not found: {resume_folder}{bcolors.ENDC}")
     
-    resumes = [os.path.join(resume_folder, f) for f in os.listdir(resume_folder) if f.lower().endswith(".pdf")]
+    extensions = text_extraction.supported_extensions()
+    resumes = [os.path.join(resume_folder, f) for f in os.listdir(resume_folder) if f.lower().endswith(extensions)]
     if not resumes:
-        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ No PDF resumes found in {resume_folder}{bcolors.ENDC}")
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ No resumes found in {resume_folder}{bcolors.ENDC}")
+
+    output_file = output_file or os.path.join(resume_folder, "evaluation_results.jsonl")
+    top = []
+    fit_counts = {}
+    with RecordWriter(output_file, RESULT_FIELDS) as writer:
+        for res in iter_bulk_evaluations(resumes, jd, workers, cache, score_cache):
+            writer.write(res)
+            fit_counts[res.get("fit")] = fit_counts.get(res.get("fit"), 0) + 1
+            heapq.heappush(top, (res["relevance_score"], writer.count, res))
+            if len(top) > top_k:
+                heapq.heappop(top)
+
+    if CONSOLE != "off":
+        print(f"\n{bcolors.OKGREEN}✅ Bulk evaluation complete. {writer.count} results saved to {output_file}{bcolors.ENDC}")
+        print(f"Fit: {format_fit_counts(fit_counts)}")
+    return {
+        "output_file": output_file,
+        "evaluated": writer.count,
+        "skipped": len(resumes) - writer.count,
+        "top_candidates": [res for _, _, res in sorted(top, key=lambda item: (-item[0], item[1]))]
+    }
+
+# -----------------------------
+# Batch scoring: every resume against every JD in one vectorized pass
+#   counts   : N resumes x V terms (union of all JD keywords), built once
+#   keywords : V terms x M JDs requirement-weight matrix, built once
+# Per pair, the single-resume score is sum(weight * tf) / ||tf||_2 over the
+# JD's own keywords, so both sums come out of two sparse matrix products.
+# keyword_ratios returns that N x M ratio before the per-JD division by the
+# total requirement weight, plus per-JD presence masks (N x len(jd.keywords)
+# booleans, column order = jd.keywords).
+def keyword_ratios(resume_texts, jds):
+    with metrics.timer("score_matrix"):
+        return _keyword_ratios(resume_texts, jds)
+
+def _keyword_ratios(resume_texts, jds):
+    import numpy as np
+    from scipy import sparse
+
+    vocabulary = sorted({kw for jd in jds for kw in jd.keywords})
+    term_index = {term: i for i, term in enumerate(vocabulary)}
+
+    # N x V term counts from one SkillMatcher pass per resume (the same
+    # matches the must-have filter sees)
+    matcher = SkillMatcher(vocabulary)
+    counts = sparse.csc_matrix(np.array([matcher.counts(text) for text in resume_texts],
+                                        dtype=np.float64).reshape(len(resume_texts), len(vocabulary)))
+
+    rows = [term_index[kw] for jd in jds for kw in jd.keywords]
+    cols = [j for j, jd in enumerate(jds) for _ in jd.keywords]
+    weights = np.concatenate([jd.weights for jd in jds])
+    keywords = sparse.csr_matrix((weights, (rows, cols)), shape=(len(vocabulary), len(jds)))
+    members = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(vocabulary), len(jds)))
+
+    term_sums = (counts @ keywords).toarray()
+    term_norms = np.sqrt((counts.multiply(counts) @ members).toarray())
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(term_norms > 0, term_sums / term_norms, 0.0)
+
+    presence = [(counts[:, [term_index[kw] for kw in jd.keywords]] > 0).toarray() for jd in jds]
+    metrics.count("resumes_scored", len(resume_texts) * len(jds))
+    return ratios, presence
+
+def score_matrix(resume_texts, jds):
+    import numpy as np
+
+    ratios, presence = keyword_ratios(resume_texts, jds)
+    total_weights = np.array([jd.total_weight for jd in jds], dtype=np.float64)
+    return ratios / total_weights * 100, presence
+
+# -----------------------------
+# Hard filter for a batch: one matcher pass per resume over the union of all
+# JDs' must-haves. Returns the N x M eligible mask and the must-haves found
+# in each resume.
+def must_have_check(resume_texts, jds):
+    import numpy as np
+
+    eligible = np.ones((len(resume_texts), len(jds)), dtype=bool)
+    must_haves = sorted({kw for jd in jds for kw in jd.must_have})
+    if not HARD_FILTER or not must_haves:
+        return eligible, [set() for _ in resume_texts]
+
+    matcher = SkillMatcher(must_haves)
+    found = []
+    with metrics.timer("must_have_filter"):
+        for i, resume_text in enumerate(resume_texts):
+            found.append(set(matcher.find_skills(resume_text)))
+            for j, jd in enumerate(jds):
+                eligible[i, j] = found[i].issuperset(jd.must_have)
+    metrics.count("resumes_rejected", int((~eligible).sum()))
+    return eligible, found
+
+def fit_label(relevance_score):
+    return FIT_LABELS[int(relevance_score > MEDIUM_FIT) + int(relevance_score > HIGH_FIT)]
+
+# -----------------------------
+# Score a batch of extracted texts against every JD: must-haves first, then
+# one matrix pass over the resumes eligible for at least one JD, then batch
+# post-processing. Returns one result list per JD (without cache keys).
+def score_texts(candidate_names, resume_texts, jds):
+    import numpy as np
+
+    eligible, found = must_have_check(resume_texts, jds)
+    scored_rows = np.flatnonzero(eligible.any(axis=1))
+    relevance = np.zeros((len(resume_texts), len(jds)))
+    presence = [np.zeros((len(resume_texts), len(jd.keywords)), dtype=bool) for jd in jds]
+    if len(scored_rows):
+        scored_relevance, scored_presence = score_matrix([resume_texts[r] for r in scored_rows], jds)
+        relevance[scored_rows] = scored_relevance
+        for j in range(len(jds)):
+            presence[j][scored_rows] = scored_presence[j]
+
+    results = []
+    with metrics.timer("post_process"):
+        for j, jd in enumerate(jds):
+            missing_must_have = [None if eligible[r, j] else [kw for kw in jd.must_have if kw not in found[r]]
+                                 for r in range(len(resume_texts))]
+            results.append(build_results(candidate_names, jd.keywords, relevance[:, j], presence[j], missing_must_have))
+    return results
+
+def evaluate_multiple_resumes(resume_files, jd_files, workers=None, cache=None, score_cache=None):
+    if not resume_files:
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ No resumes given{bcolors.ENDC}")
+    jds = load_jds(jd_files)
+    if not jds:
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ No JDs given{bcolors.ENDC}")
+
+    # (resume, JD) pairs already in the score cache; a resume is only read
+    # and scored when at least one of its pairs is missing
+    scores = resolve_score_cache(score_cache, current_scorer_version())
+    hashes = [resume_cache.content_hash(resume_file) for resume_file in resume_files]
+    done = {}
+    if scores:
+        for i, resume_hash in enumerate(hashes):
+            for j, jd in enumerate(jds):
+                cached = scores.get(resume_hash, jd.jd_hash)
+                if cached is not None:
+                    done[i, j] = cached
+    pending = [i for i in range(len(resume_files)) if any((i, j) not in done for j in range(len(jds)))]
+
+    extracted = {}
+    for resume_file, resume_text, error in resume_cache.extract_texts([resume_files[i] for i in pending], workers, cache):
+        if error:
+            metrics.count("resumes_skipped")
+            print(f"{bcolors.WARNING}⚠️ Skipping {text_extraction.source_name(resume_file)}: {error}{bcolors.ENDC}")
+            continue
+        extracted[resume_file] = resume_text
+    rows = [i for i in pending if resume_files[i] in extracted]
+    failed = set(pending) - set(rows)
+    kept = [i for i in range(len(resume_files)) if i not in failed]
+    if not kept:
+        raise ValueError(f"{bcolors.FAIL}⚠️ No resumes could be read{bcolors.ENDC}")
+
+    resume_texts = [extracted[resume_files[i]] for i in rows]
+    names = [text_extraction.source_name(resume_files[i]) for i in rows]
+    jd_results = score_texts(names, resume_texts, jds) if rows else [[] for _ in jds]
+
+    version = current_scorer_version()
+    new_entries = []
+    for j, jd in enumerate(jds):
+        for r, i in enumerate(rows):
+            if (i, j) in done:
+                continue
+            result = {"candidate_name": names[r], "jd_name": jd.jd_name, **jd_results[j][r]}
+            result.update(resume_hash=hashes[i], jd_hash=jd.jd_hash, scorer_version=version)
+            done[i, j] = result
+            new_entries.append((hashes[i], jd.jd_hash, result))
+    if scores and new_entries:
+        scores.put_many(new_entries)
 
     results = []
-    for resume_file in resumes:
-        res = evaluate_single_resume(resume_file, jd_path)
-        results.append(res)
-
-    # Save results
-    output_file = os.path.join(resume_folder, "evaluation_results.json")
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=4)
-    print(f"\n{bcolors.OKGREEN}✅ Bulk evaluation complete. Results saved to {output_file}{bcolors.ENDC}")
+    for j, jd in enumerate(jds):
+        for i in kept:
+            results.append({"candidate_name": text_extraction.source_name(resume_files[i]), "jd_name": jd.jd_name,
+                            **done[i, j]})
+
+    if CONSOLE == "full":
+        for result in results:
+            print_result(result)
+    if CONSOLE != "off":
+        fit_counts = {}
+        for result in results:
+            fit_counts[result.get("fit")] = fit_counts.get(result.get("fit"), 0) + 1
+        print(f"\n{bcolors.OKGREEN}✅ Evaluated {len(kept)} resumes against {len(jds)} JDs "
+              f"({len(kept) * len(jds) - len(new_entries)} pairs from the score cache){bcolors.ENDC}")
+        print(f"Fit: {format_fit_counts(fit_counts)}")
     return results
 
 # -----------------------------
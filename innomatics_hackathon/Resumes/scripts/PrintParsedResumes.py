@@ -1,28 +1,51 @@
-import json
+import os
+import sys
 from colorama import Fore, Style, init
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from column_store import ColumnStore, iter_corpus
+
 # Initialize colorama
 init(autoreset=True)
 
 # ----------------------------
-# 1. Load parsed resumes JSON
+# 1. Load parsed resumes: a column store directory (only the printed
+#    columns are read; resume names after the path are looked up directly),
+#    JSON Lines (streamed one record at a time) or a JSON array
 # ----------------------------
-parsed_file = r"C:\JAGA\innomatics_hackathon\Resumes\outcomes_resumes\parsed_resumes_smart.json"
+parsed_file = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "outcomes_resumes", "parsed_resumes_smart.jsonl")
+selected = sys.argv[2:]
+
+# Sections to display
+sections = ["skills", "experience", "education", "projects", "certifications"]
+columns = ["file_name"] + sections
 
-with open(parsed_file, "r", encoding="utf-8") as f:
-    parsed_resumes = json.load(f)
+def iter_parsed_resumes(path):
+    if os.path.isdir(path) and selected:
+        with ColumnStore(path) as store:
+            for name in selected:
+                resume = store.get(name, columns)
+                if resume is None:
+                    print(Fore.RED + f"Resume not found: {name}")
+                else:
+                    yield resume
+        return
+    for resume in iter_corpus(path, columns):
+        if not selected or resume["file_name"] in selected:
+            yield resume
+
+printed = 0
 
 # ----------------------------
 # 2. Print each resume nicely
 # ----------------------------
-for resume in parsed_resumes:
+for resume in iter_parsed_resumes(parsed_file):
+    printed += 1
     print(Fore.CYAN + "="*60)
     print(Fore.YELLOW + f"Resume: {resume['file_name']}")
     print(Fore.CYAN + "-"*60)
     
-    # Sections to display
-    sections = ["skills", "experience", "education", "projects", "certifications"]
-    
     for section in sections:
         content = resume.get(section, [])
         if not content:
@@ -34,4 +57,4 @@ for resume in parsed_resumes:
         print(Fore.CYAN + "-"*60)
     
 print(Fore.CYAN + "="*60)
-print(Fore.MAGENTA + f"Printed {len(parsed_resumes)} resumes successfully! Ready for hackathon demo!")
+print(Fore.MAGENTA + f"Printed {printed} resumes successfully! Ready for hackathon demo!")
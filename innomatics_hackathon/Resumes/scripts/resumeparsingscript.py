@@ -1,125 +1,50 @@
 import os
-import fitz  # PyMuPDF
-import docx2txt
-import re
-import json
-import spacy
-
-# ----------------------------
-# 1. Paths
-# ----------------------------
-resume_folder = r"C:\JAGA\innomatics_hackathon\Resumes\dataresume"
-output_file = r"C:\JAGA\innomatics_hackathon\Resumes\outcomes_resumes\parsed_resumes_smart.json"
-
-# ----------------------------
-# 2. Load spaCy model
-# ----------------------------
-nlp = spacy.load("en_core_web_sm")
-
-# ----------------------------
-# 3. Predefined skill list
-# ----------------------------
-SKILLS = [
-    "python", "sql", "excel", "tableau", "power bi", "aws", "docker",
-    "pandas", "numpy", "matplotlib", "seaborn", "spark", "pytorch",
-    "tensorflow", "java", "c++", "machine learning", "data analysis",
-    "powerpoint", "git", "kafka"
-]
-
-# ----------------------------
-# 4. Helper functions
-# ----------------------------
-def extract_text_from_pdf(file_path):
-    doc = fitz.open(file_path)
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
-
-def extract_text_from_docx(file_path):
-    return docx2txt.process(file_path)
-
-def clean_text(text):
-    text = re.sub(r"\n+", "\n", text)
-    text = re.sub(r"\s+", " ", text)
-    text = text.strip()
-    return text.lower()
-
-def extract_skills(text):
-    found_skills = [skill.title() for skill in SKILLS if skill.lower() in text]
-    return list(set(found_skills))
-
-def extract_education(text):
-    edu_patterns = [
-        r"\b(b\.sc|bsc|b\.tech|be|m\.sc|msc|m\.tech|mba|phd)\b.*?(\d{4})",
-        r"\b(university|college|institute)\b.*?(\d{4})"
-    ]
-    edu_matches = []
-    for pattern in edu_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for m in matches:
-            edu_matches.append(" ".join(m).title())
-    return list(set(edu_matches))
-
-def extract_certifications(text):
-    cert_keywords = ["certificate", "certified", "certification", "achieved"]
-    certs = []
-    lines = text.split("\n")
-    for line in lines:
-        if any(word in line.lower() for word in cert_keywords):
-            certs.append(line.strip())
-    return list(set(certs))
-
-def extract_experience(text):
-    exp_keywords = ["worked at", "experience", "internship", "role as", "responsible for"]
-    lines = text.split("\n")
-    exps = []
-    for line in lines:
-        if any(word in line.lower() for word in exp_keywords):
-            exps.append(line.strip())
-    return list(set(exps))
-
-def extract_projects(text):
-    proj_keywords = ["project", "capstone", "initiative"]
-    lines = text.split("\n")
-    projs = []
-    for line in lines:
-        if any(word in line.lower() for word in proj_keywords):
-            projs.append(line.strip())
-    return list(set(projs))
-
-# ----------------------------
-# 5. Main Parsing
-# ----------------------------
-parsed_resumes = []
-
-for file_name in os.listdir(resume_folder):
-    file_path = os.path.join(resume_folder, file_name)
-    if file_name.lower().endswith(".pdf"):
-        text = extract_text_from_pdf(file_path)
-    elif file_name.lower().endswith(".docx"):
-        text = extract_text_from_docx(file_path)
-    else:
-        continue
-
-    cleaned_text = clean_text(text)
-
-    resume_data = {
-        "file_name": file_name,
-        "full_text": cleaned_text,
-        "skills": extract_skills(cleaned_text),
-        "education": extract_education(cleaned_text),
-        "experience": extract_experience(cleaned_text),
-        "projects": extract_projects(cleaned_text),
-        "certifications": extract_certifications(cleaned_text)
-    }
-
-    parsed_resumes.append(resume_data)
-
-# ----------------------------
-# 6. Save JSON
-# ----------------------------
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(parsed_resumes, f, indent=4, ensure_ascii=False)
-
-print(f"Smart parsing complete. {len(parsed_resumes)} resumes saved to {output_file}")
+import sys
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+import metrics
+from jsonl_pipeline import load_done, append_records
+from column_store import write_column_store, iter_corpus
+from resume_parser import iter_parsed_resumes
+
+# Command-line entry point; the parsing itself lives in resume_parser.py
+
+# ----------------------------
+# 1. Default paths (override with --input / --output)
+# ----------------------------
+RESUMES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+resume_folder = os.path.join(RESUMES_DIR, "dataresume")
+output_file = os.path.join(RESUMES_DIR, "outcomes_resumes", "parsed_resumes_smart.jsonl")
+
+# ----------------------------
+# 2. Save JSON Lines (one record per resume, appended as it completes;
+#    a restarted run skips resumes already in the output)
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parse resumes into a JSON Lines file.")
+    parser.add_argument("--input", default=resume_folder, help="folder of PDF/DOCX resumes")
+    parser.add_argument("--output", default=output_file, help="JSON Lines output file")
+    parser.add_argument("--workers", type=int, default=None, help="PDF extraction processes")
+    parser.add_argument("--store", default=None, help="also pack the output into this column store directory")
+    parser.add_argument("--metrics", action="store_true", help="print stage timings and counters at the end")
+    args = parser.parse_args(argv)
+    metrics.enable(args.metrics)
+
+    done, bad_lines = load_done(args.output)
+    if bad_lines:
+        print(f"Skipped {bad_lines} unreadable lines in {args.output}")
+    if done:
+        print(f"Resuming: {len(done)} resumes already in {args.output}")
+    count = append_records(args.output, iter_parsed_resumes(args.input, done, args.workers))
+
+    print(f"Smart parsing complete. {count} resumes saved to {args.output}")
+    if args.store:
+        with metrics.timer("column_store_pack"):
+            packed = write_column_store(args.store, iter_corpus(args.output))
+        print(f"Packed {packed} resumes into {args.store}")
+    if args.metrics:
+        print(metrics.format_summary())
+
+if __name__ == "__main__":
+    main()
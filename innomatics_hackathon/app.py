@@ -1,27 +1,49 @@
-from fastapi import FastAPI, UploadFile, File
+from fastapi import FastAPI, UploadFile, File, Header
 from fastapi.responses import JSONResponse
-import shutil, os, json
-from ResumeJDMatching import evaluate_multiple_resumes
+from pydantic import BaseModel
+from typing import List, Optional
+import os, json, asyncio, uuid
+from ResumeJDMatching import evaluate_multiple_resumes, load_jd_json
+from job_queue import JobQueue
+from upload_store import save_upload_stream, iter_uploads
+from text_extraction import supported_extensions
+import metrics
+from data_paths import data_path, project_path
 
 app = FastAPI(title="Offline Resume-JD Matching API")
 
-UPLOAD_FOLDER = "uploads"
+UPLOAD_FOLDER = data_path("uploads")
 RESUME_FOLDER = os.path.join(UPLOAD_FOLDER, "resumes")
 JD_FOLDER = os.path.join(UPLOAD_FOLDER, "jds")
+JOBS_FOLDER = os.path.join(UPLOAD_FOLDER, "jobs")
 
 os.makedirs(RESUME_FOLDER, exist_ok=True)
 os.makedirs(JD_FOLDER, exist_ok=True)
+os.makedirs(JOBS_FOLDER, exist_ok=True)
+
+# -----------------------------
+# Background evaluation jobs: a bounded pool shared fairly between submitters.
+# Each job gets an equal share of the CPU for PDF extraction.
+jobs = JobQueue()
+EXTRACT_WORKERS_PER_JOB = max(1, (os.cpu_count() or 1) // jobs.max_workers)
+
+@app.on_event("shutdown")
+def shutdown_jobs():
+    jobs.shutdown()
+
+# -----------------------------
+# Uploads are stored content-addressed (<folder>/<sha256>/<file name>), written
+# off the event loop: same-name uploads with different content no longer
+# overwrite each other, and re-uploading a file stores nothing new.
 
 # -----------------------------
 # Upload Resume
 @app.post("/upload_resume")
 async def upload_resume(file: UploadFile = File(...)):
-    if not file.filename.lower().endswith(".pdf"):
-        return JSONResponse(status_code=400, content={"message": "Resume must be PDF"})
-    save_path = os.path.join(RESUME_FOLDER, file.filename)
-    with open(save_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    return {"message": f"Resume saved: {save_path}"}
+    if not file.filename.lower().endswith(supported_extensions()):
+        return JSONResponse(status_code=400, content={"message": f"Resume must be one of {', '.join(supported_extensions())}"})
+    save_path = await asyncio.to_thread(save_upload_stream, file.file, file.filename, RESUME_FOLDER)
+    return {"message": f"Resume saved: {save_path}", "resume_id": os.path.basename(os.path.dirname(save_path))}
 
 # -----------------------------
 # Upload JD
@@ -29,22 +51,42 @@ async def upload_resume(file: UploadFile = File(...)):
 async def upload_jd(file: UploadFile = File(...)):
     if not file.filename.lower().endswith(".json"):
         return JSONResponse(status_code=400, content={"message": "JD must be JSON"})
-    save_path = os.path.join(JD_FOLDER, file.filename)
-    with open(save_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-    return {"message": f"JD saved: {save_path}"}
+    save_path = await asyncio.to_thread(save_upload_stream, file.file, file.filename, JD_FOLDER)
+    return {"message": f"JD saved: {save_path}", "jd_id": os.path.basename(os.path.dirname(save_path))}
 
 # -----------------------------
-# Evaluate all resumes against all JDs
+# Helper: uploaded resumes / JDs to evaluate (all of them unless names or
+# ids are given)
+def collect_inputs(resume_names=None, jd_names=None):
+    resume_files = [path for digest, name, path in iter_uploads(RESUME_FOLDER, supported_extensions())
+                    if resume_names is None or name in resume_names or digest in resume_names]
+    jd_files = [path for digest, name, path in iter_uploads(JD_FOLDER, (".json",))
+                if jd_names is None or name in jd_names or digest in jd_names]
+    return resume_files, jd_files
+
+# -----------------------------
+# Scoring modes: exact-keyword TF-IDF or semantic (embedding) matching
+SCORING_MODES = ("keyword", "semantic")
+
+def run_scoring(resume_files, jd_files, mode="keyword", workers=None):
+    if mode == "semantic":
+        from semantic_matching import evaluate_multiple_resumes_semantic
+        return evaluate_multiple_resumes_semantic(resume_files, jd_files, workers=workers)
+    return evaluate_multiple_resumes(resume_files, jd_files, workers=workers)
+
+# -----------------------------
+# Evaluate all resumes against all JDs (synchronous; prefer POST /jobs for large batches)
 @app.get("/evaluate_all")
-def evaluate_all():
-    resume_files = [os.path.join(RESUME_FOLDER, f) for f in os.listdir(RESUME_FOLDER) if f.lower().endswith(".pdf")]
-    jd_files = [os.path.join(JD_FOLDER, f) for f in os.listdir(JD_FOLDER) if f.lower().endswith(".json")]
+def evaluate_all(mode: str = "keyword"):
+    if mode not in SCORING_MODES:
+        return JSONResponse(status_code=400, content={"message": f"mode must be one of {SCORING_MODES}"})
+    resume_files, jd_files = collect_inputs()
 
     if not resume_files or not jd_files:
         return JSONResponse(status_code=400, content={"message": "Upload both resumes and JDs first."})
 
-    results = evaluate_multiple_resumes(resume_files, jd_files)
+    with metrics.timer("evaluate_all"):
+        results = run_scoring(resume_files, jd_files, mode)
 
     # Save result offline
     result_file = os.path.join(UPLOAD_FOLDER, "evaluation_results.json")
@@ -52,3 +94,129 @@ def evaluate_all():
         json.dump(results, f, indent=4)
 
     return {"results": results}
+
+# -----------------------------
+# Pipeline metrics (stage timers and counters of this server process)
+@app.get("/metrics")
+def get_metrics():
+    return metrics.snapshot()
+
+@app.delete("/metrics")
+def reset_metrics():
+    metrics.reset()
+    return {"message": "Metrics reset"}
+
+# -----------------------------
+# Background jobs: submit, poll status, fetch result
+class EvaluationRequest(BaseModel):
+    resumes: Optional[List[str]] = None
+    jds: Optional[List[str]] = None
+    mode: str = "keyword"
+
+def run_evaluation_job(resume_files, jd_files, result_file, mode="keyword"):
+    results = run_scoring(resume_files, jd_files, mode, workers=EXTRACT_WORKERS_PER_JOB)
+    with open(result_file, "w", encoding="utf-8") as f:
+        json.dump(results, f)
+    return results
+
+@app.post("/jobs", status_code=202)
+def submit_job(request: Optional[EvaluationRequest] = None, x_recruiter: Optional[str] = Header(None)):
+    request = request or EvaluationRequest()
+    if request.mode not in SCORING_MODES:
+        return JSONResponse(status_code=400, content={"message": f"mode must be one of {SCORING_MODES}"})
+    resume_files, jd_files = collect_inputs(request.resumes, request.jds)
+    if not resume_files or not jd_files:
+        return JSONResponse(status_code=400, content={"message": "Upload both resumes and JDs first."})
+
+    job_id = uuid.uuid4().hex
+    result_file = os.path.join(JOBS_FOLDER, f"{job_id}.json")
+    jobs.submit(run_evaluation_job, resume_files, jd_files, result_file, request.mode,
+                submitter=x_recruiter or "anonymous", job_id=job_id)
+    return {"job_id": job_id, "status_url": f"/jobs/{job_id}", "result_url": f"/jobs/{job_id}/result"}
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    status = jobs.status(job_id)
+    if status is None:
+        return JSONResponse(status_code=404, content={"message": f"Unknown job: {job_id}"})
+    return status
+
+@app.get("/jobs/{job_id}/result")
+def job_result(job_id: str):
+    status, results = jobs.snapshot(job_id)
+    if status is None:
+        # Finished jobs dropped from memory can still be served from disk
+        result_file = os.path.join(JOBS_FOLDER, f"{job_id}.json")
+        if os.path.exists(result_file):
+            with open(result_file, "r", encoding="utf-8") as f:
+                return {"job_id": job_id, "results": json.load(f)}
+        return JSONResponse(status_code=404, content={"message": f"Unknown job: {job_id}"})
+    if status["status"] in ("queued", "running"):
+        return JSONResponse(status_code=202, content=status)
+    if status["status"] == "failed":
+        return JSONResponse(status_code=500, content=status)
+    return {"job_id": job_id, "results": results}
+
+# -----------------------------
+# Candidate search over the parsed-resume pool (resumeparsingscript.py output)
+PARSED_RESUMES = project_path("Resumes", "outcomes_resumes", "parsed_resumes_smart.jsonl")
+_candidate_index = None
+
+def get_candidate_index():
+    global _candidate_index
+    if _candidate_index is None:
+        from candidate_search import CandidateIndex
+        _candidate_index = CandidateIndex()
+    return _candidate_index
+
+@app.post("/candidates/index")
+def index_candidates():
+    if not os.path.exists(PARSED_RESUMES):
+        return JSONResponse(status_code=400, content={"message": f"Run resumeparsingscript.py first: {PARSED_RESUMES}"})
+    index = get_candidate_index()
+    added = index.add_parsed_resumes(PARSED_RESUMES)
+    return {"added": added, "total": len(index)}
+
+@app.get("/candidates/search")
+def search_candidates(jd: str, k: int = 10, nprobe: int = 8):
+    from candidate_search import jd_query
+    _, jd_files = collect_inputs([], [jd])
+    if not jd_files:
+        return JSONResponse(status_code=404, content={"message": f"Unknown JD: {jd}"})
+    if k < 1 or nprobe < 1:
+        return JSONResponse(status_code=400, content={"message": "k and nprobe must be at least 1"})
+    index = get_candidate_index()
+    return {"results": [
+        {"jd_name": compiled.jd_name,
+         "candidates": [{"candidate_name": name, "similarity": round(sim, 4)}
+                        for name, sim in index.search(jd_query(compiled), k, nprobe)]}
+        for jd_file in jd_files for compiled in load_jd_json(jd_file)]}
+
+# -----------------------------
+# Boolean skill filter over the same parsed-resume pool
+# (e.g. q=python AND spark AND NOT java)
+_skill_index = None
+
+def get_skill_index():
+    global _skill_index
+    if _skill_index is None:
+        from skill_index import SkillIndex
+        _skill_index = SkillIndex()
+    return _skill_index
+
+@app.post("/skills/index")
+def index_skills():
+    if not os.path.exists(PARSED_RESUMES):
+        return JSONResponse(status_code=400, content={"message": f"Run resumeparsingscript.py first: {PARSED_RESUMES}"})
+    index = get_skill_index()
+    added = index.add_parsed_resumes(PARSED_RESUMES)
+    return {"added": added, "total": len(index)}
+
+@app.get("/skills/search")
+def search_skills(q: str, limit: int = 50, offset: int = 0):
+    from skill_index import QueryError
+    try:
+        total, candidates = get_skill_index().search(q, limit, offset)
+    except QueryError as e:
+        return JSONResponse(status_code=400, content={"message": f"Invalid query: {e}"})
+    return {"query": q, "total": total, "candidates": candidates}
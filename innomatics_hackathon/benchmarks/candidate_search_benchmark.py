@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from candidate_search import CandidateIndex
+from semantic_matching import HashingEncoder
+
+# Recall / latency trade-off of the IVF candidate search against exact
+# brute-force scoring, on a synthetic resume pool:
+#
+#   python benchmarks/candidate_search_benchmark.py --resumes 20000 --queries 50
+
+ROLES = {
+    "data analyst": ["sql", "excel", "tableau", "power bi", "pandas", "statistics", "dashboards"],
+    "ml engineer": ["python", "pytorch", "tensorflow", "machine learning", "mlops", "docker", "numpy"],
+    "data engineer": ["spark", "kafka", "airflow", "sql", "aws", "databricks", "python"],
+    "backend developer": ["java", "spring", "microservices", "rest", "postgresql", "docker", "kubernetes"],
+    "frontend developer": ["javascript", "react", "typescript", "css", "html", "redux", "webpack"],
+    "devops engineer": ["kubernetes", "terraform", "aws", "ci/cd", "linux", "ansible", "monitoring"],
+    "mechanical engineer": ["autocad", "solidworks", "manufacturing", "cad", "six sigma", "lean", "ansys"],
+    "business analyst": ["requirements", "stakeholders", "jira", "excel", "process mapping", "sql", "uml"],
+}
+FILLER = ("worked on projects with teams delivering results responsible for analysis and reporting "
+          "communication leadership internship experience university degree certified").split()
+
+def synthetic_resume(rng, i):
+    role = rng.choice(list(ROLES))
+    skills = rng.sample(ROLES[role], 5) + rng.sample([s for r in ROLES.values() for s in r], 2)
+    text = f"{role} " + " ".join(rng.choice(FILLER + skills) for _ in range(120))
+    return {"file_name": f"resume_{i:07d}.pdf", "skills": skills, "full_text": text}
+
+def synthetic_jd(rng):
+    role = rng.choice(list(ROLES))
+    return f"{role}: " + ", ".join(rng.sample(ROLES[role], 5))
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q / 100 * len(samples)))]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="IVF candidate search vs exact brute force.")
+    parser.add_argument("--resumes", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as index_dir:
+        index = CandidateIndex(index_dir, encoder=HashingEncoder(), n_lists=args.lists)
+        start = time.perf_counter()
+        index.add_records(synthetic_resume(rng, i) for i in range(args.resumes))
+        if index.centroids is None:
+            index.train()
+        print(f"built index over {len(index)} resumes in {time.perf_counter() - start:.1f}s "
+              f"({len(index.centroids)} lists)")
+
+        queries = [index.query_vector(synthetic_jd(rng)) for _ in range(args.queries)]
+        exact, exact_ms = [], []
+        for q in queries:
+            t = time.perf_counter()
+            exact.append({name for name, _ in index.search_exact(q, args.k)})
+            exact_ms.append((time.perf_counter() - t) * 1000)
+        print(f"{'method':<16} {'recall@' + str(args.k):>10} {'p50 ms':>8} {'p99 ms':>8}")
+        print(f"{'exact':<16} {1.0:>10.3f} {statistics.median(exact_ms):>8.2f} {percentile(exact_ms, 99):>8.2f}")
+
+        for nprobe in (1, 2, 4, 8, 16, 32):
+            recalls, latencies = [], []
+            for q, truth in zip(queries, exact):
+                t = time.perf_counter()
+                found = {name for name, _ in index.search(q, args.k, nprobe=nprobe)}
+                latencies.append((time.perf_counter() - t) * 1000)
+                recalls.append(len(found & truth) / len(truth))
+            print(f"{'ivf nprobe=' + str(nprobe):<16} {statistics.mean(recalls):>10.3f} "
+                  f"{statistics.median(latencies):>8.2f} {percentile(latencies, 99):>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import os
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import resource
+import tempfile
+import statistics
+import subprocess
+from contextlib import redirect_stdout
+
+# Throughput, p50/p99 latency and peak RSS of the extraction, parsing and
+# scoring hot paths on a synthetic corpus (PDFs + texts + JD PDFs). Every
+# stage runs in its own fresh interpreter, so peak RSS is per stage.
+#
+#   python benchmarks/pipeline_benchmark.py --resumes 10 1000 --jds 1 10
+#   python benchmarks/pipeline_benchmark.py --resumes 1000 --save-baseline
+#   python benchmarks/pipeline_benchmark.py --resumes 1000      # compares with the baseline
+#
+# Exits with status 1 when a stage regressed by more than --tolerance.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(HERE)
+BASELINE_FILE = os.path.join(HERE, "pipeline_baseline.json")
+sys.path.insert(0, PROJECT_DIR)
+
+STAGES = ["extract_text_from_pdf", "clean_text", "extract_skills", "extract_education",
+          "load_jd", "evaluate_single_resume"]
+
+# -----------------------------
+# Synthetic corpus
+SKILL_POOL = ["python", "sql", "excel", "tableau", "power bi", "aws", "docker", "pandas", "numpy",
+              "matplotlib", "spark", "pytorch", "tensorflow", "java", "c++", "machine learning",
+              "data analysis", "git", "kafka", "react", "kubernetes", "airflow", "statistics"]
+DEGREES = ["B.Tech", "B.Sc", "M.Sc", "MBA", "M.Tech", "PhD"]
+FILLER = ("worked on cross functional teams delivering dashboards reports and pipelines "
+          "responsible for stakeholder communication analysis testing and deployment").split()
+
+def synthetic_resume(rng):
+    lines = [f"Candidate {rng.randint(1, 10**6)}", "Skills: " + ", ".join(rng.sample(SKILL_POOL, 8)),
+             f"{rng.choice(DEGREES)} in Computer Science, University of Example {rng.randint(2005, 2024)}"]
+    for _ in range(rng.randint(3, 6)):
+        lines.append("Experience: worked at Company as analyst, " + " ".join(rng.choice(FILLER) for _ in range(25)))
+        lines.append("Project: " + " ".join(rng.choice(FILLER + SKILL_POOL) for _ in range(20)))
+    lines.append("Certified " + rng.choice(SKILL_POOL) + " practitioner")
+    return "\n".join(lines)
+
+def synthetic_jd(rng):
+    return "\n".join(rng.sample(SKILL_POOL, 10))
+
+def write_pdf(path, text):
+    import fitz
+    doc = fitz.open()
+    lines = text.splitlines()
+    for start in range(0, len(lines), 40):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(36, 36, 560, 806), "\n".join(lines[start:start + 40]), fontsize=9)
+    doc.save(path)
+    doc.close()
+
+def build_corpus(corpus_dir, n_resumes, n_jds, seed=0):
+    rng = random.Random(seed)
+    os.makedirs(os.path.join(corpus_dir, "resumes"), exist_ok=True)
+    os.makedirs(os.path.join(corpus_dir, "jds"), exist_ok=True)
+    texts = []
+    for i in range(n_resumes):
+        text = synthetic_resume(rng)
+        texts.append(text)
+        write_pdf(os.path.join(corpus_dir, "resumes", f"resume_{i:06d}.pdf"), text)
+    for i in range(n_jds):
+        write_pdf(os.path.join(corpus_dir, "jds", f"jd_{i:04d}.pdf"), synthetic_jd(rng))
+    with open(os.path.join(corpus_dir, "texts.json"), "w", encoding="utf-8") as f:
+        json.dump(texts, f)
+
+# -----------------------------
+# One stage, run inside the fresh interpreter: returns per-item latencies (s)
+def run_stage(stage, corpus_dir):
+    from ResumeJDMatching import extract_text_from_pdf, load_jd, evaluate_single_resume, compile_jd
+    from resume_parser import clean_text, extract_skills, extract_education
+    import fitz  # import cost belongs to startup_benchmark.py, not to the first item
+
+    resume_dir, jd_dir = os.path.join(corpus_dir, "resumes"), os.path.join(corpus_dir, "jds")
+    pdfs = [os.path.join(resume_dir, f) for f in sorted(os.listdir(resume_dir))]
+    jd_pdfs = [os.path.join(jd_dir, f) for f in sorted(os.listdir(jd_dir))]
+    with open(os.path.join(corpus_dir, "texts.json"), "r", encoding="utf-8") as f:
+        texts = json.load(f)
+    cleaned = [clean_text(text) for text in texts] if stage in ("extract_skills", "extract_education") else texts
+
+    if stage == "extract_text_from_pdf":
+        calls = [(extract_text_from_pdf, (path,)) for path in pdfs]
+    elif stage == "clean_text":
+        calls = [(clean_text, (text,)) for text in texts]
+    elif stage == "extract_skills":
+        extract_skills("warm up python")  # builds the skill matcher once
+        calls = [(extract_skills, (text,)) for text in cleaned]
+    elif stage == "extract_education":
+        calls = [(extract_education, (text,)) for text in cleaned]
+    elif stage == "load_jd":
+        calls = [(load_jd, (path,)) for path in jd_pdfs]
+    else:
+        # Every resume against every (pre-compiled) JD, extraction and score
+        # caches off so every call is a full parse and score
+        jds = [compile_jd(path) for path in jd_pdfs]
+        calls = [(evaluate_single_resume, (path, jd, False, False)) for jd in jds for path in pdfs]
+
+    latencies = []
+    with redirect_stdout(io.StringIO()) as sink:
+        for fn, args in calls:
+            start = time.perf_counter()
+            fn(*args)
+            latencies.append(time.perf_counter() - start)
+            sink.seek(0)
+            sink.truncate()
+    return latencies
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(q / 100 * len(samples)))]
+
+def measure(stage, corpus_dir):
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--run-stage", stage, "--corpus", corpus_dir],
+                          cwd=PROJECT_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "stage failed")
+    # Last line only: PyMuPDF may print a deprecation notice to stdout
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+# -----------------------------
+# Baseline comparison: a stage regresses when its throughput drops or its p50
+# grows by more than `tolerance` (fraction) against the stored run
+def compare(result, baseline, tolerance):
+    if baseline is None:
+        return ""
+    if result["throughput"] < baseline["throughput"] / (1 + tolerance) or \
+            result["p50_ms"] > baseline["p50_ms"] * (1 + tolerance):
+        return f"REGRESSION ({result['throughput'] / baseline['throughput']:.2f}x throughput)"
+    return f"ok ({result['throughput'] / baseline['throughput']:.2f}x throughput)"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark extraction, parsing and scoring stages.")
+    parser.add_argument("--resumes", type=int, nargs="+", default=[10], help="corpus sizes, e.g. 10 1000 10000")
+    parser.add_argument("--jds", type=int, nargs="+", default=[1], help="JD counts, e.g. 1 100")
+    parser.add_argument("--stages", nargs="+", default=STAGES, choices=STAGES)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--run-stage", choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_stage:
+        latencies = run_stage(args.run_stage, args.corpus)
+        total = sum(latencies)
+        print(json.dumps({
+            "items": len(latencies),
+            "throughput": len(latencies) / total if total else 0.0,
+            "p50_ms": statistics.median(latencies) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        }))
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results, regressions = {}, 0
+    print(f"{'stage':<24} {'corpus':>12} {'items':>7} {'items/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'rss MB':>8}  vs baseline")
+    for n_resumes in args.resumes:
+        for n_jds in args.jds:
+            with tempfile.TemporaryDirectory() as corpus_dir:
+                build_corpus(corpus_dir, n_resumes, n_jds)
+                for stage in args.stages:
+                    key = f"{stage}@{n_resumes}x{n_jds}"
+                    try:
+                        result = measure(stage, corpus_dir)
+                    except RuntimeError as e:
+                        print(f"{stage:<24} {f'{n_resumes}x{n_jds}':>12}  failed: {e}")
+                        continue
+                    results[key] = result
+                    verdict = compare(result, baseline.get(key), args.tolerance)
+                    regressions += verdict.startswith("REGRESSION")
+                    print(f"{stage:<24} {f'{n_resumes}x{n_jds}':>12} {result['items']:>7} {result['throughput']:>10.1f} "
+                          f"{result['p50_ms']:>9.3f} {result['p99_ms']:>9.3f} {result['peak_rss_mb']:>8.1f}  {verdict}")
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+        print(f"Baseline saved: {args.baseline}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
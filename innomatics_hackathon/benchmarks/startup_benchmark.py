@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+# Measures worker cold start: every sample is a fresh Python interpreter, so
+# nothing is shared through sys.modules between runs.
+#
+#   python benchmarks/startup_benchmark.py --runs 10
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(HERE)
+
+SAMPLE_RESUME = "python developer with sql, pandas and machine learning experience"
+
+# -----------------------------
+# Scenarios: name -> code run in the fresh interpreter
+SCENARIOS = {
+    "python (empty)": "pass",
+    "import text_extraction": "import text_extraction",
+    "import resume_parser": "import resume_parser",
+    "import jd_parser": "import jd_parser",
+    "import ResumeJDMatching": "import ResumeJDMatching",
+    "first score (import + compile JD + score)": (
+        "import ResumeJDMatching as m\n"
+        "jd = m.CompiledJD('bench', ['python', 'sql', 'pandas', 'spark'])\n"
+        f"jd.score({SAMPLE_RESUME!r})"
+    ),
+    "eager heavy imports (numpy, scipy, sklearn, fitz)": (
+        "import numpy, scipy.sparse, sklearn.feature_extraction.text, fitz"
+    ),
+}
+
+def time_fresh_interpreter(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start time of the parsing and matching modules.")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per scenario")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<52} {'min ms':>8} {'median ms':>10}")
+    for name, code in SCENARIOS.items():
+        try:
+            samples = [time_fresh_interpreter(code) for _ in range(args.runs)]
+        except subprocess.CalledProcessError:
+            print(f"{name:<52} {'failed (missing dependency?)':>19}")
+            continue
+        print(f"{name:<52} {min(samples):>8.1f} {statistics.median(samples):>10.1f}")
+
+if __name__ == "__main__":
+    main()
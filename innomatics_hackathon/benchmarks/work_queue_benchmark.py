@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from work_queue import WorkQueue, run_workers
+from ResumeJDMatching import CompiledJD
+
+# Scaling of the SQLite work queue: the same synthetic corpus (unique .txt
+# resumes, so no cache hits) scored with 1, 2, 4 ... worker processes, each
+# run with a fresh queue and fresh caches. Also reports the queue overhead
+# alone (claim + complete of empty chunks), which bounds how many chunks per
+# second the queue can hand out however many workers there are.
+#
+#   python benchmarks/work_queue_benchmark.py --resumes 4000 --processes 1 2 4 8
+
+SKILLS = ["python", "sql", "excel", "tableau", "power bi", "spark", "aws", "docker", "java", "react",
+          "machine learning", "pandas", "kubernetes", "node.js", "ci/cd", "statistics"]
+FILLER = ("worked on projects with teams delivering results responsible for analysis and reporting "
+          "communication leadership internship experience university degree certified").split()
+
+def write_corpus(folder, count, rng):
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"resume_{i:06d}.txt")
+        words = [rng.choice(FILLER + SKILLS) for _ in range(300)]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Candidate {i}\n" + " ".join(words))
+        paths.append(path)
+    return paths
+
+# One measurement in a fresh interpreter with its own data directory (and
+# so its own caches), so nothing is shared with the other runs
+def time_run(corpus, processes, chunk_size, work_dir):
+    os.makedirs(work_dir)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--run-one", str(processes),
+                           "--corpus", corpus, "--chunk-size", str(chunk_size)],
+                          env={**os.environ, "RESUME_DATA_DIR": work_dir}, capture_output=True, text=True, check=True)
+    elapsed, done = proc.stdout.split()[-2:]
+    return float(elapsed), int(done)
+
+def run_one(corpus, processes, chunk_size):
+    paths = [os.path.join(corpus, name) for name in sorted(os.listdir(corpus))]
+    queue = WorkQueue()
+    run_id = queue.submit(paths, bench_jd(), chunk_size)
+    start = time.perf_counter()
+    run_workers(queue.db_path, processes, run_id)
+    elapsed = time.perf_counter() - start
+    print(elapsed, queue.status(run_id)[run_id]["chunks"]["done"])
+
+def bench_jd():
+    return CompiledJD("bench", SKILLS[8:], must_have=["python"])
+
+def time_queue_overhead(db_path, chunks):
+    queue = WorkQueue(db_path)
+    run_id = queue.submit([f"/none/{i}.txt" for i in range(chunks)], CompiledJD("bench", ["python"]), 1)
+    start = time.perf_counter()
+    while True:
+        claimed = queue.claim("bench", run_id)
+        if claimed is None:
+            break
+        queue.complete(claimed[0], claimed[1], "bench", [])
+    return time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Work queue throughput by number of worker processes.")
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--overhead-chunks", type=int, default=500)
+    parser.add_argument("--run-one", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--corpus", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.run_one:
+        run_one(args.corpus, args.run_one, args.chunk_size)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, "corpus")
+        os.makedirs(corpus)
+        paths = write_corpus(corpus, args.resumes, random.Random(0))
+
+        overhead = time_queue_overhead(os.path.join(tmp, "overhead.db"), args.overhead_chunks)
+        print(f"queue overhead: {overhead / args.overhead_chunks * 1000:.2f} ms per chunk "
+              f"({args.overhead_chunks / overhead:.0f} chunks/s from one worker)")
+        print(f"cpu cores: {os.cpu_count()}\n")
+
+        print(f"{'processes':>9} {'seconds':>9} {'resumes/s':>10} {'speedup':>8} {'chunks':>7}")
+        base = None
+        for processes in args.processes:
+            elapsed, done = time_run(corpus, processes, args.chunk_size, os.path.join(tmp, f"run_{processes}"))
+            base = base or elapsed
+            print(f"{processes:>9} {elapsed:>9.2f} {len(paths) / elapsed:>10.1f} {base / elapsed:>7.2f}x {done:>7}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
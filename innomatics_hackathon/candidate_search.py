@@ -0,0 +1,185 @@
+import os
+import re
+import json
+from jsonl_pipeline import iter_records
+from semantic_matching import get_encoder, DEFAULT_MODEL
+from data_paths import data_path
+
+# -----------------------------
+# Approximate nearest-neighbour candidate search over the parsed-resume pool
+# One l2-normalised vector per resume (skills + resume text), stored in an
+# append-only float32 file read through np.memmap. An IVF index (spherical
+# k-means centroids + one inverted list per centroid) narrows a query to the
+# `nprobe` closest lists, which are then scored exactly. New resumes are
+# assigned to the existing centroids as they are added; call train() again
+# once the pool has grown a lot to rebalance the lists.
+SEARCH_DIR = data_path("cache", "candidate_search")
+N_LISTS = 256
+N_PROBE = 8
+TRAIN_SAMPLE = 50000
+KMEANS_ITERATIONS = 10
+MAX_DOC_CHARS = 4000
+
+def resume_document(record):
+    return (", ".join(record.get("skills", [])) + ". " + record.get("full_text", ""))[:MAX_DOC_CHARS]
+
+class CandidateIndex:
+    def __init__(self, index_dir=SEARCH_DIR, encoder=None, n_lists=N_LISTS):
+        self.encoder = encoder or get_encoder(DEFAULT_MODEL)
+        self.dir = os.path.join(index_dir, re.sub(r"[^\w.-]+", "_", self.encoder.name))
+        os.makedirs(self.dir, exist_ok=True)
+        self.vectors_path = os.path.join(self.dir, "vectors.f32")
+        self.lists_path = os.path.join(self.dir, "assignments.i32")
+        self.ids_path = os.path.join(self.dir, "ids.jsonl")
+        self.centroids_path = os.path.join(self.dir, "centroids.npy")
+        self.n_lists = n_lists
+        self.dim = self.encoder.dim
+
+        self.ids = []
+        if os.path.exists(self.ids_path):
+            self.ids = [record["file_name"] for record in iter_records(self.ids_path)]
+        self._known = set(self.ids)
+        self._truncate_to(len(self.ids))
+        self.centroids = None
+        if os.path.exists(self.centroids_path):
+            import numpy as np
+            self.centroids = np.load(self.centroids_path)
+        self._lists = None
+
+    # Vectors/assignments past the last recorded id come from an interrupted add
+    def _truncate_to(self, count):
+        for path, row_bytes in ((self.vectors_path, self.dim * 4), (self.lists_path, 4)):
+            if os.path.exists(path) and os.path.getsize(path) > count * row_bytes:
+                with open(path, "r+b") as f:
+                    f.truncate(count * row_bytes)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def vectors(self):
+        import numpy as np
+        if not self.ids:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(len(self.ids), self.dim))
+
+    def _assignments(self):
+        import numpy as np
+        if not self.ids or not os.path.exists(self.lists_path):
+            return np.zeros(0, dtype=np.int32)
+        return np.fromfile(self.lists_path, dtype=np.int32)
+
+    # -----------------------------
+    # Incremental build: add parsed-resume records not indexed yet
+    def add_records(self, records, batch_size=256):
+        added = 0
+        batch = []
+        for record in records:
+            if record["file_name"] in self._known:
+                continue
+            self._known.add(record["file_name"])
+            batch.append(record)
+            if len(batch) >= batch_size:
+                added += self._add_batch(batch)
+                batch = []
+        if batch:
+            added += self._add_batch(batch)
+        if added and self.centroids is None and len(self.ids) >= self.n_lists * 4:
+            self.train()
+        return added
+
+    def add_parsed_resumes(self, jsonl_path):
+        return self.add_records(iter_records(jsonl_path))
+
+    def _add_batch(self, records):
+        import numpy as np
+        vectors = self.encoder.encode([resume_document(record) for record in records]).astype(np.float32)
+        with open(self.vectors_path, "ab") as f:
+            f.write(vectors.tobytes())
+        if self.centroids is not None:
+            with open(self.lists_path, "ab") as f:
+                f.write(np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32).tobytes())
+        # ids are written last: they mark which vectors are complete
+        with open(self.ids_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps({"file_name": record["file_name"]}, ensure_ascii=False) + "\n")
+        self.ids.extend(record["file_name"] for record in records)
+        self._lists = None
+        return len(records)
+
+    # -----------------------------
+    # Train the coarse quantizer (spherical k-means on a sample) and assign
+    # every stored vector to its closest centroid
+    def train(self, iterations=KMEANS_ITERATIONS, seed=0):
+        import numpy as np
+        vectors = self.vectors()
+        n_lists = min(self.n_lists, max(1, len(self.ids) // 4))
+        rng = np.random.default_rng(seed)
+        sample_rows = np.sort(rng.choice(len(self.ids), min(TRAIN_SAMPLE, len(self.ids)), replace=False))
+        sample = np.asarray(vectors[sample_rows])
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            centroids[~empty] = sums[~empty] / norms[~empty]
+        self.centroids = centroids.astype(np.float32)
+        np.save(self.centroids_path, self.centroids)
+
+        with open(self.lists_path, "wb") as f:
+            for start in range(0, len(self.ids), 65536):
+                block = np.asarray(vectors[start:start + 65536])
+                f.write(np.argmax(block @ self.centroids.T, axis=1).astype(np.int32).tobytes())
+        self._lists = None
+
+    def _inverted_lists(self):
+        import numpy as np
+        if self._lists is None:
+            assignments = self._assignments()
+            order = np.argsort(assignments, kind="stable").astype(np.int64)
+            bounds = np.searchsorted(assignments[order], np.arange(len(self.centroids) + 1))
+            self._lists = (order, bounds)
+        return self._lists
+
+    # -----------------------------
+    # Search: top-k (file_name, similarity) for a query text or vector
+    def query_vector(self, jd_text):
+        return self.encoder.encode([jd_text])[0]
+
+    def search(self, query, k=10, nprobe=N_PROBE):
+        import numpy as np
+        if k < 1 or nprobe < 1:
+            raise ValueError(f"k and nprobe must be at least 1 (k={k}, nprobe={nprobe})")
+        vector = self.query_vector(query) if isinstance(query, str) else query
+        if not self.ids:
+            return []
+        vectors = self.vectors()
+        if self.centroids is None:
+            rows = np.arange(len(self.ids))
+        else:
+            order, bounds = self._inverted_lists()
+            probes = np.argsort(-(self.centroids @ vector))[:nprobe]
+            rows = np.sort(np.concatenate([order[bounds[p]:bounds[p + 1]] for p in probes]))
+        sims = np.asarray(vectors[rows]) @ vector
+        top = np.argpartition(-sims, min(k, len(sims)) - 1)[:k] if len(sims) > k else np.arange(len(sims))
+        top = top[np.argsort(-sims[top])]
+        return [(self.ids[rows[i]], float(sims[i])) for i in top]
+
+    def search_exact(self, query, k=10):
+        import numpy as np
+        vector = self.query_vector(query) if isinstance(query, str) else query
+        sims = np.zeros(len(self.ids), dtype=np.float32)
+        vectors = self.vectors()
+        for start in range(0, len(self.ids), 65536):
+            sims[start:start + 65536] = np.asarray(vectors[start:start + 65536]) @ vector
+        top = np.argsort(-sims)[:k]
+        return [(self.ids[i], float(sims[i])) for i in top]
+
+# -----------------------------
+# JD text used as the search query (parsed JD record or plain keyword list)
+def jd_query(jd):
+    if isinstance(jd, dict):
+        skills = jd.get("must_have_skills", []) + jd.get("nice_to_have_skills", [])
+        return (", ".join(skills) + ". " + jd.get("full_text", ""))[:MAX_DOC_CHARS]
+    return ", ".join(jd.keywords)
@@ -0,0 +1,231 @@
+import os
+import re
+import sys
+import json
+import mmap
+import shutil
+import argparse
+from array import array
+from jsonl_pipeline import iter_records
+
+# -----------------------------
+# Columnar store for parsed corpora (parsed resumes, parsed JDs, bulk
+# evaluation results): one directory per corpus, two files per column
+#   <column>.dat : every value of the column as UTF-8 JSON, back to back
+#   <column>.idx : rows + 1 int64 offsets into <column>.dat
+#   meta.json    : row count, column names, key column
+# Reads go through mmap and touch only the columns asked for, so loading the
+# skills of every resume never reads full_text, and one record is found by
+# file name without decoding the rest of the corpus.
+#
+#   python column_store.py pack Resumes/outcomes_resumes/parsed_resumes_smart.jsonl Resumes/outcomes_resumes/resumes.cols
+#   python column_store.py get Resumes/outcomes_resumes/resumes.cols "resume - 1.pdf" --columns skills education
+FORMAT_VERSION = 1
+KEY_COLUMN = "file_name"
+
+def _column_file(path, column, ext):
+    return os.path.join(path, re.sub(r"[^\w.-]+", "_", column) + ext)
+
+# -----------------------------
+# Writer: records are streamed in and never held together in memory. The
+# store is built next to the target and swapped in on close, so readers
+# never see a half-written corpus. Columns default to the keys of the first
+# record; a record missing a column stores null. A pack that raises is
+# discarded and never replaces the store already there. The swap moves the
+# old store aside to <path>.old before renaming the new one in, so a crash
+# between the two renames leaves the old copy to fall back on.
+def _old_path(path):
+    return path.rstrip("/\\") + ".old"
+
+class ColumnStoreWriter:
+    def __init__(self, path, columns=None, key=KEY_COLUMN):
+        self.path = path
+        self.tmp_path = path.rstrip("/\\") + ".tmp"
+        self.old_path = _old_path(path)
+        self.columns = list(columns) if columns else None
+        self.key = key
+        self.count = 0
+        self._files = {}
+        self._offsets = {}
+        if os.path.exists(self.tmp_path):
+            shutil.rmtree(self.tmp_path)
+        os.makedirs(self.tmp_path)
+
+    def _open(self):
+        for column in self.columns:
+            self._files[column] = open(_column_file(self.tmp_path, column, ".dat"), "wb")
+            self._offsets[column] = array("q", [0])
+
+    def write(self, record):
+        if self.columns is None:
+            self.columns = list(record)
+        if not self._files:
+            self._open()
+        for column in self.columns:
+            data = json.dumps(record.get(column), ensure_ascii=False).encode("utf-8")
+            self._files[column].write(data)
+            self._offsets[column].append(self._offsets[column][-1] + len(data))
+        self.count += 1
+
+    def close(self):
+        if not self._files:
+            self.columns = self.columns or [self.key]
+            self._open()
+        for column in self.columns:
+            self._files[column].close()
+            with open(_column_file(self.tmp_path, column, ".idx"), "wb") as f:
+                self._offsets[column].tofile(f)
+        with open(os.path.join(self.tmp_path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"version": FORMAT_VERSION, "rows": self.count, "columns": self.columns,
+                       "key": self.key if self.key in self.columns else None, "byteorder": sys.byteorder}, f)
+        shutil.rmtree(self.old_path, ignore_errors=True)  # left by an interrupted swap
+        if os.path.exists(self.path):
+            os.replace(self.path, self.old_path)
+        os.replace(self.tmp_path, self.path)
+        shutil.rmtree(self.old_path, ignore_errors=True)
+
+    # Drop the partial store; the existing one (if any) is left as it was
+    def abort(self):
+        for f in self._files.values():
+            f.close()
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+def write_column_store(path, records, columns=None, key=KEY_COLUMN):
+    with ColumnStoreWriter(path, columns, key) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+# -----------------------------
+# Reader: column files are mapped on first use
+class ColumnStore:
+    def __init__(self, path):
+        if not os.path.exists(path) and os.path.exists(_old_path(path)):
+            path = _old_path(path)  # a swap was interrupted
+        self.path = path
+        with open(os.path.join(path, "meta.json"), "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION or self.meta.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Unsupported column store: {path}")
+        self.columns = self.meta["columns"]
+        self._maps = {}
+        self._rows_by_key = None
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def _column(self, column):
+        if column not in self._maps:
+            if column not in self.columns:
+                raise KeyError(f"Unknown column: {column}")
+            maps = []
+            for ext in (".dat", ".idx"):
+                with open(_column_file(self.path, column, ext), "rb") as f:
+                    # An empty .dat (no rows) cannot be mapped; .idx always holds offset 0
+                    size = os.fstat(f.fileno()).st_size
+                    maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b"")
+            data, index = maps
+            self._maps[column] = (data, index, memoryview(index).cast("q"))
+        return self._maps[column]
+
+    def value(self, column, row):
+        data, _, offsets = self._column(column)
+        return json.loads(data[offsets[row]:offsets[row + 1]])
+
+    # Every value of one column, in row order
+    def column(self, column):
+        data, _, offsets = self._column(column)
+        for row in range(len(self)):
+            yield json.loads(data[offsets[row]:offsets[row + 1]])
+
+    # Records with only the requested columns (all columns by default)
+    def iter_records(self, columns=None):
+        columns = columns or self.columns
+        for values in zip(*(self.column(column) for column in columns)):
+            yield dict(zip(columns, values))
+
+    # -----------------------------
+    # Random access by key (file name); the key column is read once
+    def row_of(self, key):
+        if self._rows_by_key is None:
+            if not self.meta.get("key"):
+                raise KeyError(f"Column store has no key column: {self.path}")
+            self._rows_by_key = {value: row for row, value in enumerate(self.column(self.meta["key"]))}
+        return self._rows_by_key.get(key)
+
+    def get(self, key, columns=None):
+        row = self.row_of(key)
+        if row is None:
+            return None
+        return {column: self.value(column, row) for column in (columns or self.columns)}
+
+    def close(self):
+        for data, index, offsets in self._maps.values():
+            offsets.release()
+            for m in (data, index):
+                if isinstance(m, mmap.mmap):
+                    m.close()
+        self._maps = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# -----------------------------
+# Any parsed corpus as a record stream: column store, JSON Lines (streamed)
+# or a JSON array (the older pretty-printed outputs, loaded whole). Unreadable
+# JSON Lines are skipped, as load_done does when a run is resumed.
+def iter_corpus(path, columns=None):
+    if os.path.isdir(path) or os.path.isdir(_old_path(path)):
+        with ColumnStore(path) as store:
+            yield from store.iter_records(columns)
+        return
+    if path.lower().endswith(".jsonl"):
+        records = iter_records(path, skip_bad=True)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+    for record in records:
+        yield {column: record.get(column) for column in columns} if columns else record
+
+# -----------------------------
+# Command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack parsed corpora into a column store and read them back.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pack = commands.add_parser("pack", help="convert a .jsonl/.json corpus into a column store")
+    pack.add_argument("input")
+    pack.add_argument("output", help="column store directory")
+    pack.add_argument("--columns", nargs="+", help="columns to keep (default: all)")
+    pack.add_argument("--key", default=KEY_COLUMN, help="column used for lookups by name")
+    get = commands.add_parser("get", help="print one record by file name")
+    get.add_argument("store")
+    get.add_argument("name")
+    get.add_argument("--columns", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "pack":
+        count = write_column_store(args.output, iter_corpus(args.input), args.columns, args.key)
+        print(f"Packed {count} records into {args.output}")
+        return 0
+    with ColumnStore(args.store) as store:
+        record = store.get(args.name, args.columns)
+    if record is None:
+        print(f"Not found: {args.name}")
+        return 1
+    print(json.dumps(record, indent=4, ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
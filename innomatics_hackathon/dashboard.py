@@ -1,71 +1,141 @@
 import streamlit as st
 import os
-import shutil
-from ResumeJDMatching import evaluate_single_resume, evaluate_bulk_resumes
+from ResumeJDMatching import evaluate_single_resume, compile_jd, RESULT_FIELDS, HIGH_FIT, MEDIUM_FIT
+from ranking_index import RankingIndex
+from skill_index import SkillIndex, QueryError
+from evaluation_store import EvaluationStore, DB_FILE
+from jsonl_pipeline import RecordWriter
+from upload_store import save_upload_bytes
+from resume_cache import content_hash
+from text_extraction import supported_extensions
+import metrics
+from data_paths import data_path, project_path
 import pandas as pd
-import plotly.graph_objects as go
-import sqlite3
 
 # -----------------------------
-# Setup folders
-UPLOAD_FOLDER = "uploads"
-BULK_FOLDER = os.path.join(UPLOAD_FOLDER, "bulk_resumes")
+# Setup folders. Uploads are scored straight from memory; a copy is kept on
+# disk (content-addressed, uploads/store/<sha256>/<name>) only when enabled.
+UPLOAD_FOLDER = data_path("uploads")
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-os.makedirs(BULK_FOLDER, exist_ok=True)
-
-# -----------------------------
-# Setup database
-DB_FILE = "evaluations.db"
-conn = sqlite3.connect(DB_FILE, check_same_thread=False)
-c = conn.cursor()
-c.execute("""
-CREATE TABLE IF NOT EXISTS evaluations (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    candidate_name TEXT,
-    jd_name TEXT,
-    relevance_score REAL,
-    missing_skills TEXT,
-    feedback TEXT,
-    evaluation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-)
-""")
-conn.commit()
+PERSIST_UPLOADS = os.environ.get("RESUME_PERSIST_UPLOADS", "0") == "1"
+# Every format the extractor registry handles (pdf, docx, txt, html, htm)
+UPLOAD_TYPES = [ext.lstrip(".") for ext in supported_extensions()]
 
 # -----------------------------
 # Page config
 st.set_page_config(page_title="Offline Resume Relevance Check", layout="wide")
 st.title("📄 Offline Resume Relevance Check System")
 st.markdown("Evaluate resumes offline with rich visuals and stored history.")
+persist_uploads = st.sidebar.checkbox("Keep a copy of uploaded files on disk", value=PERSIST_UPLOADS)
+
+# -----------------------------
+# The script re-runs top to bottom on every interaction, so nothing heavy
+# happens at the top level:
+# - the DB store and ranking index are opened once per server process
+# - compiled JDs are shared by every session (keyed by content hash)
+# - each upload is hashed (and persisted, if enabled) once per session
+# - scoring runs only on the Evaluate buttons; its output is kept in
+#   st.session_state and re-rendered from there, and repeat evaluations are
+#   served by the score / text caches and never inserted into the DB twice
+HISTORY_PAGE_SIZES = [25, 50, 100]
+LIVE_TOP_K = 10         # candidates shown while a bulk run is in progress
+BULK_TABLE_ROWS = 100   # rows in the bulk results table / chart
+DB_BATCH = 500          # evaluations per history insert
+PARSED_RESUMES = project_path("Resumes", "outcomes_resumes", "parsed_resumes_smart.jsonl")
+SKILL_RESULT_ROWS = 200
+
+# Setup database (WAL mode, one connection per thread, indexed history)
+@st.cache_resource(show_spinner=False)
+def get_store():
+    return EvaluationStore(DB_FILE)
+
+# Per-JD ranking index: each resume is scored once per JD, new uploads are
+# added incrementally and top-K comes straight from an index
+@st.cache_resource(show_spinner=False)
+def get_ranking():
+    return RankingIndex()
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def get_compiled_jd(name, digest, _data):
+    return compile_jd((name, _data))
+
+# Inverted skill index over the parsed resumes; brought up to date (new
+# resumes only) whenever resumeparsingscript.py has written to its output
+@st.cache_resource(show_spinner=False)
+def get_skill_index():
+    return SkillIndex()
+
+@st.cache_data(show_spinner=False)
+def sync_skill_index(path, mtime):
+    return get_skill_index().add_parsed_resumes(path)
+
+@st.cache_data(show_spinner=False, ttl=60)
+def history_jd_names():
+    return store.jd_names()
+
+store = get_store()
+ranking = get_ranking()
+
+# Helper: sha256 of an upload, computed (and the file persisted, if asked
+# to) the first time this session sees it
+def upload_digest(uploaded):
+    uploads = st.session_state.setdefault("uploads", {})
+    entry = uploads.get(uploaded.file_id)
+    if entry is None:
+        entry = uploads[uploaded.file_id] = {"digest": content_hash(uploaded.getvalue()), "persisted": False}
+    if persist_uploads and not entry["persisted"]:
+        save_upload_bytes(uploaded.getvalue(), uploaded.name)
+        entry["persisted"] = True
+    return entry["digest"]
+
+# (file name, bytes) of an upload, scored straight from memory
+def upload_source(uploaded):
+    upload_digest(uploaded)
+    return uploaded.name, uploaded.getvalue()
+
+def save_evaluations(jd_name, results):
+    if store.add_evaluations(jd_name, results):
+        history_jd_names.clear()
 
 # -----------------------------
 # Upload JD
-st.header("1️⃣ Upload Job Description (PDF)")
-jd_file = st.file_uploader("Upload JD PDF", type=["pdf"])
-jd_path = None
+st.header("1️⃣ Upload Job Description")
+# A parsed JD (JDParsingScript.py output) keeps its must-have / nice-to-have split
+jd_file = st.file_uploader("Upload JD (PDF, DOCX, TXT, HTML or parsed JD JSON)", type=UPLOAD_TYPES + ["json"])
+jd = None
 if jd_file:
-    jd_path = os.path.join(UPLOAD_FOLDER, jd_file.name)
-    with open(jd_path, "wb") as f:
-        f.write(jd_file.getbuffer())
-    st.success(f"✅ JD uploaded: {jd_file.name}")
+    try:
+        jd_digest = upload_digest(jd_file)
+        jd = get_compiled_jd(jd_file.name, jd_digest, jd_file.getvalue())
+        st.success(f"✅ JD uploaded: {jd_file.name}")
+    except Exception as e:
+        st.error(f"⚠️ Error: {e}")
 
 # -----------------------------
 # Upload Single Resume
-st.header("2️⃣ Upload Single Resume (PDF)")
-resume_file = st.file_uploader("Upload Resume", type=["pdf"], key="resume_upload")
+st.header("2️⃣ Upload Single Resume")
+resume_file = st.file_uploader("Upload Resume", type=UPLOAD_TYPES, key="resume_upload")
 
-if resume_file and jd_path:
-    resume_path = os.path.join(UPLOAD_FOLDER, resume_file.name)
-    with open(resume_path, "wb") as f:
-        f.write(resume_file.getbuffer())
+if resume_file and jd:
+    single_key = (upload_digest(resume_file), jd_digest)
+    if st.button("🔍 Evaluate resume"):
+        try:
+            result = evaluate_single_resume(upload_source(resume_file), jd)
+            # Save to DB (skipped when this evaluation is already stored)
+            save_evaluations(jd_file.name, [result])
+            st.session_state["single_result"] = (single_key, result)
+        except Exception as e:
+            st.error(f"⚠️ Error: {e}")
 
-    st.subheader("Evaluation Result:")
-    try:
-        result = evaluate_single_resume(resume_path, jd_path)
+    stored_key, result = st.session_state.get("single_result", (None, None))
+    if stored_key == single_key:
+        import plotly.graph_objects as go  # only needed once there is a chart to draw
+        st.subheader("Evaluation Result:")
         relevance = result["relevance_score"]
         feedback = result["feedback"]
         missing = result.get("missing_keywords", result.get("missing_skills", []))
 
-        color = "green" if relevance > 70 else "orange" if relevance > 40 else "red"
+        color = "green" if relevance > HIGH_FIT else "orange" if relevance > MEDIUM_FIT else "red"
 
         # Candidate card
         st.markdown(f"### Candidate: {result['candidate_name']}")
@@ -78,7 +148,7 @@ if resume_file and jd_path:
             domain={'x': [0, 1], 'y': [0, 1]},
             title={'text': "Relevance Score"},
             gauge={'axis': {'range': [0, 100]}, 'bar': {'color': color},
-                   'steps':[{'range':[0,40],'color':'red'},{'range':[40,70],'color':'orange'},{'range':[70,100],'color':'green'}]}
+                   'steps':[{'range':[0,MEDIUM_FIT],'color':'red'},{'range':[MEDIUM_FIT,HIGH_FIT],'color':'orange'},{'range':[HIGH_FIT,100],'color':'green'}]}
         ))
         st.plotly_chart(fig, use_container_width=True)
 
@@ -88,81 +158,159 @@ if resume_file and jd_path:
             st.progress(0.5)
             st.write(f"- {skill}")
 
-        # Save to DB
-        c.execute("""
-        INSERT INTO evaluations(candidate_name, jd_name, relevance_score, missing_skills, feedback)
-        VALUES (?, ?, ?, ?, ?)
-        """, (result['candidate_name'], jd_file.name, relevance, ", ".join(missing), feedback))
-        conn.commit()
-
-    except Exception as e:
-        st.error(f"⚠️ Error: {e}")
-
 # -----------------------------
 # Bulk evaluation
 st.header("3️⃣ Upload Multiple Resumes for Bulk Evaluation")
-bulk_files = st.file_uploader("Upload multiple resumes", type=["pdf"], accept_multiple_files=True)
+bulk_files = st.file_uploader("Upload multiple resumes", type=UPLOAD_TYPES, accept_multiple_files=True)
 
-if bulk_files and jd_path:
-    # clear folder
-    for f in os.listdir(BULK_FOLDER):
-        os.remove(os.path.join(BULK_FOLDER, f))
+# Scores every uploaded resume not yet ranked for this JD and returns what
+# the results section draws: the best BULK_TABLE_ROWS rows, the resume
+# count, the top 3 and the CSV with every result
+def run_bulk_evaluation(jd, bulk_files):
+    import heapq
+    resume_sources = [upload_source(file) for file in bulk_files]
 
-    resume_paths = []
-    for file in bulk_files:
-        path = os.path.join(BULK_FOLDER, file.name)
-        with open(path, "wb") as f:
-            f.write(file.getbuffer())
-        resume_paths.append(path)
+    # Only resumes not yet ranked for this JD are scored; progress and the
+    # current top candidates update while extraction is still running
+    progress = st.progress(0.0, text="Scoring resumes...")
+    live_top = st.empty()
+    last_scored = -1
+    with metrics.timer("bulk_ranking"):
+        for processed, scored in ranking.iter_add_resumes(jd, resume_sources):
+            progress.progress(processed / len(resume_sources), text=f"Processed {processed}/{len(resume_sources)} resumes")
+            if scored != last_scored:
+                last_scored = scored
+                live_top.dataframe(pd.DataFrame([
+                    {"Candidate": top["candidate_name"], "Score": top["relevance_score"]}
+                    for top in ranking.top_k(jd.jd_hash, LIVE_TOP_K)]))
+    progress.empty()
+    live_top.empty()
 
-    st.subheader("Bulk Evaluation Results:")
-    try:
-        bulk_results = evaluate_bulk_resumes(BULK_FOLDER, jd_path)
-        table_data = []
-        for res in bulk_results:
-            table_data.append({
-                "Candidate": res["candidate_name"],
-                "Score": res["relevance_score"],
-                "Missing Skills": ", ".join(res.get("missing_skills", [])),
-                "Feedback": res.get("feedback", "")
-            })
-            # Save to DB
-            c.execute("""
-            INSERT INTO evaluations(candidate_name, jd_name, relevance_score, missing_skills, feedback)
-            VALUES (?, ?, ?, ?, ?)
-            """, (res['candidate_name'], jd_file.name, res['relevance_score'], ", ".join(res.get("missing_skills", [])), res.get("feedback","")))
-        conn.commit()
-
-        df = pd.DataFrame(table_data)
+    # Results streamed to a CSV file and the DB in batches; only the best
+    # BULK_TABLE_ROWS are kept for the table and chart
+    results_path = os.path.join(UPLOAD_FOLDER, "bulk_evaluation_results.csv")
+    best, batch = [], []
+    with RecordWriter(results_path, RESULT_FIELDS) as writer:
+        for res in ranking.iter_results_for(jd.jd_hash, resume_sources):
+            writer.write(res)
+            batch.append(res)
+            if len(batch) >= DB_BATCH:
+                # Save to DB (one batched transaction, already-stored rows skipped)
+                save_evaluations(jd_file.name, batch)
+                batch = []
+            heapq.heappush(best, (res["relevance_score"], -writer.count, res))
+            if len(best) > BULK_TABLE_ROWS:
+                heapq.heappop(best)
+    save_evaluations(jd_file.name, batch)
+
+    table_data = []
+    for _, _, res in sorted(best, reverse=True):
+        table_data.append({
+            "Candidate": res["candidate_name"],
+            "Score": res["relevance_score"],
+            "Fit": res.get("fit", ""),
+            "Missing Skills": ", ".join(res.get("missing_keywords", [])),
+            "Feedback": res.get("feedback", "")
+        })
+    return {"table": table_data, "count": writer.count, "top": ranking.top_k(jd.jd_hash, 3), "csv": results_path}
+
+if bulk_files and jd:
+    bulk_key = (jd_digest, tuple(sorted(upload_digest(file) for file in bulk_files)))
+    if st.button(f"🚀 Evaluate {len(bulk_files)} resumes"):
+        try:
+            st.session_state["bulk_result"] = (bulk_key, run_bulk_evaluation(jd, bulk_files))
+        except Exception as e:
+            st.error(f"⚠️ Error: {e}")
+
+    stored_key, bulk = st.session_state.get("bulk_result", (None, None))
+    if stored_key == bulk_key:
+        import plotly.graph_objects as go
+        st.subheader("Bulk Evaluation Results:")
+        df = pd.DataFrame(bulk["table"])
+        if bulk["count"] > BULK_TABLE_ROWS:
+            st.caption(f"Showing the top {BULK_TABLE_ROWS} of {bulk['count']} resumes; the CSV has all of them.")
         st.dataframe(df)
 
-        # Bulk bar chart with top 3 highlight
+        # Bulk bar chart with top 3 highlight (colors picked for the whole column at once)
+        import numpy as np
         fig_bulk = go.Figure()
-        colors = []
-        for idx, row in df.iterrows():
-            colors.append('gold' if idx < 3 else 'green' if row['Score']>70 else 'orange' if row['Score']>40 else 'red')
+        colors = np.select([np.arange(len(df)) < 3, df["Score"] > HIGH_FIT, df["Score"] > MEDIUM_FIT],
+                           ["gold", "green", "orange"], "red")
         fig_bulk.add_trace(go.Bar(x=df["Candidate"], y=df["Score"], marker_color=colors, text=df["Missing Skills"], hoverinfo='x+y+text'))
         fig_bulk.update_layout(title="Candidate Relevance Scores", yaxis_title="Score (%)")
         st.plotly_chart(fig_bulk, use_container_width=True)
 
-        st.markdown("**🏆 Top 3 Candidates:**")
-        for idx, row in df.sort_values("Score", ascending=False).head(3).iterrows():
-            st.markdown(f"- **{row['Candidate']}** → Score: {row['Score']}%, Missing Skills: {row['Missing Skills']}")
+        st.markdown("**🏆 Top 3 Candidates (all resumes ranked for this JD):**")
+        for top in bulk["top"]:
+            st.markdown(f"- **{top['candidate_name']}** → Score: {top['relevance_score']}%, Missing Skills: {', '.join(top['missing_keywords'])}")
 
         # Export option
-        st.download_button("📥 Download Evaluation Results CSV", df.to_csv(index=False), "evaluation_results.csv")
-
-    except Exception as e:
-        st.error(f"⚠️ Error: {e}")
+        with open(bulk["csv"], "rb") as f:
+            st.download_button("📥 Download Evaluation Results CSV", f, "evaluation_results.csv")
 
 # -----------------------------
 # History / Audit Logs
 st.header("4️⃣ Past Evaluations (History & Audit Logs)")
 try:
-    df_logs = pd.read_sql_query("SELECT * FROM evaluations ORDER BY evaluation_date DESC", conn)
-    st.dataframe(df_logs)
+    col_jd, col_size = st.columns([3, 1])
+    history_jd = col_jd.selectbox("Filter by JD", ["All"] + history_jd_names())
+    page_size = col_size.selectbox("Rows per page", HISTORY_PAGE_SIZES)
+
+    # Keyset pagination: remember the cursor of every page visited so far
+    history_key = (history_jd, page_size)
+    if st.session_state.get("history_key") != history_key:
+        st.session_state["history_key"] = history_key
+        st.session_state["history_cursors"] = [None]
+    cursors = st.session_state["history_cursors"]
+
+    rows, next_cursor = store.history_page(page_size, cursors[-1], None if history_jd == "All" else history_jd)
+    st.dataframe(pd.DataFrame(rows))
+
+    col_newer, col_page, col_older = st.columns([1, 2, 1])
+    if col_newer.button("⬅️ Newer", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    col_page.markdown(f"Page {len(cursors)}")
+    if col_older.button("Older ➡️", disabled=next_cursor is None):
+        cursors.append(next_cursor)
+        st.rerun()
 except Exception as e:
     st.error(f"⚠️ Could not fetch logs: {e}")
 
+# -----------------------------
+# Skill filter over every parsed resume (boolean queries on the skill index)
+st.header("5️⃣ Filter Candidates by Skills")
+if not os.path.exists(PARSED_RESUMES):
+    st.info(f"Run resumeparsingscript.py first to build the skill index ({PARSED_RESUMES}).")
+else:
+    sync_skill_index(PARSED_RESUMES, os.path.getmtime(PARSED_RESUMES))
+    skill_index = get_skill_index()
+    skill_query = st.text_input("Skills query", placeholder='python AND spark AND NOT java, (sql OR excel) AND "power bi"')
+    if skill_query:
+        try:
+            total, names = skill_index.search(skill_query, SKILL_RESULT_ROWS)
+            st.markdown(f"**{total}** of {len(skill_index)} resumes match")
+            st.dataframe(pd.DataFrame({"Candidate": names}))
+        except QueryError as e:
+            st.error(f"⚠️ Invalid query: {e}")
+    with st.expander("Known skills"):
+        st.write(", ".join(skill_index.skills()[:200]))
+
+# -----------------------------
+# Pipeline metrics (this dashboard process; RESUME_METRICS=0 turns them off)
+with st.expander("⏱️ Pipeline Metrics"):
+    snap = metrics.snapshot()
+    if not snap["enabled"]:
+        st.info("Metrics are disabled (RESUME_METRICS=0).")
+    elif not snap["stages"] and not snap["counters"]:
+        st.write("No evaluations run yet.")
+    else:
+        col_stages, col_counters = st.columns([3, 2])
+        col_stages.dataframe(pd.DataFrame([{"Stage": stage, **s} for stage, s in snap["stages"].items()]))
+        col_counters.dataframe(pd.DataFrame([{"Counter": name, "Value": value} for name, value in snap["counters"].items()]))
+    if st.button("Reset metrics"):
+        metrics.reset()
+        st.rerun()
+
 st.markdown("---")
 st.markdown("💡 Fully offline, SQLite-powered, visually enhanced, recruiter-friendly dashboard 🚀")
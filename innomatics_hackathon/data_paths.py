@@ -0,0 +1,16 @@
+import os
+
+# -----------------------------
+# Where caches, databases and uploads are written: $RESUME_DATA_DIR when set,
+# otherwise this folder. Paths no longer depend on the directory a script or
+# server was started from, so every entry point shares one set of caches.
+#   RESUME_DATA_DIR=/var/lib/resume-matching streamlit run dashboard.py
+HERE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.abspath(os.environ.get("RESUME_DATA_DIR") or HERE)
+
+def data_path(*parts):
+    return os.path.join(DATA_DIR, *parts)
+
+# Bundled inputs (sample resumes, parsed outputs) next to the code
+def project_path(*parts):
+    return os.path.join(HERE, *parts)
@@ -0,0 +1,117 @@
+import os
+import sqlite3
+import threading
+import metrics
+from data_paths import data_path
+
+# -----------------------------
+# SQLite evaluation store
+# - WAL mode, so the dashboard can read history while a bulk run writes
+# - one connection per thread (Streamlit serves every session on its own
+#   thread), instead of a single shared check_same_thread=False connection
+# - bulk results go in with one executemany inside a single transaction
+# - history is read a page at a time with keyset pagination on
+#   (evaluation_date, id), so a page costs the same however large the table is
+# - results carrying a score-cache key (resume_hash, jd_hash, scorer_version)
+#   are stored once: re-evaluating the same resume against the same JD (e.g.
+#   on every Streamlit rerun) does not add a duplicate row
+DB_FILE = data_path("evaluations.db")
+KEY_COLUMNS = ["resume_hash", "jd_hash", "scorer_version"]
+HISTORY_COLUMNS = ["id", "candidate_name", "jd_name", "relevance_score", "missing_skills", "feedback", "evaluation_date"]
+
+class EvaluationStore:
+    def __init__(self, db_path=DB_FILE):
+        self.db_path = db_path
+        self._local = threading.local()
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = self.connection()
+        with conn:
+            conn.executescript("""
+            CREATE TABLE IF NOT EXISTS evaluations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                candidate_name TEXT,
+                jd_name TEXT,
+                relevance_score REAL,
+                missing_skills TEXT,
+                feedback TEXT,
+                evaluation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS idx_evaluations_jd_name ON evaluations(jd_name);
+            CREATE INDEX IF NOT EXISTS idx_evaluations_candidate_name ON evaluations(candidate_name);
+            CREATE INDEX IF NOT EXISTS idx_evaluations_date ON evaluations(evaluation_date, id);
+            """)
+            # Key columns, added in place to databases created before them
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(evaluations)")}
+            for column in KEY_COLUMNS:
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE evaluations ADD COLUMN {column} TEXT")
+            # NULL keys (older rows, results without a key) never collide
+            conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_evaluations_key
+            ON evaluations(resume_hash, jd_hash, scorer_version)
+            """)
+
+    # Per-thread connection, opened on first use in that thread
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -----------------------------
+    # Writes; returns the number of rows actually inserted (already-stored
+    # keys are skipped)
+    def add_evaluations(self, jd_name, results):
+        rows = [(res["candidate_name"], jd_name, res["relevance_score"],
+                 ", ".join(res.get("missing_keywords", res.get("missing_skills", []))), res.get("feedback", ""),
+                 *(res.get(column) for column in KEY_COLUMNS))
+                for res in results]
+        conn = self.connection()
+        before = conn.total_changes
+        with metrics.timer("db_insert"), conn:
+            conn.executemany("""
+            INSERT OR IGNORE INTO evaluations(candidate_name, jd_name, relevance_score, missing_skills, feedback,
+                                              resume_hash, jd_hash, scorer_version)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        inserted = conn.total_changes - before
+        metrics.count("db_rows_inserted", inserted)
+        metrics.count("db_rows_duplicate", len(rows) - inserted)
+        return inserted
+
+    def add_evaluation(self, jd_name, result):
+        return self.add_evaluations(jd_name, [result])
+
+    # -----------------------------
+    # Reads: newest first, `limit` rows after the (evaluation_date, id) cursor.
+    # Returns (rows, next_cursor); next_cursor is None on the last page.
+    def history_page(self, limit=50, cursor=None, jd_name=None, candidate_name=None):
+        where, params = [], []
+        if cursor is not None:
+            where.append("(evaluation_date, id) < (?, ?)")
+            params.extend(cursor)
+        if jd_name:
+            where.append("jd_name = ?")
+            params.append(jd_name)
+        if candidate_name:
+            where.append("candidate_name = ?")
+            params.append(candidate_name)
+        sql = f"SELECT {', '.join(HISTORY_COLUMNS)} FROM evaluations"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY evaluation_date DESC, id DESC LIMIT ?"
+        rows = self.connection().execute(sql, params + [limit + 1]).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1][6], rows[-1][0])
+        return [dict(zip(HISTORY_COLUMNS, row)) for row in rows], next_cursor
+
+    def jd_names(self):
+        return [row[0] for row in self.connection().execute(
+            "SELECT DISTINCT jd_name FROM evaluations WHERE jd_name IS NOT NULL ORDER BY jd_name")]
@@ -0,0 +1,116 @@
+import os
+import re
+import bisect
+import metrics
+from text_extraction import iter_folder_texts
+from skill_matcher import SkillMatcher, load_skills
+
+# JD parsing library: importing this module is cheap. The skill matcher and
+# the per-format extractors (text_extraction) are loaded on first use; no
+# NLP model is needed.
+
+# ----------------------------
+# 1. Predefined skill list
+# ----------------------------
+SKILLS = [
+    "python", "sql", "excel", "tableau", "power bi", "aws", "docker",
+    "pandas", "numpy", "matplotlib", "seaborn", "spark", "pytorch",
+    "tensorflow", "java", "c++", "machine learning", "data analysis",
+    "communication", "leadership", "problem solving"
+]
+
+# Compiled on first use; finds every skill in a single pass with word
+# boundaries. SKILLS_FILE can add a full taxonomy (one skill per line).
+_skill_matcher = None
+
+def get_skill_matcher():
+    global _skill_matcher
+    if _skill_matcher is None:
+        skills = SKILLS
+        if os.environ.get("SKILLS_FILE"):
+            skills = skills + load_skills(os.environ["SKILLS_FILE"])
+        _skill_matcher = SkillMatcher(skills)
+    return _skill_matcher
+
+# ----------------------------
+# 2. Helper functions
+# ----------------------------
+def clean_text(text):
+    text = re.sub(r"\n+", "\n", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip().lower()
+
+# Lowercased with whitespace collapsed inside each line, line breaks kept
+# (must-have / nice-to-have markers apply to their own line only)
+def clean_lines(text):
+    return "\n".join(line for line in (" ".join(raw.split()).lower() for raw in text.splitlines()) if line)
+
+def extract_title(text):
+    # Try to find the first line as job title
+    lines = text.split("\n")
+    if lines:
+        return lines[0].strip().title()
+    return "Not Found"
+
+def extract_skills(text):
+    return [skill.title() for skill in get_skill_matcher().find_skills(text)]
+
+MUST_HAVE_MARKERS = re.compile(r"must have|required|requirements|mandatory")
+NICE_TO_HAVE_MARKERS = re.compile(r"nice to have|good to have|preferred")
+
+def extract_marked_skills(text, markers):
+    # One skill pass over the whole text, then keep the matches that sit on a
+    # line mentioning one of the markers. A marker heading ("Requirements:")
+    # also marks the lines under it, up to the next heading.
+    line_starts = [0]
+    marked = []
+    in_section = False
+    for line in text.split("\n"):
+        heading = line.endswith(":")
+        if markers.search(line):
+            marked.append(True)
+            in_section = heading
+        else:
+            in_section = in_section and not heading
+            marked.append(in_section)
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    found = [skill.title() for skill, start, _ in get_skill_matcher().find(text)
+             if marked[bisect.bisect_right(line_starts, start) - 1]]
+    # Deduplicated in document order (set order changes with the hash seed)
+    return list(dict.fromkeys(found))
+
+def extract_must_have(text):
+    # Look for lines with 'must have', 'required', 'mandatory'
+    return extract_marked_skills(text, MUST_HAVE_MARKERS)
+
+def extract_nice_to_have(text):
+    # Look for lines with 'nice to have', 'good to have', 'preferred'
+    return extract_marked_skills(text, NICE_TO_HAVE_MARKERS)
+
+# ----------------------------
+# 3. Parsing
+# ----------------------------
+def parse_jd(file_name, text):
+    with metrics.timer("parse_jd"):
+        cleaned_text = clean_text(text)
+        lines = clean_lines(text)
+        parsed = {
+            "file_name": file_name,
+            "job_title": extract_title(cleaned_text),
+            "must_have_skills": extract_must_have(lines),
+            "nice_to_have_skills": extract_nice_to_have(lines),
+            "full_text": cleaned_text
+        }
+    metrics.count("jds_parsed")
+    return parsed
+
+# Generator over the input folder: yields one parsed record per JD as it
+# completes, skipping file names listed in `skip`. Every supported format
+# (PDF, DOCX, TXT, HTML) goes through the shared extraction pool, and each
+# JD is parsed in the same worker that extracted it.
+def iter_parsed_jds(input_folder, skip=(), workers=None):
+    for file_name, parsed, error in iter_folder_texts(input_folder, skip, workers, parse=parse_jd):
+        if error:
+            print(f"Skipping {file_name}: {error}")
+            continue
+        yield parsed
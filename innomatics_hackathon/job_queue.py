@@ -0,0 +1,108 @@
+import os
+import time
+import uuid
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# -----------------------------
+# Bounded background job queue
+# At most `max_workers` jobs run at once. Queued jobs are dispatched
+# round-robin across submitters, so one recruiter's large backlog cannot
+# starve everyone else. Finished jobs are kept (newest `max_finished`) for
+# status and result polling.
+JOB_WORKERS = int(os.environ.get("RESUME_JOB_WORKERS", 2))
+MAX_FINISHED_JOBS = 200
+
+class JobQueue:
+    def __init__(self, max_workers=JOB_WORKERS, max_finished=MAX_FINISHED_JOBS):
+        self.max_workers = max_workers
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self._queues = OrderedDict()  # submitter -> deque of job ids
+        self._running = 0
+
+    def submit(self, fn, *args, submitter="anonymous", job_id=None, **kwargs):
+        job_id = job_id or uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "submitter": submitter,
+                "status": "queued",
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+                "error": None,
+                "result": None,
+                "_call": (fn, args, kwargs),
+            }
+            self._queues.setdefault(submitter, deque()).append(job_id)
+            self._dispatch()
+        return job_id
+
+    # Start queued jobs while there are free slots, one submitter at a time
+    def _dispatch(self):
+        while self._running < self.max_workers and self._queues:
+            submitter, queue = next(iter(self._queues.items()))
+            job_id = queue.popleft()
+            # Move this submitter to the back of the rotation
+            del self._queues[submitter]
+            if queue:
+                self._queues[submitter] = queue
+            job = self._jobs[job_id]
+            job["status"] = "running"
+            job["started_at"] = time.time()
+            self._running += 1
+            self._executor.submit(self._run, job_id)
+
+    def _run(self, job_id):
+        with self._lock:
+            fn, args, kwargs = self._jobs[job_id].pop("_call")
+        try:
+            result, error, status = fn(*args, **kwargs), None, "done"
+        except Exception as e:
+            result, error, status = None, f"{type(e).__name__}: {e}", "failed"
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(status=status, result=result, error=error, finished_at=time.time())
+            self._running -= 1
+            self._forget_old_jobs()
+            self._dispatch()
+
+    def _forget_old_jobs(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job["finished_at"] is not None]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def status(self, job_id):
+        with self._lock:
+            return self._status(job_id)
+
+    def _status(self, job_id):
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        info = {key: value for key, value in job.items() if key not in ("result", "_call")}
+        if job["status"] == "queued":
+            info["queue_position"] = self._queue_position(job_id)
+        return info
+
+    def _queue_position(self, job_id):
+        # Position under round-robin dispatch: rounds ahead x submitters
+        for submitter, queue in self._queues.items():
+            if job_id in queue:
+                rounds = list(queue).index(job_id)
+                return rounds * len(self._queues) + list(self._queues).index(submitter) + 1
+        return None
+
+    # (status, result) read under one lock: a job cannot finish or be
+    # forgotten between the two reads. (None, None) for an unknown job.
+    def snapshot(self, job_id):
+        with self._lock:
+            info = self._status(job_id)
+            return info, None if info is None else self._jobs[job_id]["result"]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,102 @@
+import os
+import csv
+import json
+
+# -----------------------------
+# Walk an input folder lazily, yielding (file_name, path) for matching files
+def iter_input_files(folder, extensions):
+    if not os.path.isdir(folder):
+        raise FileNotFoundError(f"Input folder not found: {folder}")
+    for entry in sorted(os.scandir(folder), key=lambda e: e.name):
+        if entry.is_file() and entry.name.lower().endswith(extensions):
+            yield entry.name, entry.path
+
+# -----------------------------
+# Read a JSON Lines file one record at a time. With skip_bad, lines that are
+# not valid JSON (a corrupted or torn write) are skipped instead of raising.
+def iter_records(path, skip_bad=False):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    if not skip_bad:
+                        raise
+
+# -----------------------------
+# File names already in the output, so a restarted run can skip them, and
+# the number of unreadable lines skipped on the way (their files are not in
+# done, so they are parsed again). Only an unterminated last line is a torn
+# write from a crash; it is cut off so new records are appended after the
+# last complete one. Complete lines are never removed.
+def load_done(output_path, key="file_name"):
+    done = set()
+    bad_lines = 0
+    if not os.path.exists(output_path):
+        return done, bad_lines
+    good_size = 0
+    with open(output_path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            good_size += len(line)
+            if not line.strip():
+                continue
+            try:
+                done.add(json.loads(line)[key])
+            except (ValueError, KeyError, TypeError):
+                bad_lines += 1
+    if good_size != os.path.getsize(output_path):
+        with open(output_path, "r+b") as f:
+            f.truncate(good_size)
+    return done, bad_lines
+
+# -----------------------------
+# Append records as they are produced: one line per record, flushed so a
+# crash never loses finished work
+def append_records(output_path, records):
+    if os.path.dirname(output_path):
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    count = 0
+    with open(output_path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            count += 1
+    return count
+
+# -----------------------------
+# Write records one at a time to JSON Lines (default) or CSV (.csv output;
+# list values are joined with ", "). Every record is flushed, so memory stays
+# flat and a partial run still leaves a readable file.
+class RecordWriter:
+    def __init__(self, output_path, fields=None):
+        if os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        self.output_path = output_path
+        self.fields = fields
+        self.count = 0
+        self._csv = None
+        self._file = open(output_path, "w", encoding="utf-8", newline="")
+
+    def write(self, record):
+        if self.output_path.lower().endswith(".csv"):
+            if self._csv is None:
+                self._csv = csv.DictWriter(self._file, fieldnames=self.fields or list(record), extrasaction="ignore")
+                self._csv.writeheader()
+            self._csv.writerow({key: ", ".join(value) if isinstance(value, list) else value
+                                for key, value in record.items()})
+        else:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
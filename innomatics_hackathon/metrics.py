@@ -0,0 +1,69 @@
+import os
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+
+# -----------------------------
+# In-process pipeline metrics: stage timers and counters
+# Read through GET /metrics (app.py), the dashboard and the parsing scripts'
+# --metrics flag. Turn off with RESUME_METRICS=0 (or metrics.enable(False)):
+# timer() then hands back one shared no-op context and count() returns at once.
+ENABLED = os.environ.get("RESUME_METRICS", "1") != "0"
+
+_lock = threading.Lock()
+_stages = {}    # stage -> [calls, total_seconds, max_seconds]
+_counters = {}  # name -> int
+_NOOP = nullcontext()
+
+def enable(flag=True):
+    global ENABLED
+    ENABLED = flag
+
+def add_time(stage, seconds, calls=1):
+    if not ENABLED:
+        return
+    with _lock:
+        entry = _stages.setdefault(stage, [0, 0.0, 0.0])
+        entry[0] += calls
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+@contextmanager
+def _timed(stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time(stage, time.perf_counter() - start)
+
+def timer(stage):
+    return _timed(stage) if ENABLED else _NOOP
+
+def count(name, n=1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+def snapshot():
+    with _lock:
+        stages = {stage: {"calls": calls, "total_s": round(total, 6), "max_s": round(longest, 6),
+                          "mean_ms": round(total / calls * 1000, 3) if calls else 0.0}
+                  for stage, (calls, total, longest) in sorted(_stages.items())}
+        return {"enabled": ENABLED, "stages": stages, "counters": dict(sorted(_counters.items()))}
+
+def reset():
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+
+# -----------------------------
+# Plain-text summary for the command-line scripts
+def format_summary(snap=None):
+    snap = snap or snapshot()
+    lines = [f"{'stage':<24} {'calls':>8} {'total s':>10} {'mean ms':>10} {'max ms':>10}"]
+    for stage, s in snap["stages"].items():
+        lines.append(f"{stage:<24} {s['calls']:>8} {s['total_s']:>10.3f} {s['mean_ms']:>10.3f} {s['max_s'] * 1000:>10.3f}")
+    for name, value in snap["counters"].items():
+        lines.append(f"{name:<24} {value:>8}")
+    return "\n".join(lines)
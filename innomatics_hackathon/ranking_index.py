@@ -0,0 +1,299 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from contextlib import closing
+import resume_cache
+import upload_store
+from data_paths import data_path
+from text_extraction import source_name
+from ResumeJDMatching import (bcolors, CompiledJD, keyword_ratios, must_have_check, build_results,
+                              requirement_weight, current_scorer_version)
+
+# -----------------------------
+# Persistent per-JD ranking index (SQLite)
+# Every (JD, resume) pair is scored once and stored as its weighted keyword
+# ratio sum(weight * tf) / ||tf||_2. Within one JD the relevance score is that
+# ratio * 100 / total requirement weight, so ordering by ratio is ordering by
+# score and the (jd_id, score_ratio) index answers top-K and threshold queries
+# with an index range scan instead of a sort over every row. Resumes rejected
+# by the must-have filter are stored with score_ratio REJECTED and only their
+# must-have terms, so they rank last and never pass a threshold.
+# Rankings are keyed by the JD's requirements hash (jd.jd_hash), so JDs with
+# the same requirements share one ranking whatever their file names, and a
+# JD file whose requirements change never reads scores of the old ones.
+RANKING_DB = data_path("rankings.db")
+SCORE_BATCH = 64  # resumes scored and committed together while streaming
+REJECTED = -1.0
+
+class RankingIndex:
+    def __init__(self, db_path=RANKING_DB, cache=None):
+        self.db_path = db_path
+        self.cache = cache
+        self._lock = threading.Lock()
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript("""
+            -- jd_id = jd_hash; keywords: {"must_have": [...], "nice_to_have": [...], "scorer_version": ...}
+            CREATE TABLE IF NOT EXISTS ranked_jds (
+                jd_id TEXT PRIMARY KEY,
+                keywords TEXT,
+                updated_at REAL
+            );
+            -- requirements last registered under each JD name
+            CREATE TABLE IF NOT EXISTS ranked_jd_names (
+                jd_name TEXT PRIMARY KEY,
+                jd_id TEXT
+            );
+            CREATE TABLE IF NOT EXISTS rankings (
+                jd_id TEXT,
+                resume_hash TEXT,
+                candidate_name TEXT,
+                resume_path TEXT,
+                score_ratio REAL,
+                PRIMARY KEY (jd_id, resume_hash)
+            );
+            CREATE INDEX IF NOT EXISTS idx_rankings_score ON rankings(jd_id, score_ratio DESC);
+            -- JD keywords present in each ranked resume
+            CREATE TABLE IF NOT EXISTS ranking_terms (
+                jd_id TEXT,
+                term TEXT,
+                resume_hash TEXT,
+                PRIMARY KEY (jd_id, term, resume_hash)
+            );
+            CREATE INDEX IF NOT EXISTS idx_ranking_terms_resume ON ranking_terms(jd_id, resume_hash);
+            """)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    # (must_have, nice_to_have, scorer_version) of a registered JD
+    def _requirements(self, conn, jd_id):
+        row = conn.execute("SELECT keywords FROM ranked_jds WHERE jd_id = ?", (jd_id,)).fetchone()
+        if row is None:
+            return None
+        requirements = json.loads(row[0])
+        return requirements["must_have"], requirements["nice_to_have"], requirements["scorer_version"]
+
+    # -----------------------------
+    # Register a JD. Requirements already ranked (same jd_hash) are reused as
+    # they are. A JD name registered before with other requirements is a new
+    # version of that JD: its rankings are copied to the new hash (the old
+    # ones stay for any JD still using them) and, when only the nice-to-haves
+    # changed, only resumes that contain an added or removed keyword are
+    # re-scored: for every other resume the ratio and present terms are
+    # unchanged, and the new total weight is applied when scores are read.
+    # A change to the must-haves or to the scorer version re-scores every
+    # resume ranked for the JD.
+    def register_jd(self, jd):
+        with self._lock, closing(self._connect()) as conn, conn:
+            version = current_scorer_version()
+            current = self._requirements(conn, jd.jd_hash)
+            previous = conn.execute("SELECT jd_id FROM ranked_jd_names WHERE jd_name = ?", (jd.jd_name,)).fetchone()
+            conn.execute("INSERT OR REPLACE INTO ranked_jd_names VALUES (?, ?)", (jd.jd_name, jd.jd_hash))
+            conn.execute("INSERT OR REPLACE INTO ranked_jds VALUES (?, ?, ?)",
+                         (jd.jd_hash, json.dumps({"must_have": jd.must_have, "nice_to_have": jd.nice_to_have,
+                                                  "scorer_version": version}), time.time()))
+            if current is not None:
+                old = current
+            elif previous is not None and previous[0] != jd.jd_hash:
+                old = self._requirements(conn, previous[0])
+                if old is None:
+                    return 0
+                conn.execute("""
+                INSERT INTO rankings SELECT ?, resume_hash, candidate_name, resume_path, score_ratio
+                FROM rankings WHERE jd_id = ?
+                """, (jd.jd_hash, previous[0]))
+                conn.execute("INSERT INTO ranking_terms SELECT ?, term, resume_hash FROM ranking_terms WHERE jd_id = ?",
+                             (jd.jd_hash, previous[0]))
+            else:
+                return 0
+            if set(old[0]) == set(jd.must_have) and set(old[1]) == set(jd.nice_to_have) and old[2] == version:
+                return 0
+
+            rows = conn.execute("SELECT resume_hash, resume_path FROM rankings WHERE jd_id = ?",
+                                (jd.jd_hash,)).fetchall()
+            texts = {resume_hash: self._text(resume_hash, resume_path) for resume_hash, resume_path in rows}
+            lost = [h for h in texts if texts[h] is None]
+            if set(old[0]) != set(jd.must_have) or old[2] != version:
+                affected = [h for h in texts if texts[h] is not None]
+                if affected:
+                    self._score(conn, jd, [(h, None, None, texts[h]) for h in affected], replace=True)
+                self._forget(conn, jd.jd_hash, lost)
+                return len(affected)
+
+            old_keywords = old[0] + old[1]
+            removed = set(old_keywords) - set(jd.keywords)
+            added = sorted(set(jd.keywords) - set(old_keywords))
+            affected = set()
+            for term in removed:
+                affected.update(row[0] for row in conn.execute(
+                    "SELECT resume_hash FROM ranking_terms WHERE jd_id = ? AND term = ?", (jd.jd_hash, term)))
+            conn.executemany("DELETE FROM ranking_terms WHERE jd_id = ? AND term = ?",
+                             [(jd.jd_hash, term) for term in removed])
+
+            if added:
+                # One pass over the stored texts, restricted to the added terms
+                hashes = [h for h in texts if texts[h] is not None]
+                _, presence = keyword_ratios([texts[h] for h in hashes], [CompiledJD("added", added)])
+                affected.update(h for h, present in zip(hashes, presence[0]) if present.any())
+
+            # A resume whose text is gone may hold an added term, so it cannot
+            # be kept when terms were added
+            self._forget(conn, jd.jd_hash, lost if added else [h for h in affected if texts.get(h) is None])
+            affected = [h for h in affected if texts.get(h) is not None]
+            if affected:
+                self._score(conn, jd, [(h, None, None, texts[h]) for h in affected], replace=True)
+            return len(affected)
+
+    # Drop rankings that cannot be re-scored (text no longer in the cache, on
+    # disk or in the upload store): the next add_resumes with these resumes
+    # scores them again instead of treating the stale rows as up to date
+    def _forget(self, conn, jd_id, resume_hashes):
+        for table in ("rankings", "ranking_terms"):
+            conn.executemany(f"DELETE FROM {table} WHERE jd_id = ? AND resume_hash = ?",
+                             [(jd_id, h) for h in resume_hashes])
+
+    def _text(self, resume_hash, resume_path):
+        cache = self.cache if self.cache is not None else resume_cache.get_default_cache()
+        entry = cache.get(resume_hash) if cache else None
+        if entry is not None:
+            return entry["text"]
+        # In-memory uploads have no path; use their content-addressed copy if one was kept
+        resume_path = resume_path if resume_path and os.path.exists(resume_path) else upload_store.find_upload(resume_hash)
+        if resume_path:
+            return resume_cache.load_resume(resume_path, self.cache)["text"]
+        return None
+
+    # Must-haves first: only the resumes that pass the filter are vectorized
+    def _score(self, conn, jd, resumes, replace=False):
+        texts = [text for _, _, _, text in resumes]
+        eligible, found = must_have_check(texts, [jd])
+        passed = [i for i in range(len(resumes)) if eligible[i, 0]]
+        ratios, presence = {}, {}
+        if passed:
+            passed_ratios, passed_presence = keyword_ratios([texts[i] for i in passed], [jd])
+            for row, i in enumerate(passed):
+                ratios[i] = float(passed_ratios[row, 0])
+                presence[i] = [kw for kw, present in zip(jd.keywords, passed_presence[0][row]) if present]
+
+        for i, (resume_hash, candidate_name, resume_path, _) in enumerate(resumes):
+            score_ratio = ratios.get(i, REJECTED)
+            terms = presence[i] if i in presence else [kw for kw in jd.must_have if kw in found[i]]
+            if replace:
+                conn.execute("UPDATE rankings SET score_ratio = ? WHERE jd_id = ? AND resume_hash = ?",
+                             (score_ratio, jd.jd_hash, resume_hash))
+                conn.execute("DELETE FROM ranking_terms WHERE jd_id = ? AND resume_hash = ?",
+                             (jd.jd_hash, resume_hash))
+            else:
+                conn.execute("INSERT OR REPLACE INTO rankings VALUES (?, ?, ?, ?, ?)",
+                             (jd.jd_hash, resume_hash, candidate_name, resume_path, score_ratio))
+            conn.executemany("INSERT OR IGNORE INTO ranking_terms VALUES (?, ?, ?)",
+                             [(jd.jd_hash, kw, resume_hash) for kw in terms])
+
+    # -----------------------------
+    # Add resumes (paths or in-memory (name, bytes) uploads) for a JD; resumes
+    # already ranked for it (same content hash) are not scored again.
+    # Returns the number of newly scored resumes.
+    def add_resumes(self, jd, resume_paths, workers=None):
+        scored = 0
+        for _, scored in self.iter_add_resumes(jd, resume_paths, workers):
+            pass
+        return scored
+
+    # Streaming version: texts are scored and committed SCORE_BATCH at a time
+    # as extraction finishes them, so top_k() already sees partial results and
+    # only one batch of text is held in memory. Yields (processed, scored)
+    # running totals after every resume; processed includes already-ranked
+    # and skipped resumes.
+    def iter_add_resumes(self, jd, resume_paths, workers=None, batch_size=SCORE_BATCH):
+        self.register_jd(jd)
+        hashes = {path: resume_cache.content_hash(path) for path in resume_paths}
+        with closing(self._connect()) as conn:
+            known = {row[0] for row in conn.execute(
+                "SELECT resume_hash FROM rankings WHERE jd_id = ?", (jd.jd_hash,))}
+        new_paths = [path for path in resume_paths if hashes[path] not in known]
+        processed, scored = len(resume_paths) - len(new_paths), 0
+        yield processed, scored
+
+        resumes = []
+        for path, text, error in resume_cache.extract_texts(new_paths, workers, self.cache):
+            processed += 1
+            if error:
+                print(f"{bcolors.WARNING}⚠️ Skipping {source_name(path)}: {error}{bcolors.ENDC}")
+            else:
+                resume_path = os.path.abspath(path) if isinstance(path, str) else None
+                resumes.append((hashes[path], source_name(path), resume_path, text))
+            if len(resumes) >= batch_size:
+                scored += self._score_batch(jd, resumes)
+                resumes = []
+            yield processed, scored
+        if resumes:
+            scored += self._score_batch(jd, resumes)
+            yield processed, scored
+
+    def _score_batch(self, jd, resumes):
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._score(conn, jd, resumes)
+        return len(resumes)
+
+    # -----------------------------
+    # Queries, by jd_id = jd.jd_hash
+    def _results(self, conn, jd_id, rows):
+        import numpy as np
+        if not rows:
+            return []
+        must_have, nice_to_have, version = self._requirements(conn, jd_id) or ([], [], None)
+        keywords = must_have + nice_to_have
+        # Same cache key as the other scoring paths, for the evaluation store
+        key = {"jd_hash": jd_id, "scorer_version": version}
+        total_weight = requirement_weight(len(must_have), len(nice_to_have))
+        # Terms found per resume -> presence matrix; fit labels, missing
+        # keywords and feedback come from the batch post-processing step
+        presence = np.zeros((len(rows), len(keywords)), dtype=bool)
+        missing_must_have = []
+        column = {kw: k for k, kw in enumerate(keywords)}
+        for r, (resume_hash, _, score_ratio) in enumerate(rows):
+            present = {row[0] for row in conn.execute(
+                "SELECT term FROM ranking_terms WHERE jd_id = ? AND resume_hash = ?", (jd_id, resume_hash))}
+            presence[r, [column[kw] for kw in present if kw in column]] = True
+            missing_must_have.append([kw for kw in must_have if kw not in present] if score_ratio < 0 else None)
+        ratios = np.array([score_ratio for _, _, score_ratio in rows], dtype=np.float64)
+        relevance = ratios * 100 / total_weight if total_weight else np.zeros(len(rows))
+        results = build_results([candidate_name for _, candidate_name, _ in rows], keywords, relevance, presence, missing_must_have)
+        return [{"candidate_name": result["candidate_name"], "resume_hash": resume_hash, **result, **key}
+                for (resume_hash, _, _), result in zip(rows, results)]
+
+    def top_k(self, jd_id, k=3):
+        with closing(self._connect()) as conn:
+            rows = conn.execute("""
+            SELECT resume_hash, candidate_name, score_ratio FROM rankings
+            WHERE jd_id = ? ORDER BY score_ratio DESC LIMIT ?
+            """, (jd_id, k)).fetchall()
+            return self._results(conn, jd_id, rows)
+
+    def at_least(self, jd_id, threshold, limit=None):
+        with closing(self._connect()) as conn:
+            must_have, nice_to_have, _ = self._requirements(conn, jd_id) or ([], [], None)
+            min_ratio = max(threshold * requirement_weight(len(must_have), len(nice_to_have)) / 100, 0.0)
+            rows = conn.execute("""
+            SELECT resume_hash, candidate_name, score_ratio FROM rankings
+            WHERE jd_id = ? AND score_ratio >= ? ORDER BY score_ratio DESC LIMIT ?
+            """, (jd_id, min_ratio, -1 if limit is None else limit)).fetchall()
+            return self._results(conn, jd_id, rows)
+
+    def results_for(self, jd_id, resume_paths):
+        return list(self.iter_results_for(jd_id, resume_paths))
+
+    # One result at a time, in resume_paths order
+    def iter_results_for(self, jd_id, resume_paths):
+        with closing(self._connect()) as conn:
+            for path in resume_paths:
+                row = conn.execute("""
+                SELECT resume_hash, candidate_name, score_ratio FROM rankings
+                WHERE jd_id = ? AND resume_hash = ?
+                """, (jd_id, resume_cache.content_hash(path))).fetchone()
+                if row is not None:
+                    yield from self._results(conn, jd_id, [row])
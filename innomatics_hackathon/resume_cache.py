@@ -0,0 +1,223 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import text_extraction
+from data_paths import data_path
+import metrics
+
+# -----------------------------
+# Cache location and size bound
+CACHE_DB = data_path("cache", "resume_cache.db")
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# The table size is summed once on open and then tracked as entries are
+# written; it is summed again (other processes write to the same file) only
+# when the running total passes max_bytes or every EVICT_CHECK_EVERY puts
+EVICT_CHECK_EVERY = 256
+
+# Bump when extraction/parsing output changes in a way the source fingerprint
+# below cannot see (e.g. a PyMuPDF upgrade).
+PARSER_VERSION = "1"
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PARSER_SOURCES = [
+    os.path.join(HERE, "text_extraction.py"),
+    os.path.join(HERE, "skill_matcher.py"),
+    os.path.join(HERE, "resume_parser.py"),
+]
+
+# -----------------------------
+# Parser version key: manual version + hash of the parser source files, so
+# editing any extract_* function invalidates old entries automatically
+def parser_version():
+    digest = hashlib.sha256(PARSER_VERSION.encode())
+    for path in PARSER_SOURCES:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+# Hash of a file path, PDF bytes / memoryview or a (name, bytes) pair
+def content_hash(data):
+    if isinstance(data, tuple):
+        data = data[1]
+    if isinstance(data, str):
+        digest = hashlib.sha256()
+        with open(data, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+# -----------------------------
+# Parsed sections come from resume_parser (imported on first miss)
+def parse_sections(file_name, text):
+    from resume_parser import parse_resume
+    parsed = parse_resume(file_name, text)
+    parsed.pop("full_text", None)
+    parsed.pop("file_name", None)
+    return parsed
+
+def _text_and_sections(file_name, text):
+    return text, parse_sections(file_name, text)
+
+# -----------------------------
+# Content-addressed, size-bounded LRU cache of extracted text + parsed fields
+class ResumeCache:
+    def __init__(self, db_path=CACHE_DB, max_bytes=CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.version = parser_version()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = self.connection()
+        with conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS resume_cache (
+                content_hash TEXT,
+                parser_version TEXT,
+                text TEXT,
+                parsed TEXT,
+                size INTEGER,
+                last_access REAL,
+                PRIMARY KEY (content_hash, parser_version)
+            )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_resume_cache_access ON resume_cache(last_access)")
+            # Entries written by an older parser can never be hit again
+            conn.execute("DELETE FROM resume_cache WHERE parser_version != ?", (self.version,))
+            self._total = self._stored_bytes(conn)
+        self._puts = 0
+
+    # Per-thread connection, opened on first use in that thread. WAL: bulk
+    # workers and work_queue.py processes share this file, and readers then
+    # never block on a writer
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self.connection()
+        with conn:
+            row = conn.execute(
+                "SELECT text, parsed FROM resume_cache WHERE content_hash = ? AND parser_version = ?",
+                (key, self.version)).fetchone()
+            if row is None:
+                with self._lock:
+                    self.misses += 1
+                metrics.count("cache_misses")
+                return None
+            conn.execute(
+                "UPDATE resume_cache SET last_access = ? WHERE content_hash = ? AND parser_version = ?",
+                (time.time(), key, self.version))
+        with self._lock:
+            self.hits += 1
+        metrics.count("cache_hits")
+        return {"text": row[0], "parsed": json.loads(row[1])}
+
+    def put(self, key, text, parsed):
+        parsed_json = json.dumps(parsed, ensure_ascii=False)
+        size = len(text.encode("utf-8")) + len(parsed_json.encode("utf-8"))
+        conn = self.connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resume_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, self.version, text, parsed_json, size, time.time()))
+            with self._lock:
+                self._total += size
+                self._puts += 1
+                check = self._total > self.max_bytes or self._puts >= EVICT_CHECK_EVERY
+                if check:
+                    self._puts = 0
+            if check:
+                self._evict(conn)
+
+    def _stored_bytes(self, conn):
+        return conn.execute("SELECT COALESCE(SUM(size), 0) FROM resume_cache").fetchone()[0]
+
+    def _evict(self, conn):
+        total = self._stored_bytes(conn)
+        if total <= self.max_bytes:
+            self._total = total
+            return
+        stale = []
+        for key, version, size in conn.execute(
+                "SELECT content_hash, parser_version, size FROM resume_cache ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key, version))
+            total -= size
+        conn.executemany("DELETE FROM resume_cache WHERE content_hash = ? AND parser_version = ?", stale)
+        self._total = total
+
+# -----------------------------
+# Shared default cache (created on first use)
+_default_cache = None
+
+def get_default_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResumeCache()
+    return _default_cache
+
+def _resolve(cache):
+    if cache is False:
+        return None
+    return cache or get_default_cache()
+
+# -----------------------------
+# Load one resume (path, bytes or (name, bytes), any supported format):
+# cached entry on a hit, extract + parse + store on a miss
+def load_resume(source, cache=None):
+    cache = _resolve(cache)
+    key = content_hash(source) if cache else None
+    entry = cache.get(key) if cache else None
+    if entry is None:
+        text = text_extraction.extract_text(source)
+        name = "resume.pdf" if isinstance(source, (bytes, bytearray, memoryview)) else text_extraction.source_name(source)
+        entry = {"text": text, "parsed": parse_sections(name, text)}
+        if cache:
+            cache.put(key, entry["text"], entry["parsed"])
+    return entry
+
+# -----------------------------
+# Cache-aware version of text_extraction.extract_texts (paths or
+# (name, bytes) pairs): hits are yielded straight away, only misses go to
+# the process pool
+def extract_texts(sources, workers=None, cache=None):
+    cache = _resolve(cache)
+    if not cache:
+        yield from text_extraction.extract_texts(sources, workers)
+        return
+
+    keys = {}  # id(source) -> content hash; extract_texts yields the same objects back
+    misses = []
+    for source in sources:
+        key = content_hash(source)
+        entry = cache.get(key)
+        if entry is None:
+            keys[id(source)] = key
+            misses.append(source)
+        else:
+            yield source, entry["text"], None
+
+    # Misses are parsed in the pool worker that extracted them
+    for source, entry, error in text_extraction.extract_texts(misses, workers, parse=_text_and_sections):
+        if error:
+            yield source, None, error
+            continue
+        text, parsed = entry
+        cache.put(keys[id(source)], text, parsed)
+        yield source, text, error
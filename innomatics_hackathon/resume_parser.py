@@ -0,0 +1,148 @@
+import os
+import re
+import bisect
+import metrics
+from text_extraction import extract_text, iter_folder_texts
+from skill_matcher import SkillMatcher, load_skills
+
+# Resume parsing library: importing this module is cheap. The skill matcher
+# and the per-format extractors (text_extraction) are loaded on first use;
+# no NLP model is needed.
+
+# ----------------------------
+# 1. Predefined skill list
+# ----------------------------
+SKILLS = [
+    "python", "sql", "excel", "tableau", "power bi", "aws", "docker",
+    "pandas", "numpy", "matplotlib", "seaborn", "spark", "pytorch",
+    "tensorflow", "java", "c++", "machine learning", "data analysis",
+    "powerpoint", "git", "kafka"
+]
+
+# Compiled on first use; finds every skill in a single pass with word
+# boundaries. SKILLS_FILE can add a full taxonomy (one skill per line).
+_skill_matcher = None
+
+def get_skill_matcher():
+    global _skill_matcher
+    if _skill_matcher is None:
+        skills = SKILLS
+        if os.environ.get("SKILLS_FILE"):
+            skills = skills + load_skills(os.environ["SKILLS_FILE"])
+        _skill_matcher = SkillMatcher(skills)
+    return _skill_matcher
+
+# ----------------------------
+# 2. Helper functions
+# ----------------------------
+def extract_text_from_docx(file_path):
+    return extract_text(file_path)
+
+def clean_text(text):
+    text = re.sub(r"\n+", "\n", text)
+    text = re.sub(r"\s+", " ", text)
+    text = text.strip()
+    return text.lower()
+
+# Same normalisation per line, keeping the line structure (empty lines dropped)
+def clean_lines(text):
+    return [line for line in (" ".join(raw.split()).lower() for raw in text.splitlines()) if line]
+
+def extract_skills(text):
+    return [skill.title() for skill in get_skill_matcher().find_skills(text)]
+
+# ----------------------------
+# Section scanner: one compiled alternation for every section keyword, run
+# once per line. Education pairs a degree / institution with the first year
+# after it, on the same line or within the next YEAR_LOOKAHEAD_LINES lines;
+# the other sections keep the whole line that mentions one of their keywords.
+# ----------------------------
+DEGREE_KEYWORDS = ["b\\.sc", "bsc", "b\\.tech", "be", "m\\.sc", "msc", "m\\.tech", "mba", "phd"]
+INSTITUTION_KEYWORDS = ["university", "college", "institute"]
+SECTION_KEYWORDS = {
+    "certifications": ["certificate", "certified", "certification", "achieved"],
+    "experience": ["worked at", "experience", "internship", "role as", "responsible for"],
+    "projects": ["project", "capstone", "initiative"],
+}
+SECTION_PATTERN = re.compile("|".join(
+    [r"(?P<degree>\b(?:%s)\b)" % "|".join(DEGREE_KEYWORDS),
+     r"(?P<institution>\b(?:%s)\b)" % "|".join(INSTITUTION_KEYWORDS)] +
+    [r"(?P<%s>%s)" % (section, "|".join(keywords)) for section, keywords in SECTION_KEYWORDS.items()]))
+YEAR_PATTERN = re.compile(r"\d{4}")
+YEAR_LOOKAHEAD_LINES = 3
+
+def extract_sections(text):
+    lines = clean_lines(text)
+    found = {"education": {}, **{section: {} for section in SECTION_KEYWORDS}}
+    # Year positions per line, found once and searched with bisect
+    years = {}
+    def year_after(line_no, pos):
+        if line_no not in years:
+            matches = list(YEAR_PATTERN.finditer(lines[line_no]))
+            years[line_no] = ([m.start() for m in matches], matches)
+        starts, matches = years[line_no]
+        i = bisect.bisect_left(starts, pos)
+        return matches[i] if i < len(matches) else None
+
+    # Degree / institution matches before this (line, offset) were already
+    # paired with a year, like the original non-overlapping regex scan
+    consumed = {"degree": (0, 0), "institution": (0, 0)}
+    for i, line in enumerate(lines):
+        years.pop(i - 1, None)
+        for m in SECTION_PATTERN.finditer(line):
+            kind = m.lastgroup
+            if kind not in consumed:
+                found[kind][line] = None
+                continue
+            if (i, m.start()) < consumed[kind]:
+                continue
+            year_line, year = i, year_after(i, m.end())
+            while year is None and year_line < min(i + YEAR_LOOKAHEAD_LINES, len(lines) - 1):
+                year_line += 1
+                year = year_after(year_line, 0)
+            if year:
+                consumed[kind] = (year_line, year.end())
+                found["education"][f"{m.group(kind)} {year.group()}".title()] = None
+    return {section: list(matches) for section, matches in found.items()}
+
+def extract_education(text):
+    return extract_sections(text)["education"]
+
+def extract_certifications(text):
+    return extract_sections(text)["certifications"]
+
+def extract_experience(text):
+    return extract_sections(text)["experience"]
+
+def extract_projects(text):
+    return extract_sections(text)["projects"]
+
+# ----------------------------
+# 3. Parsing
+# ----------------------------
+def parse_resume(file_name, text):
+    with metrics.timer("parse_resume"):
+        cleaned_text = clean_text(text)
+        sections = extract_sections(text)
+        parsed = {
+            "file_name": file_name,
+            "full_text": cleaned_text,
+            "skills": extract_skills(cleaned_text),
+            "education": sections["education"],
+            "experience": sections["experience"],
+            "projects": sections["projects"],
+            "certifications": sections["certifications"]
+        }
+    metrics.count("resumes_parsed")
+    return parsed
+
+# Generator over the input folder: yields one parsed record per resume as it
+# completes, skipping file names listed in `skip`. Every supported format
+# (PDF, DOCX, TXT, HTML) goes through the shared extraction pool, and each
+# resume is parsed in the same worker that extracted it.
+def iter_parsed_resumes(input_folder, skip=(), workers=None):
+    for file_name, parsed, error in iter_folder_texts(input_folder, skip, workers, parse=parse_resume):
+        if error:
+            print(f"Skipping {file_name}: {error}")
+            continue
+        yield parsed
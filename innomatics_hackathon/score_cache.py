@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+import metrics
+from data_paths import data_path
+
+# -----------------------------
+# Score cache: one result per (resume content hash, JD requirements hash,
+# scorer version), so a resume checked against the same JD again (a
+# Streamlit rerun, the bulk path after a single check, a repeated API call)
+# is never scored twice.
+#   tier 1 : in-process LRU of the last SCORE_LRU_SIZE results
+#   tier 2 : SQLite table shared by every process (dashboard, API, scripts)
+# Results are stored without the candidate and JD names, which come from
+# the file names of the current inputs.
+SCORE_CACHE_DB = data_path("cache", "score_cache.db")
+SCORE_LRU_SIZE = 4096
+
+# Entries of other scorer versions are kept, since processes with different
+# settings (RESUME_HARD_FILTER) share this file. On open, a version nothing
+# has been written for in STALE_VERSION_DAYS is dropped, and past
+# SCORE_CACHE_MAX_ROWS the oldest rows go first.
+STALE_VERSION_DAYS = 30
+SCORE_CACHE_MAX_ROWS = 2_000_000
+
+# Bump when scoring changes in a way the source fingerprint below cannot see
+SCORER_VERSION = "1"
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCORER_SOURCES = [
+    os.path.join(HERE, "ResumeJDMatching.py"),
+    os.path.join(HERE, "skill_matcher.py"),
+    os.path.join(HERE, "text_extraction.py"),
+]
+
+_versions = {}
+
+# -----------------------------
+# Scorer version key: manual version + hash of the scoring source files +
+# whether the must-have hard filter is on (it changes every rejected result)
+def scorer_version(hard_filter=True):
+    if hard_filter not in _versions:
+        digest = hashlib.sha256(f"{SCORER_VERSION}:{int(hard_filter)}".encode())
+        for path in SCORER_SOURCES:
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+        _versions[hard_filter] = digest.hexdigest()[:16]
+    return _versions[hard_filter]
+
+class ScoreCache:
+    def __init__(self, version, db_path=SCORE_CACHE_DB, lru_size=SCORE_LRU_SIZE):
+        self.version = version
+        self.db_path = db_path
+        self.lru_size = lru_size
+        self._lru = OrderedDict()
+        self._lru_lock = threading.Lock()
+        self._local = threading.local()
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = self.connection()
+        with conn:
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS score_cache (
+                resume_hash TEXT,
+                jd_hash TEXT,
+                scorer_version TEXT,
+                result TEXT,
+                created_at REAL,
+                PRIMARY KEY (resume_hash, jd_hash, scorer_version)
+            )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_score_cache_version ON score_cache(scorer_version, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_score_cache_created ON score_cache(created_at)")
+            self._evict(conn)
+
+    def _evict(self, conn):
+        cutoff = time.time() - STALE_VERSION_DAYS * 24 * 3600
+        stale = [(version,) for version, in conn.execute(
+            "SELECT scorer_version FROM score_cache GROUP BY scorer_version HAVING MAX(created_at) < ?", (cutoff,))
+            if version != self.version]
+        conn.executemany("DELETE FROM score_cache WHERE scorer_version = ?", stale)
+        excess = conn.execute("SELECT COUNT(*) FROM score_cache").fetchone()[0] - SCORE_CACHE_MAX_ROWS
+        if excess > 0:
+            conn.execute("DELETE FROM score_cache WHERE rowid IN "
+                         "(SELECT rowid FROM score_cache ORDER BY created_at, rowid LIMIT ?)", (excess,))
+
+    # Per-thread connection, opened on first use in that thread
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -----------------------------
+    # Lookup: memory first, then SQLite (promoted into memory on a hit).
+    # Returns a fresh copy of the stored result, or None.
+    def get(self, resume_hash, jd_hash):
+        key = (resume_hash, jd_hash)
+        with self._lru_lock:
+            result = self._lru.get(key)
+            if result is not None:
+                self._lru.move_to_end(key)
+        if result is not None:
+            metrics.count("score_cache_memory_hits")
+            return dict(result)
+
+        row = self.connection().execute(
+            "SELECT result FROM score_cache WHERE resume_hash = ? AND jd_hash = ? AND scorer_version = ?",
+            (resume_hash, jd_hash, self.version)).fetchone()
+        if row is None:
+            metrics.count("score_cache_misses")
+            return None
+        metrics.count("score_cache_db_hits")
+        result = json.loads(row[0])
+        self._remember(key, result)
+        return dict(result)
+
+    # -----------------------------
+    # Store: [(resume_hash, jd_hash, result), ...] in one transaction
+    def put_many(self, entries):
+        rows = []
+        for resume_hash, jd_hash, result in entries:
+            result = {k: v for k, v in result.items() if k not in ("candidate_name", "jd_name")}
+            self._remember((resume_hash, jd_hash), result)
+            rows.append((resume_hash, jd_hash, self.version, json.dumps(result, ensure_ascii=False), time.time()))
+        conn = self.connection()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO score_cache VALUES (?, ?, ?, ?, ?)", rows)
+
+    def put(self, resume_hash, jd_hash, result):
+        self.put_many([(resume_hash, jd_hash, result)])
+
+    def _remember(self, key, result):
+        with self._lru_lock:
+            self._lru[key] = result
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+# -----------------------------
+# Shared default cache per scorer version (created on first use)
+_default_caches = {}
+
+def get_default_score_cache(version):
+    if version not in _default_caches:
+        _default_caches[version] = ScoreCache(version)
+    return _default_caches[version]
+
+# score_cache argument convention: None = default cache, False = no caching
+def resolve_score_cache(score_cache, version):
+    if score_cache is False:
+        return None
+    return score_cache or get_default_score_cache(version)
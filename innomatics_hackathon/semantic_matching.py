@@ -0,0 +1,232 @@
+import os
+import re
+import json
+import zlib
+from contextlib import contextmanager
+import resume_cache
+from text_extraction import source_name
+from data_paths import data_path
+from ResumeJDMatching import bcolors, load_jds, build_results, HARD_FILTER, CONSOLE
+
+# -----------------------------
+# Semantic scoring mode
+# Resumes are split into short chunks and encoded on CPU in batches. The chunk
+# embeddings are appended to a float32 file on disk and read back through a
+# memory map, keyed by resume content hash, so a resume is never encoded
+# twice. Scoring is one matrix multiply of every stored chunk against every
+# JD requirement, followed by a per-resume max over its chunks.
+#
+# The encoder is sentence-transformers (requirements.txt) by default. Set
+# RESUME_ENCODER=hashing to use the deterministic, dependency-free stand-in
+# (no model download, no network), e.g. for tests and air-gapped machines.
+DEFAULT_MODEL = os.environ.get("RESUME_ENCODER", "all-MiniLM-L6-v2")
+EMBEDDING_DIR = data_path("cache", "embeddings")
+BATCH_SIZE = 64
+CHUNK_WORDS = 40
+MATCH_THRESHOLD = 0.5  # a requirement counts as covered at this cosine similarity
+
+# -----------------------------
+# Encoders: encode(list of str) -> float32 array (n, dim), rows l2-normalised
+class SentenceTransformerEncoder:
+    def __init__(self, model_name=DEFAULT_MODEL):
+        from sentence_transformers import SentenceTransformer
+        self.name = model_name
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dim = self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts):
+        return self.model.encode(texts, batch_size=BATCH_SIZE, convert_to_numpy=True,
+                                 normalize_embeddings=True, show_progress_bar=False).astype("float32")
+
+class HashingEncoder:
+    # Signed feature hashing of words and character trigrams; deterministic
+    # across processes (crc32, not Python's salted hash)
+    def __init__(self, dim=384):
+        self.name = "hashing"
+        self.dim = dim
+
+    def encode(self, texts):
+        import numpy as np
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in re.findall(r"\w[\w+#.]*", text.lower()):
+                features = [word] + [word[j:j + 3] for j in range(max(1, len(word) - 2))]
+                for feature in features:
+                    h = zlib.crc32(feature.encode("utf-8"))
+                    out[i, h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+_encoders = {}
+
+def get_encoder(model_name=DEFAULT_MODEL):
+    if model_name not in _encoders:
+        _encoders[model_name] = HashingEncoder() if model_name == "hashing" else SentenceTransformerEncoder(model_name)
+    return _encoders[model_name]
+
+# -----------------------------
+# Split resume text into chunks of at most CHUNK_WORDS words, keeping lines
+# and sentences together where possible
+def split_chunks(text, max_words=CHUNK_WORDS):
+    chunks, current = [], []
+    for piece in re.split(r"[\n\r]+|(?<=[.;!?])\s+", text):
+        words = piece.split()
+        while words:
+            room = max_words - len(current)
+            if room <= 0:
+                chunks.append(" ".join(current))
+                current, room = [], max_words
+            current.extend(words[:room])
+            words = words[room:]
+    if current:
+        chunks.append(" ".join(current))
+    return chunks or [""]
+
+# -----------------------------
+# Exclusive lock on a file next to the index, held by a writer from reading
+# index.json to saving it again, so two processes adding to the same index
+# never interleave their appends
+@contextmanager
+def index_lock(path):
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+# -----------------------------
+# Persisted embedding index for one encoder
+#   embeddings.f32 : every chunk vector, appended, read through np.memmap
+#   index.json     : dim, row count and resume hash -> [first_row, end_row)
+# The vector file is only ever appended to. Rows past index.json's count
+# (an interrupted writer) are left in place and new rows go after them, so
+# opening an index never cuts off another process's write in progress.
+class EmbeddingIndex:
+    def __init__(self, encoder=None, index_dir=EMBEDDING_DIR):
+        self.encoder = encoder or get_encoder()
+        self.dir = os.path.join(index_dir, re.sub(r"[^\w.-]+", "_", self.encoder.name))
+        os.makedirs(self.dir, exist_ok=True)
+        self.data_path = os.path.join(self.dir, "embeddings.f32")
+        self.meta_path = os.path.join(self.dir, "index.json")
+        self.lock_path = os.path.join(self.dir, "index.lock")
+        self._load_meta()
+
+    def _load_meta(self):
+        self.meta = {"dim": self.encoder.dim, "rows": 0, "resumes": {}}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                self.meta = json.load(f)
+
+    def __contains__(self, resume_hash):
+        return resume_hash in self.meta["resumes"]
+
+    def vectors(self):
+        import numpy as np
+        if self.meta["rows"] == 0:
+            return np.zeros((0, self.meta["dim"]), dtype=np.float32)
+        return np.memmap(self.data_path, dtype=np.float32, mode="r", shape=(self.meta["rows"], self.meta["dim"]))
+
+    # Encode and append resumes not stored yet: [(resume_hash, text), ...]
+    def add(self, resumes):
+        import numpy as np
+        row_bytes = self.meta["dim"] * 4
+        with index_lock(self.lock_path):
+            # Another process may have added resumes since this index was opened
+            self._load_meta()
+            new = [(h, text) for h, text in dict(resumes).items() if h not in self]
+            for start in range(0, len(new), BATCH_SIZE):
+                batch = new[start:start + BATCH_SIZE]
+                chunks = [split_chunks(text) for _, text in batch]
+                vectors = self.encoder.encode([chunk for resume_chunks in chunks for chunk in resume_chunks])
+                with open(self.data_path, "ab") as f:
+                    # Start on a whole row after anything a crashed writer left
+                    end = f.seek(0, os.SEEK_END)
+                    f.write(np.zeros(-end % row_bytes, dtype=np.uint8).tobytes())
+                    row = (end + row_bytes - 1) // row_bytes
+                    f.write(vectors.astype("float32").tobytes())
+                for (resume_hash, _), resume_chunks in zip(batch, chunks):
+                    self.meta["resumes"][resume_hash] = [row, row + len(resume_chunks)]
+                    row += len(resume_chunks)
+                self.meta["rows"] = row
+                self._save_meta()
+        return len(new)
+
+    def _save_meta(self):
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+    # -----------------------------
+    # Similarity of every given resume against every requirement:
+    # returns (n_resumes, n_requirements) max-over-chunks cosine similarity
+    def similarity(self, resume_hashes, requirement_vectors):
+        import numpy as np
+        spans = [self.meta["resumes"][h] for h in resume_hashes]
+        vectors = self.vectors()
+        rows = np.concatenate([np.arange(start, end) for start, end in spans])
+        chunk_sims = np.asarray(vectors[rows]) @ requirement_vectors.T
+        offsets = np.cumsum([0] + [end - start for start, end in spans[:-1]])
+        return np.maximum.reduceat(chunk_sims, offsets, axis=0)
+
+# -----------------------------
+# Evaluate every resume against every JD semantically; same result shape as
+# ResumeJDMatching.evaluate_multiple_resumes (missing = uncovered requirements,
+# same requirement weights, rejected when a must-have is not covered)
+def evaluate_multiple_resumes_semantic(resume_files, jd_files, index=None, workers=None, cache=None):
+    import numpy as np
+
+    index = index or EmbeddingIndex()
+    jds = load_jds(jd_files)
+    if not resume_files or not jds:
+        raise FileNotFoundError(f"{bcolors.FAIL}⚠️ Need at least one resume and one JD{bcolors.ENDC}")
+
+    hashes = {path: resume_cache.content_hash(path) for path in resume_files}
+    missing_paths = [path for path in resume_files if hashes[path] not in index]
+    texts = []
+    for path, text, error in resume_cache.extract_texts(missing_paths, workers, cache):
+        if error:
+            print(f"{bcolors.WARNING}⚠️ Skipping {source_name(path)}: {error}{bcolors.ENDC}")
+            continue
+        texts.append((hashes[path], text))
+    index.add(texts)
+    resume_files = [path for path in resume_files if hashes[path] in index]
+    if not resume_files:
+        raise ValueError(f"{bcolors.FAIL}⚠️ No resumes could be read{bcolors.ENDC}")
+
+    # All JD requirements encoded in one batch, then one multiply for everything
+    requirements = [kw for jd in jds for kw in jd.keywords]
+    requirement_vectors = index.encoder.encode(requirements)
+    sims = index.similarity([hashes[path] for path in resume_files], requirement_vectors)
+    covered = sims >= MATCH_THRESHOLD
+
+    names = [source_name(path) for path in resume_files]
+    results = []
+    start = 0
+    for jd in jds:
+        end = start + len(jd.keywords)
+        scores = np.clip(sims[:, start:end], 0, 1) @ jd.weights / jd.total_weight * 100
+        must_have_covered = covered[:, start:start + len(jd.must_have)]
+        missing_must_have = None
+        if HARD_FILTER and jd.must_have:
+            missing_must_have = [[kw for kw, ok in zip(jd.must_have, row) if not ok] for row in must_have_covered]
+        for result in build_results(names, jd.keywords, scores, covered[:, start:end], missing_must_have):
+            results.append({"candidate_name": result["candidate_name"], "jd_name": jd.jd_name, **result,
+                            "scoring": "semantic"})
+        start = end
+
+    if CONSOLE != "off":
+        print(f"\n{bcolors.OKGREEN}✅ Semantic evaluation of {len(resume_files)} resumes against {len(jds)} JDs{bcolors.ENDC}")
+    return results
@@ -0,0 +1,266 @@
+import os
+import re
+import json
+import threading
+from jsonl_pipeline import iter_records
+from column_store import iter_corpus
+from data_paths import data_path
+
+# -----------------------------
+# Inverted skill index over the parsed-resume pool (resumeparsingscript.py
+# output, JSON Lines or column store): skill -> sorted array of resume ids.
+#   ids.jsonl     : file name of every resume id, appended (id = line number)
+#   postings.u32  : every posting list back to back, uint32 resume ids
+#   skills.json   : skill -> [offset, count] into postings.u32, written last
+# Resume ids only grow, so adding resumes appends to the end of each list and
+# the lists stay sorted. Queries are boolean expressions over skills:
+#   python AND spark AND NOT java
+#   (sql OR postgresql) AND "machine learning"
+# evaluated with sorted-array intersections / unions / differences.
+# One process writes an index directory; inside it, add_records is
+# serialized by a lock and queries read a consistent (ids, skills, postings)
+# snapshot, so the app and dashboard can share one instance across threads.
+SKILL_INDEX_DIR = data_path("cache", "skill_index")
+
+def normalize_skill(skill):
+    return " ".join(skill.lower().split())
+
+class SkillIndex:
+    def __init__(self, index_dir=SKILL_INDEX_DIR):
+        self.dir = index_dir
+        os.makedirs(self.dir, exist_ok=True)
+        self.ids_path = os.path.join(self.dir, "ids.jsonl")
+        self.postings_path = os.path.join(self.dir, "postings.u32")
+        self.skills_path = os.path.join(self.dir, "skills.json")
+
+        # skills.json is the commit point: ids after its count come from an
+        # interrupted add and are dropped
+        self.meta = {"count": 0, "skills": {}}
+        if os.path.exists(self.skills_path):
+            with open(self.skills_path, "r", encoding="utf-8") as f:
+                self.meta = json.load(f)
+        self.ids = []
+        if os.path.exists(self.ids_path):
+            self.ids = [record["file_name"] for record in iter_records(self.ids_path)][:self.meta["count"]]
+        self._known = set(self.ids)
+        self._postings = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def skills(self):
+        return sorted(self.meta["skills"], key=lambda skill: -self.meta["skills"][skill][1])
+
+    def _load_postings(self):
+        import numpy as np
+        if self._postings is None:
+            if self.meta["skills"] and os.path.exists(self.postings_path):
+                self._postings = np.fromfile(self.postings_path, dtype=np.uint32)
+            else:
+                self._postings = np.zeros(0, dtype=np.uint32)
+        return self._postings
+
+    def postings(self, skill):
+        with self._lock:
+            skills, postings = self.meta["skills"], self._load_postings()
+        offset, count = skills.get(normalize_skill(skill), (0, 0))
+        return postings[offset:offset + count]
+
+    # -----------------------------
+    # Incremental build: add parsed-resume records not indexed yet
+    def add_records(self, records):
+        with self._lock:
+            return self._add_records(records)
+
+    def _add_records(self, records):
+        import numpy as np
+        new = {}
+        added = []
+        for record in records:
+            if record["file_name"] in self._known:
+                continue
+            self._known.add(record["file_name"])
+            doc_id = len(self.ids) + len(added)
+            added.append(record["file_name"])
+            for skill in {normalize_skill(s) for s in record.get("skills") or [] if s.strip()}:
+                new.setdefault(skill, []).append(doc_id)
+        if not added:
+            return 0
+
+        with open(self.ids_path, "a", encoding="utf-8") as f:
+            for file_name in added:
+                f.write(json.dumps({"file_name": file_name}, ensure_ascii=False) + "\n")
+
+        # Rewrite the postings with the new ids appended to each list
+        old = self._load_postings()
+        lists, skills, offset = [], {}, 0
+        for skill in set(self.meta["skills"]) | set(new):
+            start, count = self.meta["skills"].get(skill, (0, 0))
+            merged = np.concatenate([old[start:start + count], np.asarray(new.get(skill, []), dtype=np.uint32)])
+            lists.append(merged)
+            skills[skill] = [offset, len(merged)]
+            offset += len(merged)
+        postings = np.concatenate(lists).astype(np.uint32) if lists else np.zeros(0, dtype=np.uint32)
+        tmp_path = self.postings_path + ".tmp"
+        postings.tofile(tmp_path)
+        os.replace(tmp_path, self.postings_path)
+
+        meta = {"count": len(self.ids) + len(added), "skills": skills}
+        tmp_path = self.skills_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.skills_path)
+        # New lists replace the old ones whole: readers holding the old
+        # snapshot keep a consistent view
+        self.ids = self.ids + added
+        self.meta = meta
+        self._postings = postings
+        return len(added)
+
+    # Only file_name and skills are read (a column store never touches full_text)
+    def add_parsed_resumes(self, path):
+        return self.add_records(iter_corpus(path, ["file_name", "skills"]))
+
+    # -----------------------------
+    # Boolean query -> sorted array of matching resume ids
+    def match(self, query):
+        return self._match(query)[0]
+
+    def _match(self, query):
+        import numpy as np
+        node = QueryParser(query).parse()
+        with self._lock:
+            ids, skills, postings = self.ids, self.meta["skills"], self._load_postings()
+
+        def lookup(skill):
+            offset, count = skills.get(skill, (0, 0))
+            return postings[offset:offset + count]
+        return node.evaluate(lookup, np.arange(len(ids), dtype=np.uint32)), ids
+
+    # (total matches, first `limit` file names after `offset`)
+    def search(self, query, limit=50, offset=0):
+        matches, ids = self._match(query)
+        return len(matches), [ids[i] for i in matches[offset:offset + limit]]
+
+# -----------------------------
+# Query parser: OR < AND < NOT, parentheses, skills quoted or bare (bare
+# skills may span several words: data analysis AND python). Operators are
+# matched case-insensitively as whole words.
+TOKEN_PATTERN = re.compile(r'\s*(?:(\()|(\))|"([^"]+)"|\b(AND|OR|NOT)\b|([^()"]+?)(?=\s*(?:[()"]|\b(?:AND|OR|NOT)\b|$)))',
+                           re.IGNORECASE)
+
+class QueryError(ValueError):
+    pass
+
+class Term:
+    def __init__(self, skill):
+        self.skill = skill
+
+    def evaluate(self, postings, every):
+        return postings(self.skill)
+
+class Not:
+    def __init__(self, operand):
+        self.operand = operand
+
+    def evaluate(self, postings, every):
+        import numpy as np
+        return np.setdiff1d(every, self.operand.evaluate(postings, every), assume_unique=True)
+
+class And:
+    def __init__(self, operands):
+        self.operands = operands
+
+    def evaluate(self, postings, every):
+        import numpy as np
+        # Positive terms first, smallest first; NOT terms are subtracted
+        # from that result instead of being expanded against every resume
+        positive = [op.evaluate(postings, every) for op in self.operands if not isinstance(op, Not)]
+        negative = [op.operand.evaluate(postings, every) for op in self.operands if isinstance(op, Not)]
+        positive.sort(key=len)
+        result = positive[0] if positive else every
+        for matches in positive[1:]:
+            result = np.intersect1d(result, matches, assume_unique=True)
+        for matches in negative:
+            result = np.setdiff1d(result, matches, assume_unique=True)
+        return result
+
+class Or:
+    def __init__(self, operands):
+        self.operands = operands
+
+    def evaluate(self, postings, every):
+        import numpy as np
+        result = np.zeros(0, dtype=np.uint32)
+        for op in self.operands:
+            result = np.union1d(result, op.evaluate(postings, every))
+        return result.astype(np.uint32)
+
+class QueryParser:
+    def __init__(self, query):
+        self.tokens = []
+        position = 0
+        query = query.strip()
+        while position < len(query):
+            m = TOKEN_PATTERN.match(query, position)
+            if not m or m.end() == position:
+                raise QueryError(f"Cannot parse query at: {query[position:]}")
+            lparen, rparen, quoted, operator, bare = m.groups()
+            if operator:
+                self.tokens.append(("op", operator.upper()))
+            elif lparen or rparen:
+                self.tokens.append(("paren", lparen or rparen))
+            elif (quoted or bare).strip():
+                self.tokens.append(("skill", normalize_skill(quoted or bare)))
+            position = m.end()
+        self.position = 0
+
+    def _peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _take(self):
+        token = self._peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise QueryError("Empty query")
+        node = self._or()
+        if self.position != len(self.tokens):
+            raise QueryError(f"Unexpected {self._peek()[1]!r}")
+        return node
+
+    def _or(self):
+        operands = [self._and()]
+        while self._peek() == ("op", "OR"):
+            self._take()
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Or(operands)
+
+    def _and(self):
+        operands = [self._not()]
+        # A quoted skill or group right after another operand is ANDed
+        while self._peek() == ("op", "AND") or self._peek()[0] == "skill" or self._peek() in (("op", "NOT"), ("paren", "(")):
+            if self._peek() == ("op", "AND"):
+                self._take()
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else And(operands)
+
+    def _not(self):
+        if self._peek() == ("op", "NOT"):
+            self._take()
+            return Not(self._not())
+        return self._atom()
+
+    def _atom(self):
+        kind, value = self._take()
+        if kind == "skill":
+            return Term(value)
+        if (kind, value) == ("paren", "("):
+            node = self._or()
+            if self._take() != ("paren", ")"):
+                raise QueryError("Missing )")
+            return node
+        raise QueryError(f"Expected a skill, got {value!r}" if value else "Query ends early")
@@ -0,0 +1,118 @@
+from collections import deque
+
+# -----------------------------
+# Multi-pattern skill matcher (Aho-Corasick automaton)
+# Built once from the skill list, then finds every skill in a single pass over
+# the text. Matches must sit on word boundaries, so "java" does not match
+# inside "javascript", "git" not inside "digital", "c" not inside "c++" and
+# "r" not inside "r&d". Any run of whitespace in the text matches the single
+# space of a pattern, so "power  bi" and "machine\nlearning" are found.
+class SkillMatcher:
+    def __init__(self, skills):
+        self.skills = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        for skill in skills:
+            pattern = " ".join(skill.lower().split())
+            if pattern:
+                self._add(pattern, len(self.skills))
+                self.skills.append(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern, skill_id):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(skill_id)
+
+    def _build_failure_links(self):
+        # Breadth-first: depth-1 states fail to the root, deeper states reuse
+        # the failure link of their parent
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    # -----------------------------
+    # All matches as (skill id, start, end) offsets into the lowercased text
+    def _matches(self, text):
+        goto, fail, out, skills = self._goto, self._fail, self._out, self.skills
+        state = 0
+        in_space = False
+        for i, ch in enumerate(text):
+            # A whitespace run is fed as one space
+            if ch.isspace():
+                if in_space:
+                    continue
+                ch, in_space = " ", True
+            else:
+                in_space = False
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for skill_id in out[state]:
+                skill = skills[skill_id]
+                start = i - len(skill) + 1 if " " not in skill else _match_start(text, i, len(skill))
+                if _is_boundary(text, start - 1, skill[0]) and _is_boundary(text, i + 1, skill[-1]):
+                    yield skill_id, start, i + 1
+
+    # All matches as (skill, start, end) offsets into text.lower()
+    def find(self, text):
+        return [(self.skills[skill_id], start, end) for skill_id, start, end in self._matches(text.lower())]
+
+    # Distinct skills found, in order of first appearance
+    def find_skills(self, text):
+        return list(dict.fromkeys(skill for skill, _, _ in self.find(text)))
+
+    # Occurrences of every skill, in self.skills order (term frequencies for
+    # scoring, so scores and the must-have filter see the same matches)
+    def counts(self, text):
+        counts = [0] * len(self.skills)
+        for skill_id, _, _ in self._matches(text.lower()):
+            counts[skill_id] += 1
+        return counts
+
+# Start of a match ending at text[end] that fed `length` characters, each
+# whitespace run counting as one
+def _match_start(text, end, length):
+    pos = end
+    for _ in range(length - 1):
+        pos -= 1
+        if text[pos].isspace():
+            while pos > 0 and text[pos - 1].isspace():
+                pos -= 1
+    return pos
+
+# "+", "#" and "&" belong to words like "c++", "c#" and "r&d"
+def _is_word_char(ch):
+    return ch.isalnum() or ch in "_+#&"
+
+# A skill edge that is itself a word character (e.g. the "a" in "java" or the
+# "+" in "c++") needs a non-word neighbour; symbol edges such as the "." in
+# ".net" do not.
+def _is_boundary(text, pos, edge_char):
+    if not _is_word_char(edge_char):
+        return True
+    if pos < 0 or pos >= len(text):
+        return True
+    return not _is_word_char(text[pos])
+
+# -----------------------------
+# Load a skill taxonomy file (one skill per line, '#' comments allowed)
+def load_skills(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
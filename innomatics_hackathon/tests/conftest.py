@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+
+# The modules are plain scripts run from innomatics_hackathon/
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Default caches and databases go to a scratch folder, never the real data dir
+os.environ["RESUME_DATA_DIR"] = tempfile.mkdtemp(prefix="resume-tests-")
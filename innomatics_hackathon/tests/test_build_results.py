@@ -0,0 +1,76 @@
+import random
+import pytest
+import ResumeJDMatching
+from ResumeJDMatching import CompiledJD, build_results, score_texts
+
+KEYWORDS = ["python", "sql", "power bi", "spark", "aws"]
+
+@pytest.fixture(autouse=True)
+def quiet(monkeypatch):
+    monkeypatch.setattr(ResumeJDMatching, "CONSOLE", "off")
+
+# The per-resume logic build_results replaced
+def old_result(candidate_name, keywords, relevance_score, present):
+    if relevance_score > 70:
+        fit = "High fit"
+    elif relevance_score > 40:
+        fit = "Medium fit"
+    else:
+        fit = "Low fit"
+    missing_keywords = [keywords[i] for i, val in enumerate(present) if not val]
+    feedback = f"Candidate is {fit}. Missing keywords: {', '.join(missing_keywords) if missing_keywords else 'None'}"
+    return {
+        "candidate_name": candidate_name,
+        "relevance_score": round(relevance_score),
+        "fit": fit,
+        "missing_keywords": missing_keywords,
+        "feedback": feedback,
+        "rejected": False
+    }
+
+def test_matches_per_resume_logic():
+    rng = random.Random(0)
+    names = [f"r{i}.pdf" for i in range(300)]
+    # Few distinct patterns, so many rows share one; scores on and around the thresholds
+    patterns = [[rng.random() < 0.5 for _ in KEYWORDS] for _ in range(6)] + [[True] * 5, [False] * 5]
+    presence = [rng.choice(patterns) for _ in names]
+    relevance = [rng.choice([0, 40, 40.2, 40.6, 70, 70.4, 70.5, 100, rng.uniform(0, 100)]) for _ in names]
+    results = build_results(names, KEYWORDS, relevance, presence)
+    assert results == [old_result(name, KEYWORDS, score, present)
+                       for name, score, present in zip(names, relevance, presence)]
+
+def test_thresholds_are_exclusive():
+    results = build_results(["a", "b", "c", "d"], ["python"], [40, 40.01, 70, 70.01], [[True]] * 4)
+    assert [r["fit"] for r in results] == ["Low fit", "Medium fit", "Medium fit", "High fit"]
+
+def test_missing_lists_are_not_shared():
+    results = build_results(["a", "b"], KEYWORDS, [10, 10], [[False] * 5, [False] * 5])
+    results[0]["missing_keywords"].append("extra")
+    assert results[1]["missing_keywords"] == KEYWORDS
+
+def test_rejected_rows():
+    results = build_results(["a", "b", "c"], KEYWORDS, [90, 0, 55], [[True] * 5, [False] * 5, [True] * 5],
+                            [None, ["docker", "aws"], None])
+    assert results[0]["fit"] == "High fit" and results[2]["fit"] == "Medium fit"
+    assert results[1] == {
+        "candidate_name": "b",
+        "relevance_score": 0,
+        "fit": "Rejected",
+        "missing_keywords": ["docker", "aws"],
+        "feedback": "Candidate is Rejected. Missing must-have skills: docker, aws",
+        "rejected": True
+    }
+
+def test_empty_batch():
+    assert build_results([], KEYWORDS, [], []) == []
+
+def test_hard_filter_rejection_in_score_texts():
+    jds = [CompiledJD("needs docker", ["python", "sql"], must_have=["docker"]),
+           CompiledJD("open", ["python", "sql"])]
+    texts = ["Python and SQL developer", "Docker, Python"]
+    by_jd = score_texts(["a.pdf", "b.pdf"], texts, jds)
+    assert by_jd[0][0]["rejected"] and by_jd[0][0]["missing_keywords"] == ["docker"]
+    assert not by_jd[0][1]["rejected"] and by_jd[0][1]["missing_keywords"] == ["sql"]
+    # Rejected for one JD, still scored for the other
+    assert not by_jd[1][0]["rejected"] and by_jd[1][0]["missing_keywords"] == []
+    assert by_jd[1][0]["relevance_score"] > 0
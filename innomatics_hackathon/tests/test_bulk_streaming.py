@@ -0,0 +1,65 @@
+import csv
+import pytest
+import resume_cache
+import ResumeJDMatching
+from ResumeJDMatching import CompiledJD, RESULT_FIELDS, evaluate_bulk_resumes, iter_bulk_evaluations, score_resume_text
+from jsonl_pipeline import iter_records
+
+JD = CompiledJD("jd", ["python", "sql", "power bi"])
+
+@pytest.fixture(autouse=True)
+def quiet(monkeypatch):
+    monkeypatch.setattr(ResumeJDMatching, "CONSOLE", "off")
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    texts = ["Python", "Python and SQL", "Python, SQL, Power BI", "Excel only", "SQL"]
+    for i, text in enumerate(texts):
+        (folder / f"r{i}.txt").write_text(text, encoding="utf-8")
+    (folder / "bad.pdf").write_bytes(b"%PDF-1.4 truncated")
+    return folder
+
+def test_results_stream_before_all_resumes_are_read(folder, monkeypatch):
+    monkeypatch.setattr(ResumeJDMatching, "BULK_BATCH", 2)
+    extracted = []
+    extract_texts = resume_cache.extract_texts
+
+    def counting(*args, **kwargs):
+        for item in extract_texts(*args, **kwargs):
+            extracted.append(item[0])
+            yield item
+    monkeypatch.setattr(resume_cache, "extract_texts", counting)
+
+    paths = sorted(str(path) for path in folder.glob("r*.txt"))
+    results = iter_bulk_evaluations(paths, JD, workers=1, cache=False, score_cache=False)
+    first = next(results)
+    assert len(extracted) == 2
+    assert len([first, *results]) == len(paths) == len(extracted)
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".csv"])
+def test_output_file_has_one_row_per_resume(folder, tmp_path, suffix):
+    output_file = str(tmp_path / f"out{suffix}")
+    summary = evaluate_bulk_resumes(str(folder), JD, workers=1, cache=False, output_file=output_file,
+                                    top_k=2, score_cache=False)
+    assert summary["evaluated"] == 5 and summary["skipped"] == 1
+    assert [res["candidate_name"] for res in summary["top_candidates"]] == ["r2.txt", "r1.txt"]
+
+    expected = {f"r{i}.txt": score_resume_text(f"r{i}.txt", (folder / f"r{i}.txt").read_text(), JD) for i in range(5)}
+    if suffix == ".csv":
+        with open(output_file, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+        assert reader.fieldnames == RESULT_FIELDS
+        assert {row["candidate_name"]: row["missing_keywords"] for row in rows} == \
+            {name: ", ".join(res["missing_keywords"]) for name, res in expected.items()}
+    else:
+        rows = list(iter_records(output_file))
+        assert {row["candidate_name"]: row["relevance_score"] for row in rows} == \
+            {name: res["relevance_score"] for name, res in expected.items()}
+
+def test_default_output_goes_next_to_the_resumes(folder):
+    summary = evaluate_bulk_resumes(str(folder), JD, workers=1, cache=False, score_cache=False)
+    assert summary["output_file"] == str(folder / "evaluation_results.jsonl")
+    assert len(list(iter_records(summary["output_file"]))) == 5
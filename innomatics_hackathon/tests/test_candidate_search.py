@@ -0,0 +1,22 @@
+import pytest
+from candidate_search import CandidateIndex
+from semantic_matching import HashingEncoder
+
+RECORDS = [{"file_name": f"resume_{i}.pdf", "skills": skills, "full_text": " ".join(skills)}
+           for i, skills in enumerate([["python", "sql"], ["java", "spring"], ["excel", "tableau"], ["python", "spark"]])]
+
+@pytest.fixture
+def index(tmp_path):
+    index = CandidateIndex(str(tmp_path), encoder=HashingEncoder(), n_lists=2)
+    index.add_records(RECORDS)
+    if index.centroids is None:
+        index.train()
+    return index
+
+def test_search_finds_closest(index):
+    assert index.search("python sql", k=1, nprobe=2)[0][0] == "resume_0.pdf"
+
+@pytest.mark.parametrize("k, nprobe", [(10, 0), (10, -1), (0, 1)])
+def test_search_rejects_bad_arguments(index, k, nprobe):
+    with pytest.raises(ValueError):
+        index.search("python", k=k, nprobe=nprobe)
@@ -0,0 +1,47 @@
+import os
+import pytest
+from column_store import ColumnStore, iter_corpus, write_column_store
+
+def records(n, fail_after=None):
+    for i in range(n):
+        if fail_after is not None and i == fail_after:
+            raise RuntimeError("parser crashed")
+        yield {"file_name": f"r{i}.pdf", "skills": [f"skill{i}", "python"], "full_text": "x" * i}
+
+def test_round_trip_with_projection_and_lookup(tmp_path):
+    path = str(tmp_path / "resumes.cols")
+    assert write_column_store(path, records(5)) == 5
+    with ColumnStore(path) as store:
+        assert len(store) == 5
+        assert list(store.column("skills"))[3] == ["skill3", "python"]
+        assert store.get("r4.pdf", ["skills"]) == {"skills": ["skill4", "python"]}
+        assert store.get("missing.pdf") is None
+
+def test_failed_pack_keeps_existing_store(tmp_path):
+    path = str(tmp_path / "resumes.cols")
+    write_column_store(path, records(5))
+    with pytest.raises(RuntimeError):
+        write_column_store(path, records(5, fail_after=1))
+    with ColumnStore(path) as store:
+        assert len(store) == 5
+    assert not (tmp_path / "resumes.cols.tmp").exists()
+
+def test_repack_replaces_store_and_leaves_no_copies(tmp_path):
+    path = str(tmp_path / "resumes.cols")
+    write_column_store(path, records(5))
+    assert write_column_store(path, records(3)) == 3
+    with ColumnStore(path) as store:
+        assert len(store) == 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["resumes.cols"]
+
+def test_interrupted_swap_falls_back_to_old_copy(tmp_path):
+    path = str(tmp_path / "resumes.cols")
+    write_column_store(path, records(5))
+    os.replace(path, path + ".old")  # crash between moving the old store aside and renaming the new one in
+    with ColumnStore(path) as store:
+        assert len(store) == 5
+    assert len(list(iter_corpus(path, ["file_name"]))) == 5
+    write_column_store(path, records(2))
+    with ColumnStore(path) as store:
+        assert len(store) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["resumes.cols"]
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+
+HERE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+def default_paths(cwd, env):
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); import resume_cache, ranking_index, upload_store; "
+            "print(resume_cache.CACHE_DB); print(ranking_index.RANKING_DB); print(upload_store.UPLOAD_STORE)")
+    out = subprocess.run([sys.executable, "-c", code, HERE], cwd=cwd, env=env, capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-3:]
+
+def test_paths_do_not_depend_on_working_directory(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k != "RESUME_DATA_DIR"}
+    paths = default_paths(str(tmp_path), env)
+    assert paths == default_paths(HERE, env)
+    assert all(path.startswith(HERE + os.sep) for path in paths)
+
+def test_data_dir_from_environment(tmp_path):
+    paths = default_paths(HERE, {**os.environ, "RESUME_DATA_DIR": str(tmp_path)})
+    assert all(path.startswith(str(tmp_path) + os.sep) for path in paths)
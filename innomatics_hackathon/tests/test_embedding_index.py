@@ -0,0 +1,56 @@
+import json
+import numpy as np
+from semantic_matching import EmbeddingIndex, HashingEncoder, split_chunks
+
+RESUMES = {
+    "a": "Python developer. Built Spark pipelines and SQL reports.",
+    "b": "Frontend engineer working with React and TypeScript.",
+    "c": "Data analyst: Power BI dashboards, Excel, statistics.",
+}
+
+def expected(index, text):
+    return index.encoder.encode(split_chunks(text))
+
+def test_round_trip(tmp_path):
+    index = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    assert index.add(list(RESUMES.items())) == 3
+    for h, text in RESUMES.items():
+        start, end = index.meta["resumes"][h]
+        assert np.allclose(index.vectors()[start:end], expected(index, text))
+
+def test_append_keeps_existing_rows(tmp_path):
+    index = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    index.add([("a", RESUMES["a"])])
+    before = np.array(index.vectors())
+    assert index.add([("a", RESUMES["a"]), ("b", RESUMES["b"])]) == 1
+    assert np.array_equal(index.vectors()[:len(before)], before)
+    start, end = index.meta["resumes"]["b"]
+    assert start == len(before)
+    assert np.allclose(index.vectors()[start:end], expected(index, RESUMES["b"]))
+
+def test_reopen_sees_other_writers(tmp_path):
+    first = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    second = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    first.add([("a", RESUMES["a"])])
+    # second was opened before first wrote; its add must not reuse first's rows
+    second.add([("b", RESUMES["b"])])
+    reopened = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    assert set(reopened.meta["resumes"]) == {"a", "b"}
+    for h in ("a", "b"):
+        start, end = reopened.meta["resumes"][h]
+        assert np.allclose(reopened.vectors()[start:end], expected(reopened, RESUMES[h]))
+
+def test_reopen_never_truncates(tmp_path):
+    index = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    index.add([("a", RESUMES["a"])])
+    # Half a row from a writer that has not saved index.json yet
+    with open(index.data_path, "ab") as f:
+        f.write(b"\0" * 10)
+    size = len(open(index.data_path, "rb").read())
+    reopened = EmbeddingIndex(HashingEncoder(), str(tmp_path))
+    assert len(open(index.data_path, "rb").read()) == size
+    reopened.add([("c", RESUMES["c"])])
+    start, end = reopened.meta["resumes"]["c"]
+    assert np.allclose(reopened.vectors()[start:end], expected(reopened, RESUMES["c"]))
+    with open(reopened.meta_path, "r", encoding="utf-8") as f:
+        assert json.load(f)["resumes"]["a"] == index.meta["resumes"]["a"]
@@ -0,0 +1,55 @@
+import pytest
+from evaluation_store import EvaluationStore
+
+@pytest.fixture
+def store(tmp_path):
+    return EvaluationStore(str(tmp_path / "evaluations.db"))
+
+def result(name, score=50, **key):
+    return {"candidate_name": name, "relevance_score": score, "missing_keywords": ["sql"], "feedback": "ok", **key}
+
+def all_pages(store, limit, **filters):
+    pages, cursor = [], None
+    while True:
+        rows, cursor = store.history_page(limit, cursor, **filters)
+        pages.append([row["candidate_name"] for row in rows])
+        if cursor is None:
+            return pages
+
+def test_keyed_results_are_stored_once(store):
+    key = {"resume_hash": "r1", "jd_hash": "j1", "scorer_version": "v1"}
+    assert store.add_evaluations("jd", [result("a", **key), result("b")]) == 2
+    assert store.add_evaluations("jd", [result("a", **key), result("b")]) == 1
+    assert store.add_evaluation("jd", result("a", **{**key, "scorer_version": "v2"})) == 1
+    assert store.add_evaluation("jd", result("a", **{**key, "jd_hash": "j2"})) == 1
+    rows, cursor = store.history_page(10)
+    assert cursor is None and len(rows) == 5
+    assert rows[-1]["missing_skills"] == "sql"
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5, 6])
+def test_pages_cover_every_row_once(store, limit):
+    # One batch shares one timestamp, so the id breaks the tie
+    store.add_evaluations("jd", [result(f"r{i}") for i in range(5)])
+    pages = all_pages(store, limit)
+    assert sum(pages, []) == [f"r{i}" for i in reversed(range(5))]
+    assert all(len(page) == limit for page in pages[:-1])
+    assert pages[-1]  # a full last page is not followed by an empty one
+
+def test_pages_order_by_date_then_id(store):
+    store.add_evaluations("jd", [result("old"), result("new")])
+    conn = store.connection()
+    with conn:
+        conn.execute("UPDATE evaluations SET evaluation_date = '2020-01-01 00:00:00' WHERE candidate_name = 'new'")
+        conn.execute("UPDATE evaluations SET evaluation_date = '2019-01-01 00:00:00' WHERE candidate_name = 'old'")
+    store.add_evaluations("jd", [result("latest")])
+    assert all_pages(store, 1) == [["latest"], ["new"], ["old"]]
+
+def test_filters_apply_across_pages(store):
+    store.add_evaluations("jd a", [result(f"a{i}") for i in range(3)])
+    store.add_evaluations("jd b", [result(f"b{i}") for i in range(3)])
+    assert all_pages(store, 2, jd_name="jd b") == [["b2", "b1"], ["b0"]]
+    assert all_pages(store, 2, candidate_name="a1") == [["a1"]]
+    assert store.jd_names() == ["jd a", "jd b"]
+
+def test_empty_store(store):
+    assert store.history_page(10) == ([], None)
@@ -0,0 +1,24 @@
+import os
+from text_extraction import extract_texts
+
+SOURCES = [("a.txt", b"python"), ("crash.txt", b"sql"), ("bad.pdf", b"%PDF-1.4 truncated"), ("b.txt", b"java")]
+
+def _crash_on_name(file_name, text):
+    if file_name.startswith("crash"):
+        os._exit(1)
+    return text
+
+def test_one_bad_file_does_not_fail_the_batch():
+    results = {source[0]: (text, error) for source, text, error in extract_texts(SOURCES[::2] + SOURCES[3:], 2)}
+    assert results["a.txt"] == ("python", None) and results["b.txt"] == ("java", None)
+    assert results["bad.pdf"][0] is None and results["bad.pdf"][1]
+
+def test_worker_crash_is_reported_for_that_file_only():
+    results = {}
+    for source, text, error in extract_texts(SOURCES, 2, parse=_crash_on_name):
+        assert source[0] not in results
+        results[source[0]] = (text, error)
+    assert sorted(results) == sorted(source[0] for source in SOURCES)
+    assert results["a.txt"] == ("python", None) and results["b.txt"] == ("java", None)
+    assert results["crash.txt"] == (None, "BrokenProcessPool: worker crashed while parsing this file")
+    assert results["bad.pdf"][0] is None and results["bad.pdf"][1]
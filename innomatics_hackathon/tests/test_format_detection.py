@@ -0,0 +1,53 @@
+import io
+import os
+import zipfile
+import pytest
+from text_extraction import detect_format, extract_text
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESUME_PDF = os.path.join(HERE, "..", "Resumes", "dataresume", "resume - 1.pdf")
+
+def make_zip(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in entries.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+DOCX = make_zip({"word/document.xml": '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                                      "<w:body><w:p><w:r><w:t>Python and SQL</w:t></w:r></w:p></w:body></w:document>"})
+HTML = b"\xef\xbb\xbf\n<!DOCTYPE html><html><body><p>Python</p><script>var sql;</script><p>Spark</p></body></html>"
+
+@pytest.fixture(scope="module")
+def pdf_bytes():
+    with open(RESUME_PDF, "rb") as f:
+        return f.read()
+
+def test_content_wins_over_extension(pdf_bytes):
+    assert detect_format(("resume.txt", pdf_bytes)) == "pdf"
+    assert detect_format(("resume.pdf", DOCX)) == "docx"
+    assert detect_format(("resume.txt", HTML)) == "html"
+    assert detect_format(pdf_bytes) == "pdf"
+
+def test_extension_is_the_fallback():
+    assert detect_format(("notes.txt", b"Python, SQL")) == "txt"
+    assert detect_format(("page.HTM", b"Python, SQL")) == "html"
+    # A zip without word/ content is not taken for a .docx by content
+    assert detect_format(("archive.txt", make_zip({"data.csv": "a,b"}))) == "txt"
+
+def test_unknown_content_without_a_name():
+    assert detect_format(b"Python, SQL") is None
+    assert detect_format(("resume.rtf", b"{\\rtf1 Python}")) is None
+    with pytest.raises(ValueError, match="resume.rtf"):
+        extract_text(("resume.rtf", b"{\\rtf1 Python}"))
+
+def test_detection_from_a_path(tmp_path, pdf_bytes):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(pdf_bytes)
+    assert detect_format(str(path)) == "pdf"
+
+def test_mislabelled_documents_are_extracted_by_content(pdf_bytes):
+    assert extract_text(("resume.txt", pdf_bytes)) == extract_text(RESUME_PDF)
+    assert "Python and SQL" in extract_text(("resume.pdf", DOCX))
+    text = extract_text(("resume.txt", HTML))
+    assert "Python" in text and "Spark" in text and "sql" not in text
@@ -0,0 +1,36 @@
+import os
+import pytest
+import text_extraction
+from ResumeJDMatching import CompiledJD, evaluate_single_resume
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESUME_PDF = os.path.join(HERE, "..", "Resumes", "dataresume", "resume - 1.pdf")
+
+@pytest.fixture(scope="module")
+def pdf_bytes():
+    with open(RESUME_PDF, "rb") as f:
+        return f.read()
+
+@pytest.fixture(scope="module")
+def jd():
+    return CompiledJD("jd", ["python", "sql", "tableau"])
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_raw_in_memory_source_has_fixed_name(pdf_bytes, wrap):
+    assert text_extraction.source_name(wrap(pdf_bytes)) == text_extraction.IN_MEMORY_NAME
+
+def test_named_and_path_sources_keep_their_name(pdf_bytes):
+    assert text_extraction.source_name(("cv.pdf", pdf_bytes)) == "cv.pdf"
+    assert text_extraction.source_name(RESUME_PDF) == "resume - 1.pdf"
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, lambda data: ("cv.pdf", data)])
+def test_evaluate_single_resume_from_memory(pdf_bytes, jd, wrap):
+    expected = evaluate_single_resume(RESUME_PDF, jd, cache=False, score_cache=False)
+    result = evaluate_single_resume(wrap(pdf_bytes), jd, cache=False, score_cache=False)
+    assert result["candidate_name"] == ("cv.pdf" if isinstance(wrap(b""), tuple) else text_extraction.IN_MEMORY_NAME)
+    assert result["relevance_score"] == expected["relevance_score"]
+    assert result["missing_keywords"] == expected["missing_keywords"]
+
+def test_unsupported_in_memory_source_is_reported_by_name():
+    with pytest.raises(ValueError, match=text_extraction.IN_MEMORY_NAME):
+        text_extraction.extract_text(memoryview(b"\x00\x01 not a document"))
@@ -0,0 +1,15 @@
+import threading
+from job_queue import JobQueue
+
+def test_snapshot_pairs_status_with_result():
+    queue = JobQueue(max_workers=1)
+    release = threading.Event()
+    job_id = queue.submit(lambda: release.wait() and [1, 2, 3])
+    status, result = queue.snapshot(job_id)
+    assert status["status"] == "running" and result is None
+    release.set()
+    queue._executor.shutdown(wait=True)
+    status, result = queue.snapshot(job_id)
+    assert status["status"] == "done" and result == [1, 2, 3]
+    assert "result" not in status
+    assert queue.snapshot("unknown") == (None, None)
@@ -0,0 +1,28 @@
+import pytest
+from jsonl_pipeline import load_done, iter_records
+from column_store import iter_corpus
+
+GOOD = b'{"file_name": "a.pdf"}\n'
+
+def test_bad_line_is_skipped_and_later_records_kept(tmp_path):
+    path = tmp_path / "out.jsonl"
+    content = GOOD + b'{"file_na\n' + b'{"other": 1}\n' + b'{"file_name": "b.pdf"}\n'
+    path.write_bytes(content)
+    assert load_done(str(path)) == ({"a.pdf", "b.pdf"}, 2)
+    assert path.read_bytes() == content
+
+def test_only_unterminated_last_line_is_cut(tmp_path):
+    path = tmp_path / "out.jsonl"
+    path.write_bytes(GOOD + b'{"file_name": "b.pdf"}\n' + b'{"file_name": "c.p')
+    assert load_done(str(path)) == ({"a.pdf", "b.pdf"}, 0)
+    assert path.read_bytes() == GOOD + b'{"file_name": "b.pdf"}\n'
+
+def test_missing_output(tmp_path):
+    assert load_done(str(tmp_path / "none.jsonl")) == (set(), 0)
+
+def test_corpus_reader_skips_bad_lines(tmp_path):
+    path = tmp_path / "out.jsonl"
+    path.write_bytes(GOOD + b"not json\n" + b'{"file_name": "b.pdf"}\n')
+    assert [r["file_name"] for r in iter_corpus(str(path))] == ["a.pdf", "b.pdf"]
+    with pytest.raises(ValueError):
+        list(iter_records(str(path)))
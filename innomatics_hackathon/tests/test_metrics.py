@@ -0,0 +1,46 @@
+import os
+import sys
+import subprocess
+import pytest
+import metrics
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+@pytest.fixture(autouse=True)
+def clean():
+    enabled = metrics.ENABLED
+    metrics.enable(True)
+    metrics.reset()
+    yield
+    metrics.enable(enabled)
+    metrics.reset()
+
+def test_timers_and_counters():
+    with metrics.timer("stage"):
+        pass
+    metrics.add_time("stage", 0.5, calls=2)
+    metrics.count("docs", 3)
+    metrics.count("docs")
+    snap = metrics.snapshot()
+    assert snap["enabled"] is True
+    assert snap["stages"]["stage"]["calls"] == 3 and snap["stages"]["stage"]["max_s"] >= 0.5
+    assert snap["counters"] == {"docs": 4}
+    assert "docs" in metrics.format_summary(snap)
+
+def test_disabled_records_nothing():
+    metrics.enable(False)
+    assert metrics.timer("a") is metrics.timer("b")
+    with metrics.timer("stage"):
+        pass
+    metrics.add_time("stage", 1.0)
+    metrics.count("docs")
+    assert metrics.snapshot() == {"enabled": False, "stages": {}, "counters": {}}
+    metrics.enable(True)
+    metrics.count("docs")
+    assert metrics.snapshot()["counters"] == {"docs": 1}
+
+def test_environment_switch():
+    code = "import metrics; metrics.count('docs'); print(metrics.snapshot())"
+    out = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(HERE), capture_output=True, text=True,
+                         env={**os.environ, "RESUME_METRICS": "0"}, check=True).stdout
+    assert out.strip() == "{'enabled': False, 'stages': {}, 'counters': {}}"
@@ -0,0 +1,52 @@
+import pytest
+import ResumeJDMatching
+from ResumeJDMatching import CompiledJD, evaluate_multiple_resumes, score_resume_text
+from score_cache import ScoreCache
+
+RESUMES = {
+    "a.txt": "Data analyst: Python, SQL and Power BI dashboards.",
+    "b.txt": "Backend developer with Java, Docker and some SQL.",
+    "c.txt": "Python, Spark and AWS pipelines; Docker.",
+}
+JDS = [CompiledJD("analyst", ["python", "sql", "power bi", "excel"]),
+       CompiledJD("platform", ["docker", "aws", "spark"], must_have=["docker"])]
+
+@pytest.fixture(autouse=True)
+def quiet(monkeypatch):
+    monkeypatch.setattr(ResumeJDMatching, "CONSOLE", "off")
+
+@pytest.fixture
+def resume_files(tmp_path):
+    paths = []
+    for name, text in RESUMES.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+        paths.append(str(tmp_path / name))
+    return paths
+
+def expected():
+    return [{"candidate_name": name, "jd_name": jd.jd_name, **score_resume_text(name, text, jd)}
+            for jd in JDS for name, text in RESUMES.items()]
+
+def core(results):
+    keys = ["candidate_name", "jd_name", "relevance_score", "fit", "missing_keywords", "feedback", "rejected"]
+    return [{key: result[key] for key in keys} for result in results]
+
+def test_every_resume_against_every_jd(resume_files):
+    results = evaluate_multiple_resumes(resume_files, JDS, workers=1, cache=False, score_cache=False)
+    assert len(results) == len(RESUMES) * len(JDS)
+    assert core(results) == core(expected())
+    assert [r["rejected"] for r in results[3:]] == [True, False, False]
+
+def test_second_run_comes_from_the_score_cache(resume_files, tmp_path):
+    scores = ScoreCache(ResumeJDMatching.current_scorer_version(), str(tmp_path / "scores.db"))
+    first = evaluate_multiple_resumes(resume_files, JDS, workers=1, cache=False, score_cache=scores)
+    for path in resume_files:
+        assert scores.get(ResumeJDMatching.resume_cache.content_hash(path), JDS[0].jd_hash) is not None
+    again = evaluate_multiple_resumes(resume_files, JDS, workers=1, cache=False, score_cache=scores)
+    assert core(again) == core(first) == core(expected())
+
+def test_unreadable_resume_is_skipped(resume_files, tmp_path):
+    (tmp_path / "bad.pdf").write_bytes(b"%PDF-1.4 truncated")
+    results = evaluate_multiple_resumes(resume_files + [str(tmp_path / "bad.pdf")], JDS, workers=1,
+                                        cache=False, score_cache=False)
+    assert core(results) == core(expected())
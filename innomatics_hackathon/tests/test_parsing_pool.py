@@ -0,0 +1,26 @@
+from resume_parser import iter_parsed_resumes, parse_resume
+from text_extraction import extract_texts
+
+RESUMES = {
+    "a.txt": "Jane Doe\nSkills: Python, SQL, Power BI\nEducation: B.Tech 2019",
+    "b.txt": "John Roe\nSkills: Java, Spring, Docker\nProjects: inventory system",
+    "c.txt": "Sam Poe\nSkills: Excel, Tableau\nCertifications: AWS Certified",
+}
+
+def test_parsing_in_the_pool_matches_serial(tmp_path):
+    for name, text in RESUMES.items():
+        (tmp_path / name).write_text(text, encoding="utf-8")
+    pooled = sorted(iter_parsed_resumes(str(tmp_path), workers=2), key=lambda r: r["file_name"])
+    serial = sorted(iter_parsed_resumes(str(tmp_path), workers=1), key=lambda r: r["file_name"])
+    assert pooled == serial == [parse_resume(name, text) for name, text in sorted(RESUMES.items())]
+
+def test_parse_errors_are_reported_per_file():
+    sources = [("a.txt", b"python"), ("bad.txt", b"sql")]
+    results = {source[0]: (parsed, error) for source, parsed, error in extract_texts(sources, 2, parse=_fail_on_bad)}
+    assert results["a.txt"] == ("a.txt:python", None)
+    assert results["bad.txt"][0] is None and results["bad.txt"][1].startswith("ValueError")
+
+def _fail_on_bad(file_name, text):
+    if file_name.startswith("bad"):
+        raise ValueError("cannot parse")
+    return f"{file_name}:{text}"
@@ -0,0 +1,77 @@
+import pytest
+import ResumeJDMatching
+from ranking_index import RankingIndex
+from ResumeJDMatching import CompiledJD
+
+RESUMES = [
+    ("alice.txt", b"Python developer with SQL, Spark and Docker."),
+    ("bob.txt", b"Python and SQL analyst using Excel and Tableau."),
+    ("carol.txt", b"Java developer, Spring and Docker."),
+]
+
+@pytest.fixture
+def ranking(tmp_path, monkeypatch):
+    monkeypatch.setattr(ResumeJDMatching, "CONSOLE", "off")
+    return RankingIndex(str(tmp_path / "rankings.db"), cache=False)
+
+# Resumes on disk, so a new JD version can read them again to re-score
+@pytest.fixture
+def resumes(tmp_path):
+    paths = []
+    for name, content in RESUMES:
+        (tmp_path / name).write_bytes(content)
+        paths.append(str(tmp_path / name))
+    return paths
+
+def names(results):
+    return [result["candidate_name"] for result in results]
+
+def test_rankings_are_keyed_by_requirements(ranking, resumes):
+    jd = CompiledJD("jd_1.pdf", ["sql", "spark", "docker"], must_have=["python"])
+    assert ranking.add_resumes(jd, resumes, workers=1) == 3
+    top = ranking.top_k(jd.jd_hash, 3)
+    assert names(top) == ["alice.txt", "bob.txt", "carol.txt"]
+    assert top[0]["jd_hash"] == jd.jd_hash
+    assert top[2]["rejected"]
+    # Same requirements under another file name: nothing is scored again
+    same = CompiledJD("copy of jd_1.json", ["docker", "spark", "sql"], must_have=["python"])
+    assert same.jd_hash == jd.jd_hash
+    assert ranking.add_resumes(same, resumes, workers=1) == 0
+    assert ranking.top_k(jd.jd_name, 3) == []
+
+def test_new_version_of_a_jd_rescores_only_affected_resumes(ranking, resumes):
+    old = CompiledJD("jd_1.pdf", ["sql", "spark"], must_have=["python"])
+    ranking.add_resumes(old, resumes, workers=1)
+    new = CompiledJD("jd_1.pdf", ["sql", "spark", "tableau"], must_have=["python"])
+    # Only bob mentions the added keyword
+    assert ranking.register_jd(new) == 1
+    # The old requirements keep their own ranking
+    assert names(ranking.top_k(old.jd_hash, 2)) == ["alice.txt", "bob.txt"]
+    fresh = RankingIndex(ranking.db_path + ".fresh", cache=False)
+    fresh.add_resumes(new, resumes, workers=1)
+    expected = {r["candidate_name"]: r["relevance_score"] for r in fresh.top_k(new.jd_hash, 3)}
+    assert {r["candidate_name"]: r["relevance_score"] for r in ranking.top_k(new.jd_hash, 3)} == expected
+
+def test_changed_requirements_drop_rows_that_cannot_be_rescored(ranking):
+    # In-memory uploads with no cache and no stored copy: their text is gone
+    # once add_resumes returns
+    old = CompiledJD("jd_1.pdf", ["sql", "spark"], must_have=["python"])
+    ranking.add_resumes(old, RESUMES, workers=1)
+    new = CompiledJD("jd_1.pdf", ["sql", "spark"], must_have=["java"])
+    assert ranking.add_resumes(new, RESUMES, workers=1) == 3
+    results = {r["candidate_name"]: r for r in ranking.top_k(new.jd_hash, 3)}
+    assert results["alice.txt"]["rejected"] and results["alice.txt"]["missing_keywords"] == ["java"]
+    assert not results["carol.txt"].get("rejected")
+    assert results["bob.txt"]["rejected"]
+    fresh = RankingIndex(ranking.db_path + ".fresh", cache=False)
+    fresh.add_resumes(new, RESUMES, workers=1)
+    assert ranking.top_k(new.jd_hash, 3) == fresh.top_k(new.jd_hash, 3)
+
+def test_added_terms_drop_rows_that_cannot_be_rescored(ranking):
+    old = CompiledJD("jd_1.pdf", ["sql"], must_have=["python"])
+    ranking.add_resumes(old, RESUMES, workers=1)
+    new = CompiledJD("jd_1.pdf", ["sql", "tableau"], must_have=["python"])
+    assert ranking.add_resumes(new, RESUMES, workers=1) == 3
+    fresh = RankingIndex(ranking.db_path + ".fresh", cache=False)
+    fresh.add_resumes(new, RESUMES, workers=1)
+    assert ranking.top_k(new.jd_hash, 3) == fresh.top_k(new.jd_hash, 3)
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+from ResumeJDMatching import requirements_hash, CompiledJD
+from jd_parser import parse_jd
+
+JD_TEXT = """Data Engineer
+Must have: Spark, Python, SQL, Docker and Tableau
+"""
+
+def test_requirements_hash_ignores_order():
+    assert requirements_hash(["python", "spark"], ["sql", "docker"]) == requirements_hash(["spark", "python"], ["docker", "sql"])
+    assert requirements_hash(["python"], ["spark"]) != requirements_hash(["spark"], ["python"])
+
+def test_marked_skills_keep_document_order():
+    parsed = parse_jd("jd.txt", JD_TEXT)
+    assert parsed["must_have_skills"] == ["Spark", "Python", "Sql", "Docker", "Tableau"]
+
+def test_jd_hash_is_stable_across_processes():
+    here = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    code = ("import sys; from jd_parser import parse_jd; from ResumeJDMatching import CompiledJD; "
+            "print(CompiledJD.from_parsed('jd', parse_jd('jd.txt', sys.stdin.read())).jd_hash)")
+    hashes = set()
+    for seed in ("1", "2", "3"):
+        out = subprocess.run([sys.executable, "-c", code], input=JD_TEXT, capture_output=True, text=True, cwd=here,
+                             env={**os.environ, "PYTHONHASHSEED": seed}, check=True).stdout
+        hashes.add(out.strip().splitlines()[-1])
+    assert hashes == {CompiledJD.from_parsed("jd", parse_jd("jd.txt", JD_TEXT)).jd_hash}
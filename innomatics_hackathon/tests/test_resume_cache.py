@@ -0,0 +1,44 @@
+import threading
+import resume_cache
+from resume_cache import ResumeCache
+
+TEXT = "x" * 100
+
+def stored(cache):
+    return {row[0] for row in cache.connection().execute("SELECT content_hash FROM resume_cache")}
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResumeCache(str(tmp_path / "cache.db"), max_bytes=350)
+    for key in "abc":
+        cache.put(key, TEXT, {})
+    assert cache.get("a")["text"] == TEXT
+    cache.put("d", TEXT, {})
+    assert stored(cache) == {"a", "c", "d"}
+    assert cache.get("b") is None and (cache.hits, cache.misses) == (1, 1)
+
+def test_size_is_tracked_across_puts_and_reopen(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResumeCache(path, max_bytes=10_000)
+    for key in "abcde":
+        cache.put(key, TEXT, {})
+    assert cache._total == 5 * (len(TEXT) + 2)
+    assert ResumeCache(path)._total == cache._total
+
+def test_writes_from_another_process_are_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_cache, "EVICT_CHECK_EVERY", 2)
+    path = str(tmp_path / "cache.db")
+    first, second = ResumeCache(path, max_bytes=450), ResumeCache(path, max_bytes=450)
+    for key in "abc":
+        second.put(key, TEXT, {})
+    first.put("d", TEXT, {})
+    first.put("e", TEXT, {})
+    assert len(stored(first)) == 4
+
+def test_one_connection_per_thread(tmp_path):
+    cache = ResumeCache(str(tmp_path / "cache.db"))
+    assert cache.connection() is cache.connection()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(cache.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not cache.connection()
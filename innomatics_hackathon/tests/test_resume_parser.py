@@ -0,0 +1,47 @@
+import os
+import re
+import pytest
+from resume_parser import clean_text, extract_sections
+from text_extraction import extract_text
+
+RESUME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Resumes", "dataresume")
+
+# The whole-text education regexes extract_sections replaced
+def old_education(text):
+    edu_patterns = [
+        r"\b(b\.sc|bsc|b\.tech|be|m\.sc|msc|m\.tech|mba|phd)\b.*?(\d{4})",
+        r"\b(university|college|institute)\b.*?(\d{4})"
+    ]
+    return {" ".join(m).title() for pattern in edu_patterns for m in re.findall(pattern, text, re.IGNORECASE)}
+
+def education(text):
+    return extract_sections(text)["education"]
+
+def test_year_lookahead_is_bounded():
+    assert education("B.Tech in Computer Science\nABC\nDEF\n2019") == ["B.Tech 2019"]
+    assert education("B.Tech in Computer Science\nABC\nDEF\nGHI\n2019") == []
+    assert education("MBA 2021 and 2023") == ["Mba 2021"]
+
+def test_a_year_pairs_with_one_keyword_of_each_kind():
+    # MBA sits before the year B.Tech already took, as in the old non-overlapping scan
+    assert education("B.Tech\nMBA\n2019") == ["B.Tech 2019"]
+    assert education("B.Tech, XYZ College 2019\nMBA, ABC Institute 2021") == \
+        ["B.Tech 2019", "College 2019", "Mba 2021", "Institute 2021"]
+
+def test_sections_keep_lines():
+    text = ("Experience\nWorked at Acme as analyst\n\nProject: churn model\n"
+            "Worked at   Acme as analyst\nAWS Certified Cloud Practitioner\nInternship at Beta")
+    sections = extract_sections(text)
+    assert sections["experience"] == ["experience", "worked at acme as analyst", "internship at beta"]
+    assert sections["projects"] == ["project: churn model"]
+    assert sections["certifications"] == ["aws certified cloud practitioner"]
+
+@pytest.mark.parametrize("name", sorted(os.listdir(RESUME_DIR)))
+def test_flattened_text_matches_old_regexes(name):
+    text = clean_text(extract_text(os.path.join(RESUME_DIR, name)))
+    assert set(education(text)) == old_education(text)
+
+def test_whole_text_false_positives_are_dropped():
+    text = extract_text(os.path.join(RESUME_DIR, "Resume - 10.pdf"))
+    assert {"Be 2019", "College 1996"} <= old_education(clean_text(text))
+    assert education(text) == ["College 2020", "College 2017"]
@@ -0,0 +1,31 @@
+import time
+import score_cache
+from score_cache import ScoreCache
+
+RESULT = {"relevance_score": 80, "fit": "High fit", "missing_keywords": [], "feedback": "", "rejected": False}
+
+def test_other_versions_survive_reopen(tmp_path):
+    path = str(tmp_path / "scores.db")
+    ScoreCache("with-filter", path).put("r1", "j1", RESULT)
+    ScoreCache("no-filter", path).put("r1", "j1", {**RESULT, "relevance_score": 60})
+    assert ScoreCache("with-filter", path).get("r1", "j1")["relevance_score"] == 80
+    assert ScoreCache("no-filter", path).get("r1", "j1")["relevance_score"] == 60
+
+def test_stale_versions_are_dropped(tmp_path, monkeypatch):
+    path = str(tmp_path / "scores.db")
+    ScoreCache("old", path).put("r1", "j1", RESULT)
+    ScoreCache("current", path).put("r2", "j1", RESULT)
+    conn = ScoreCache("current", path).connection()
+    with conn:
+        conn.execute("UPDATE score_cache SET created_at = ?", (time.time() - 40 * 24 * 3600,))
+    ScoreCache("current", path)
+    assert conn.execute("SELECT scorer_version FROM score_cache").fetchall() == [("current",)]
+
+def test_oldest_rows_go_past_the_row_limit(tmp_path, monkeypatch):
+    path = str(tmp_path / "scores.db")
+    cache = ScoreCache("v", path)
+    for i in range(5):
+        cache.put(f"r{i}", "j1", RESULT)
+    monkeypatch.setattr(score_cache, "SCORE_CACHE_MAX_ROWS", 3)
+    reopened = ScoreCache("v", path, lru_size=0)
+    assert [reopened.get(f"r{i}", "j1") is not None for i in range(5)] == [False, False, True, True, True]
@@ -0,0 +1,40 @@
+import json
+import pytest
+import numpy as np
+import ResumeJDMatching
+from ResumeJDMatching import CompiledJD, compile_jd, score_resume_text, score_texts
+
+RESUME = "Backend developer: Node.js services, CI/CD pipelines with Jenkins, some Python."
+
+@pytest.fixture(autouse=True)
+def quiet(monkeypatch):
+    monkeypatch.setattr(ResumeJDMatching, "CONSOLE", "off")
+
+def test_dotted_and_slashed_skills_pass_filter_and_score():
+    jd = CompiledJD("jd", ["python"], must_have=["Node.js", "CI/CD"])
+    assert jd.missing_must_have(RESUME) == []
+    result = score_resume_text("resume.pdf", RESUME, jd)
+    assert not result.get("rejected")
+    assert result["missing_keywords"] == []
+    assert result["relevance_score"] > 0
+
+def test_single_and_batch_scores_agree():
+    jd = CompiledJD("jd", ["python", "power bi"], must_have=["node.js", "ci/cd"])
+    single = score_resume_text("resume.pdf", RESUME, jd)
+    batch = score_texts(["resume.pdf"], [RESUME], [jd])[0][0]
+    assert batch["relevance_score"] == pytest.approx(single["relevance_score"])
+    assert batch["missing_keywords"] == single["missing_keywords"] == ["power bi"]
+
+def test_score_counts_overlapping_terms():
+    jd = CompiledJD("jd", ["machine learning", "learning", "sql"])
+    scores = jd.score("Machine learning and SQL. Learning fast.")
+    assert np.allclose(scores, np.array([1, 2, 1]) / np.sqrt(6))
+
+def test_compile_jd_rejects_json_with_several_jds(tmp_path):
+    path = tmp_path / "parsed_jds.json"
+    path.write_text(json.dumps([{"file_name": "a", "must_have_skills": ["python"]},
+                                {"file_name": "b", "must_have_skills": ["sql"]}]), encoding="utf-8")
+    with pytest.raises(ValueError):
+        compile_jd(str(path))
+    path.write_text(json.dumps([{"file_name": "a", "must_have_skills": ["python"]}]), encoding="utf-8")
+    assert compile_jd(str(path)).jd_name == "a"
@@ -0,0 +1,65 @@
+import threading
+import pytest
+from skill_index import SkillIndex, QueryError
+
+RECORDS = [
+    {"file_name": "a.pdf", "skills": ["Python", "Spark", "SQL"]},
+    {"file_name": "b.pdf", "skills": ["Python", "Java"]},
+    {"file_name": "c.pdf", "skills": ["SQL", "Machine  Learning"]},
+    {"file_name": "d.pdf", "skills": ["PostgreSQL", "Python"]},
+]
+
+@pytest.fixture
+def index(tmp_path):
+    index = SkillIndex(str(tmp_path / "skills"))
+    assert index.add_records(RECORDS) == 4
+    return index
+
+def search(index, query):
+    return sorted(index.search(query)[1])
+
+def test_and_binds_tighter_than_or(index):
+    assert search(index, "java OR sql AND spark") == ["a.pdf", "b.pdf"]
+    assert search(index, "(java OR sql) AND python") == ["a.pdf", "b.pdf"]
+
+def test_not(index):
+    assert search(index, "python AND NOT java") == ["a.pdf", "d.pdf"]
+    assert search(index, "NOT python") == ["c.pdf"]
+    assert search(index, "NOT NOT java") == ["b.pdf"]
+
+def test_quoted_and_multi_word_skills(index):
+    assert search(index, '"machine learning" AND sql') == ["c.pdf"]
+    assert search(index, "machine learning") == ["c.pdf"]
+    assert search(index, "(sql OR postgresql) python") == ["a.pdf", "d.pdf"]
+
+def test_unknown_terms_match_nothing(index):
+    assert search(index, "rust") == []
+    assert search(index, "rust OR java") == ["b.pdf"]
+    assert search(index, "NOT rust") == ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]
+
+@pytest.mark.parametrize("query", ["", "python AND", "(python", "python)", "AND python", "NOT", "python OR OR sql"])
+def test_malformed_queries(index, query):
+    with pytest.raises(QueryError):
+        index.search(query)
+
+def test_add_then_query_and_reopen(index, tmp_path):
+    assert index.add_records([{"file_name": "a.pdf", "skills": ["Rust"]},
+                              {"file_name": "e.pdf", "skills": ["Java", "Spark"]}]) == 1
+    assert search(index, "java AND spark") == ["e.pdf"]
+    assert search(index, "rust") == []
+    reopened = SkillIndex(index.dir)
+    assert len(reopened) == 5
+    assert search(reopened, "spark") == ["a.pdf", "e.pdf"]
+
+def test_concurrent_adds(tmp_path):
+    index = SkillIndex(str(tmp_path / "skills"))
+    batches = [[{"file_name": f"{t}-{i}.pdf", "skills": ["python", f"skill{t}"]} for i in range(50)] for t in range(4)]
+    threads = [threading.Thread(target=index.add_records, args=(batch,)) for batch in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert index.search("python")[0] == 200
+    reopened = SkillIndex(index.dir)
+    assert reopened.search("python")[0] == 200
+    assert all(reopened.search(f"skill{t}")[0] == 50 for t in range(4))
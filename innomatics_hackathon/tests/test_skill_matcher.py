@@ -0,0 +1,23 @@
+from skill_matcher import SkillMatcher
+
+def test_whitespace_in_text_is_normalized():
+    matcher = SkillMatcher(["Power BI", "machine learning"])
+    text = "Power  BI dashboards and machine\nlearning models"
+    assert matcher.find_skills(text) == ["power bi", "machine learning"]
+    # Offsets still point into the original text
+    assert [text[start:end] for _, start, end in matcher.find(text)] == ["Power  BI", "machine\nlearning"]
+
+def test_symbols_are_part_of_words():
+    matcher = SkillMatcher(["c", "c++", "c#", "r"])
+    assert matcher.find_skills("Languages: C++ and C#") == ["c++", "c#"]
+    assert matcher.find_skills("Led R&D projects") == []
+    assert matcher.find_skills("Statistics in R, C and C++.") == ["r", "c", "c++"]
+
+def test_word_boundaries():
+    matcher = SkillMatcher(["java", "git", "node.js", "ci/cd"])
+    assert matcher.find_skills("JavaScript, digital marketing") == []
+    assert matcher.find_skills("Java, Git, Node.js and CI/CD") == ["java", "git", "node.js", "ci/cd"]
+
+def test_counts_follow_skill_order():
+    matcher = SkillMatcher(["sql", "python"])
+    assert matcher.counts("Python, SQL and more python") == [1, 2]
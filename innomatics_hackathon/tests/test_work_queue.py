@@ -0,0 +1,34 @@
+import os
+from types import SimpleNamespace
+import work_queue
+from work_queue import WorkQueue
+from ResumeJDMatching import CompiledJD
+
+RESUME_PDF = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Resumes", "dataresume", "resume - 1.pdf")
+
+def test_chunks_are_claimed_in_submission_order(tmp_path, monkeypatch):
+    queue = WorkQueue(str(tmp_path / "queue.db"))
+    jd = CompiledJD("jd", ["python"])
+    # The first run's id sorts after the second's
+    ids = iter(["ffff", "0000"])
+    monkeypatch.setattr(work_queue.uuid, "uuid4", lambda: SimpleNamespace(hex=next(ids)))
+    first = queue.submit(["a.txt", "b.txt", "c.txt"], jd, chunk_size=2)
+    second = queue.submit(["d.txt"], jd, chunk_size=2)
+    claimed = []
+    while (chunk := queue.claim("w")) is not None:
+        claimed.append(chunk[:2])
+        queue.complete(chunk[0], chunk[1], "w", [])
+    assert claimed == [(first, 0), (first, 1), (second, 0)]
+
+def test_unreadable_file_is_reported_when_its_name_repeats(tmp_path):
+    with open(RESUME_PDF, "rb") as f:
+        pdf_bytes = f.read()
+    for folder, content in (("a", pdf_bytes), ("b", b"%PDF-1.4 truncated")):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "cv.pdf").write_bytes(content)
+    (tmp_path / "a" / "notes.txt").write_text("Python", encoding="utf-8")
+    paths = [str(tmp_path / "a" / "notes.txt"), str(tmp_path / "a" / "cv.pdf"), str(tmp_path / "b" / "cv.pdf"),
+             str(tmp_path / "missing.txt")]
+    results = work_queue.score_chunk(paths, CompiledJD("jd", ["python"]))
+    assert sorted((r["candidate_name"], "error" in r) for r in results) == \
+        [("cv.pdf", False), ("cv.pdf", True), ("missing.txt", True), ("notes.txt", False)]
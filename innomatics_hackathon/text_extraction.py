@@ -0,0 +1,255 @@
+import os
+import time
+import metrics
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+# -----------------------------
+# Worker count for bulk extraction (override with RESUME_EXTRACT_WORKERS)
+DEFAULT_WORKERS = int(os.environ.get("RESUME_EXTRACT_WORKERS", os.cpu_count() or 1))
+
+# -----------------------------
+# Extractor registry: format -> (extensions, extractor). A source is a file
+# path, in-memory bytes / memoryview (never written to disk) or a
+# (name, bytes) pair as used by extract_texts. Extractors return
+# (text, pages); pages is None for formats without pages.
+EXTRACTORS = {}
+SIGNATURES = []  # (format, test(head bytes)), checked in registration order
+
+def register_extractor(fmt, extensions, signature=None):
+    def register(extractor):
+        EXTRACTORS[fmt] = (tuple(extensions), extractor)
+        if signature is not None:
+            SIGNATURES.append((fmt, signature))
+        return extractor
+    return register
+
+def supported_extensions():
+    return tuple(ext for extensions, _ in EXTRACTORS.values() for ext in extensions)
+
+def _payload(source):
+    return source[1] if isinstance(source, tuple) else source
+
+def _head(data, size=2048):
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data[:size])
+    with open(data, "rb") as f:
+        return f.read(size)
+
+def _open_binary(data):
+    import io
+    return io.BytesIO(data) if isinstance(data, (bytes, bytearray, memoryview)) else data
+
+def _read_bytes(data):
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    with open(data, "rb") as f:
+        return f.read()
+
+# Format by content signature first, then by file extension
+def detect_format(source):
+    head = _head(_payload(source))
+    for fmt, signature in SIGNATURES:
+        if signature(head):
+            return fmt
+    name = "" if isinstance(source, (bytes, bytearray, memoryview)) else source_name(source).lower()
+    for fmt, (extensions, _) in EXTRACTORS.items():
+        if name.endswith(extensions):
+            return fmt
+    return None
+
+@register_extractor("pdf", [".pdf"], lambda head: b"%PDF-" in head[:1024])
+def _read_pdf(data):
+    import fitz  # PyMuPDF, loaded on first use
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        doc = fitz.open(stream=data, filetype="pdf")
+    else:
+        doc = fitz.open(data)
+    with doc:
+        return "".join([page.get_text() for page in doc]), len(doc)
+
+# A .docx is a zip archive; only its file list tells it apart from other zips
+def _is_docx(head):
+    return head.startswith(b"PK\x03\x04") and b"word/" in head
+
+@register_extractor("docx", [".docx"], _is_docx)
+def _read_docx(data):
+    import docx2txt  # loaded on first use
+    return docx2txt.process(_open_binary(data)), None
+
+def _is_html(head):
+    start = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    return start.startswith((b"<!doctype html", b"<html")) or b"<body" in start[:1024]
+
+@register_extractor("html", [".html", ".htm"], _is_html)
+def _read_html(data):
+    from html.parser import HTMLParser
+
+    class TextParser(HTMLParser):
+        BLOCK_TAGS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "table"}
+
+        def __init__(self):
+            super().__init__()
+            self.parts = []
+            self.skip = 0
+
+        def handle_starttag(self, tag, attrs):
+            if tag in ("script", "style"):
+                self.skip += 1
+            elif tag in self.BLOCK_TAGS:
+                self.parts.append("\n")
+
+        def handle_endtag(self, tag):
+            if tag in ("script", "style"):
+                self.skip = max(0, self.skip - 1)
+            elif tag in self.BLOCK_TAGS:
+                self.parts.append("\n")
+
+        def handle_data(self, text):
+            if not self.skip:
+                self.parts.append(text)
+
+    parser = TextParser()
+    parser.feed(_read_bytes(data).decode("utf-8", errors="replace"))
+    parser.close()
+    return "".join(parser.parts), None
+
+# Plain text has no signature; it is picked by extension only
+@register_extractor("txt", [".txt"])
+def _read_txt(data):
+    return _read_bytes(data).decode("utf-8", errors="replace"), None
+
+def _read_document(source):
+    fmt = detect_format(source)
+    if fmt is None:
+        raise ValueError(f"Unsupported file type: {source_name(source)}")
+    text, pages = EXTRACTORS[fmt][1](_payload(source))
+    return fmt, text, pages
+
+# -----------------------------
+# Extract text from one document of any registered format
+def extract_text(source):
+    start = time.perf_counter()
+    fmt, text, pages = _read_document(source)
+    _record(fmt, time.perf_counter() - start, pages, None)
+    return text
+
+# Extract text from one PDF (pages joined in one step)
+def extract_text_from_pdf(source):
+    start = time.perf_counter()
+    text, pages = _read_pdf(_payload(source))
+    _record("pdf", time.perf_counter() - start, pages, None)
+    return text
+
+def _record(fmt, seconds, pages, error):
+    if error:
+        metrics.count("extract_errors")
+        return
+    metrics.add_time(f"extract_{fmt}", seconds)
+    metrics.count(f"{fmt}_documents")
+    if pages is not None:
+        metrics.count(f"{fmt}_pages", pages)
+
+# -----------------------------
+# Worker entry point: never raises, so one bad file cannot take down the batch.
+# With parse, the worker also runs parse(file name, text) and returns its
+# result in place of the text, so parsing runs in the pool as well. Timing
+# and page count travel back with the result, since metrics recorded inside
+# a pool worker would stay in that process (parse time is sent back only
+# from a worker; in this process parse records its own).
+def _extract_one(source, parse=None):
+    start = time.perf_counter()
+    try:
+        fmt, text, pages = _read_document(source)
+        seconds = time.perf_counter() - start
+        parse_seconds = None
+        if parse is not None:
+            parse_start = time.perf_counter()
+            text = parse(source_name(source), text)
+            if multiprocessing.parent_process() is not None:
+                parse_seconds = time.perf_counter() - parse_start
+        return fmt, text, None, seconds, pages, parse_seconds
+    except Exception as e:
+        return None, None, f"{type(e).__name__}: {e}", time.perf_counter() - start, 0, None
+
+def _finish(source, result):
+    fmt, text, error, seconds, pages, parse_seconds = result
+    _record(fmt, seconds, pages, error)
+    if parse_seconds is not None:
+        metrics.add_time("parse_in_pool", parse_seconds)
+    return source, text, error
+
+# Only a small window of files is in flight at once, so memory stays flat
+# however many sources are queued
+def _extract_in_pool(sources, workers, parse=None):
+    done = set()
+    pending = iter(enumerate(sources))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = {}
+            for i, source in pending:
+                in_flight[pool.submit(_extract_one, source, parse)] = i
+                if len(in_flight) >= workers * 4:
+                    break
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = in_flight.pop(future)
+                    result = future.result()
+                    done.add(i)
+                    yield _finish(sources[i], result)
+                    next_source = next(pending, None)
+                    if next_source is not None:
+                        in_flight[pool.submit(_extract_one, next_source[1], parse)] = next_source[0]
+    except BrokenProcessPool:
+        # A worker died hard (e.g. a segfault inside the PDF library)
+        pass
+    return [source for i, source in enumerate(sources) if i not in done]
+
+# -----------------------------
+# Extract many documents (any registered format) in a process pool,
+# yielding (source, text, error) as each one finishes, where source is the
+# path or (name, bytes) pair given. error is None on success and text is
+# None on failure. With parse (a module-level function, so it can be sent to
+# the workers) the parsed result is yielded in place of the text.
+def extract_texts(sources, workers=None, parse=None):
+    sources = list(sources)
+    workers = workers or DEFAULT_WORKERS
+    if workers <= 1 or len(sources) <= 1:
+        for source in sources:
+            yield _finish(source, _extract_one(source, parse))
+        return
+
+    remaining = yield from _extract_in_pool(sources, min(workers, len(sources)), parse)
+    if remaining:
+        # Retry once in a fresh pool, then isolate every file that is still
+        # left in its own worker so only the crashing file is reported.
+        remaining = yield from _extract_in_pool(remaining, min(workers, len(remaining)), parse)
+    for source in remaining:
+        leftover = yield from _extract_in_pool([source], 1, parse)
+        if leftover:
+            metrics.count("extract_errors")
+            yield source, None, "BrokenProcessPool: worker crashed while parsing this file"
+
+IN_MEMORY_NAME = "in-memory document"
+
+# Display name of a source: file name of a path, the name of a (name, bytes)
+# pair, or IN_MEMORY_NAME for raw in-memory data, which has none of its own
+def source_name(source):
+    if isinstance(source, tuple):
+        return source[0]
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return IN_MEMORY_NAME
+    return os.path.basename(source)
+
+# -----------------------------
+# Shared folder pipeline for the resume and JD parsers: every supported file
+# in the folder (except names in `skip`) through one extraction pool,
+# yielding (file_name, text, error) as each one finishes (the parsed record
+# in place of the text when parse is given)
+def iter_folder_texts(folder, skip=(), workers=None, parse=None):
+    from jsonl_pipeline import iter_input_files
+    paths = [path for file_name, path in iter_input_files(folder, supported_extensions()) if file_name not in skip]
+    for path, text, error in extract_texts(paths, workers, parse):
+        yield os.path.basename(path), text, error
@@ -0,0 +1,66 @@
+import os
+import uuid
+import hashlib
+from resume_cache import content_hash
+from data_paths import data_path
+
+# -----------------------------
+# Content-addressed upload storage
+# An upload is written once to <store>/<sha256>/<original file name>: the
+# same file uploaded twice is stored once, and two different files with the
+# same name (e.g. from two recruiters) can no longer overwrite each other.
+UPLOAD_STORE = data_path("uploads", "store")
+
+def save_upload_bytes(data, file_name, store_dir=UPLOAD_STORE):
+    digest = content_hash(data)
+    folder = os.path.join(store_dir, digest)
+    path = os.path.join(folder, os.path.basename(file_name))
+    if not os.path.exists(path):
+        os.makedirs(folder, exist_ok=True)
+        # Written under a temporary name first, so readers never see half a file
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    return path
+
+# Same, for a file object (e.g. an HTTP upload): streamed to a temporary
+# file while hashing, so the upload is never held in memory as a whole
+def save_upload_stream(fileobj, file_name, store_dir=UPLOAD_STORE):
+    os.makedirs(store_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    tmp_path = os.path.join(store_dir, f"{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, "wb") as f:
+        for chunk in iter(lambda: fileobj.read(1024 * 1024), b""):
+            digest.update(chunk)
+            f.write(chunk)
+    folder = os.path.join(store_dir, digest.hexdigest())
+    path = os.path.join(folder, os.path.basename(file_name))
+    if os.path.exists(path):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(folder, exist_ok=True)
+        os.replace(tmp_path, path)
+    return path
+
+# Stored copy of a content hash (any name it was uploaded under), or None
+def find_upload(digest, store_dir=UPLOAD_STORE):
+    folder = os.path.join(store_dir, digest)
+    if os.path.isdir(folder):
+        for name in sorted(os.listdir(folder)):
+            if not name.endswith(".tmp"):
+                return os.path.join(folder, name)
+    return None
+
+# Every stored upload as (content hash, file name, path); files placed
+# directly in store_dir (older flat layout) are listed with hash None
+def iter_uploads(store_dir=UPLOAD_STORE, extensions=None):
+    if not os.path.isdir(store_dir):
+        return
+    for entry in sorted(os.scandir(store_dir), key=lambda e: e.name):
+        if entry.is_dir():
+            for name in sorted(os.listdir(entry.path)):
+                if not name.endswith(".tmp") and (extensions is None or name.lower().endswith(extensions)):
+                    yield entry.name, name, os.path.join(entry.path, name)
+        elif extensions is None or entry.name.lower().endswith(extensions):
+            yield None, entry.name, entry.path
@@ -0,0 +1,376 @@
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import argparse
+import threading
+from contextlib import closing, redirect_stdout
+import metrics
+from jsonl_pipeline import iter_input_files, RecordWriter
+from text_extraction import supported_extensions
+from data_paths import data_path
+from evaluation_store import DB_FILE
+
+# -----------------------------
+# Distributed bulk evaluation over a SQLite work queue
+# (job_queue.py is the in-process queue behind the API; this one is shared
+# by separate worker processes, on this machine or on others)
+#
+#   coordinator : submit() splits a resume corpus into chunks of CHUNK_SIZE
+#                 paths and stores them with the JD requirements
+#   workers     : claim a chunk (a time-limited lease), score it with the
+#                 keyword scorer and write its results in the same
+#                 transaction that marks it done
+#   merge       : every result of a run into the evaluations store (already
+#                 stored evaluations are skipped) and optionally a JSONL/CSV
+#
+# A chunk whose worker raised is released for another attempt; a chunk whose
+# worker died is claimed again once its lease expires. After MAX_ATTEMPTS it
+# is marked failed and reported by status(). Workers only touch the queue
+# once per chunk, so throughput grows with the number of worker processes
+# (benchmarks/work_queue_benchmark.py measures it). The resume and score
+# caches every worker shares are SQLite files in WAL mode, so cache reads
+# never wait on another worker's write.
+#
+# Resume paths must be readable at the same location by every worker (e.g.
+# a shared mount), and the queue file must live where every worker can lock
+# it: a local disk for processes on one machine, or a filesystem with
+# working POSIX locks for several machines.
+#
+#   python work_queue.py run --resumes Resumes/data --jd JD/dataJD/jd_1.pdf --processes 8
+#   python work_queue.py submit --resumes /shared/resumes --jd jd.json     # coordinator
+#   python work_queue.py worker --processes 8                             # on every machine
+#   python work_queue.py status
+#   python work_queue.py merge --run <run_id> --output results.jsonl
+QUEUE_DB = data_path("cache", "work_queue.db")
+CHUNK_SIZE = 200
+LEASE_SECONDS = 600
+MAX_ATTEMPTS = 3
+POLL_SECONDS = 0.5
+MERGE_BATCH = 500
+
+class WorkQueue:
+    def __init__(self, db_path=QUEUE_DB):
+        self.db_path = db_path
+        if os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id TEXT PRIMARY KEY,
+                jd TEXT,
+                resume_count INTEGER,
+                created_at REAL,
+                merged_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                run_id TEXT,
+                chunk_id INTEGER,
+                paths TEXT,
+                status TEXT DEFAULT 'pending',
+                attempts INTEGER DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                error TEXT,
+                PRIMARY KEY (run_id, chunk_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_chunks_status ON chunks(status, lease_expires);
+            -- one row per scored resume; error is set for unreadable files
+            CREATE TABLE IF NOT EXISTS chunk_results (
+                run_id TEXT,
+                chunk_id INTEGER,
+                result TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_chunk_results_run ON chunk_results(run_id, chunk_id);
+            """)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # -----------------------------
+    # Coordinator: one run per (corpus, JD); returns the run id
+    def submit(self, resume_paths, jd, chunk_size=CHUNK_SIZE):
+        run_id = uuid.uuid4().hex[:12]
+        jd_record = {"file_name": jd.jd_name, "must_have_skills": jd.must_have, "nice_to_have_skills": jd.nice_to_have}
+        resume_paths = [os.path.abspath(path) for path in resume_paths]
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO runs VALUES (?, ?, ?, ?, NULL)",
+                         (run_id, json.dumps(jd_record), len(resume_paths), time.time()))
+            conn.executemany("INSERT INTO chunks(run_id, chunk_id, paths) VALUES (?, ?, ?)",
+                             [(run_id, i, json.dumps(resume_paths[start:start + chunk_size]))
+                              for i, start in enumerate(range(0, len(resume_paths), chunk_size))])
+            conn.execute("COMMIT")
+        return run_id
+
+    # -----------------------------
+    # Workers: claim the next pending (or expired) chunk; returns
+    # (run_id, chunk_id, paths, jd_record) or None when nothing is claimable
+    def claim(self, owner, run_id=None, lease_seconds=LEASE_SECONDS):
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Expired leases past the last attempt fail instead of running again
+            conn.execute("""
+            UPDATE chunks SET status = 'failed', error = COALESCE(error, 'lease expired')
+            WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """, (now, MAX_ATTEMPTS))
+            sql = """
+            SELECT run_id, chunk_id, paths FROM chunks
+            WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ?))
+            """
+            params = [now]
+            if run_id:
+                sql += " AND run_id = ?"
+                params.append(run_id)
+            # Oldest first: runs in submission order, chunks in insertion order
+            row = conn.execute(sql + " ORDER BY rowid LIMIT 1", params).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute("""
+            UPDATE chunks SET status = 'leased', attempts = attempts + 1, lease_owner = ?, lease_expires = ?
+            WHERE run_id = ? AND chunk_id = ?
+            """, (owner, now + lease_seconds, row[0], row[1]))
+            jd_record = json.loads(conn.execute("SELECT jd FROM runs WHERE run_id = ?", (row[0],)).fetchone()[0])
+            conn.execute("COMMIT")
+        return row[0], row[1], json.loads(row[2]), jd_record
+
+    # Results and the done mark in one transaction; a worker that lost its
+    # lease (expired and re-claimed) does not write
+    def complete(self, run_id, chunk_id, owner, results):
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            updated = conn.execute("""
+            UPDATE chunks SET status = 'done', lease_expires = NULL, error = NULL
+            WHERE run_id = ? AND chunk_id = ? AND status = 'leased' AND lease_owner = ?
+            """, (run_id, chunk_id, owner)).rowcount
+            if updated:
+                conn.executemany("INSERT INTO chunk_results VALUES (?, ?, ?)",
+                                 [(run_id, chunk_id, json.dumps(result, ensure_ascii=False)) for result in results])
+            conn.execute("COMMIT")
+        return bool(updated)
+
+    def fail(self, run_id, chunk_id, owner, error):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+            UPDATE chunks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                              lease_owner = NULL, lease_expires = NULL, error = ?
+            WHERE run_id = ? AND chunk_id = ? AND status = 'leased' AND lease_owner = ?
+            """, (MAX_ATTEMPTS, error, run_id, chunk_id, owner))
+
+    # Failed chunks back to pending with a fresh attempt count
+    def retry_failed(self, run_id):
+        with closing(self._connect()) as conn, conn:
+            return conn.execute("""
+            UPDATE chunks SET status = 'pending', attempts = 0, error = NULL
+            WHERE run_id = ? AND status = 'failed'
+            """, (run_id,)).rowcount
+
+    # -----------------------------
+    # Progress: chunk counts by status and the errors of failed chunks
+    def status(self, run_id=None):
+        with closing(self._connect()) as conn:
+            runs = [row[0] for row in conn.execute("SELECT run_id FROM runs ORDER BY created_at")] \
+                if run_id is None else [run_id]
+            report = {}
+            for run in runs:
+                counts = dict(conn.execute(
+                    "SELECT status, COUNT(*) FROM chunks WHERE run_id = ? GROUP BY status", (run,)).fetchall())
+                row = conn.execute("SELECT resume_count, merged_at FROM runs WHERE run_id = ?", (run,)).fetchone()
+                report[run] = {
+                    "resumes": row[0] if row else 0,
+                    "merged": bool(row and row[1]),
+                    "chunks": {status: counts.get(status, 0) for status in ("pending", "leased", "done", "failed")},
+                    "errors": [{"chunk_id": chunk_id, "error": error} for chunk_id, error in conn.execute(
+                        "SELECT chunk_id, error FROM chunks WHERE run_id = ? AND status = 'failed'", (run,))]
+                }
+            return report
+
+    def unfinished(self, run_id=None):
+        sql = "SELECT COUNT(*) FROM chunks WHERE status IN ('pending', 'leased')"
+        params = ()
+        if run_id:
+            sql += " AND run_id = ?"
+            params = (run_id,)
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    # -----------------------------
+    # Merge: every result of a run, a chunk at a time
+    def iter_results(self, run_id):
+        with closing(self._connect()) as conn:
+            for (result,) in conn.execute(
+                    "SELECT result FROM chunk_results WHERE run_id = ? ORDER BY chunk_id, rowid", (run_id,)):
+                yield json.loads(result)
+
+    def merge(self, run_id, store, output_file=None, fields=None):
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT jd FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run: {run_id}")
+        jd_name = json.loads(row[0])["file_name"]
+
+        summary = {"run_id": run_id, "evaluated": 0, "skipped": 0, "inserted": 0, "output_file": output_file}
+        writer = RecordWriter(output_file, fields) if output_file else None
+        batch = []
+        with metrics.timer("queue_merge"):
+            for result in self.iter_results(run_id):
+                if result.get("error"):
+                    summary["skipped"] += 1
+                    continue
+                summary["evaluated"] += 1
+                if writer:
+                    writer.write(result)
+                batch.append(result)
+                if len(batch) >= MERGE_BATCH:
+                    summary["inserted"] += store.add_evaluations(jd_name, batch)
+                    batch = []
+            summary["inserted"] += store.add_evaluations(jd_name, batch)
+        if writer:
+            writer.close()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE runs SET merged_at = ? WHERE run_id = ?", (time.time(), run_id))
+        return summary
+
+# -----------------------------
+# Score one chunk: keyword scorer, extraction in this process (the worker
+# processes are the parallelism), console output discarded
+def score_chunk(paths, jd):
+    from ResumeJDMatching import iter_bulk_evaluations
+    from resume_cache import content_hash
+    from text_extraction import source_name
+
+    existing = [path for path in paths if os.path.exists(path)]
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        results = list(iter_bulk_evaluations(existing, jd, workers=1))
+    # Missing and unreadable files are reported too, so merge can count them.
+    # Results are matched to files by content hash: file names repeat
+    # across folders.
+    scored = {result["resume_hash"] for result in results}
+    results += [{"candidate_name": source_name(path), "error": "could not be read"}
+                for path in paths if not os.path.exists(path) or content_hash(path) not in scored]
+    return results
+
+# Worker loop: claim, score, complete until no work is left. With wait=True
+# it keeps polling while other workers still hold leases, so chunks of a
+# crashed worker are picked up when their lease expires.
+def run_worker(queue, run_id=None, owner=None, wait=True):
+    from ResumeJDMatching import CompiledJD, bcolors
+
+    owner = owner or f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+    jds = {}
+    chunks = 0
+    while True:
+        claimed = queue.claim(owner, run_id)
+        if claimed is None:
+            if wait and queue.unfinished(run_id):
+                time.sleep(POLL_SECONDS)
+                continue
+            return chunks
+        chunk_run, chunk_id, paths, jd_record = claimed
+        try:
+            if chunk_run not in jds:
+                jds[chunk_run] = CompiledJD.from_parsed(jd_record["file_name"], jd_record)
+            with metrics.timer("queue_chunk"):
+                results = score_chunk(paths, jds[chunk_run])
+        except Exception as e:
+            print(f"{bcolors.WARNING}⚠️ Chunk {chunk_run}/{chunk_id} failed: {type(e).__name__}: {e}{bcolors.ENDC}")
+            queue.fail(chunk_run, chunk_id, owner, f"{type(e).__name__}: {e}")
+            continue
+        if queue.complete(chunk_run, chunk_id, owner, results):
+            chunks += 1
+
+def _worker_process(db_path, run_id):
+    run_worker(WorkQueue(db_path), run_id)
+
+# Several worker processes on this machine; returns when the queue is drained
+def run_workers(db_path, processes, run_id=None):
+    import multiprocessing
+    if processes <= 1:
+        return _worker_process(db_path, run_id)
+    procs = [multiprocessing.Process(target=_worker_process, args=(db_path, run_id)) for _ in range(processes)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+# -----------------------------
+# Command line
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed bulk resume evaluation over a SQLite work queue.")
+    parser.add_argument("--queue", default=QUEUE_DB, help="queue database shared by coordinator and workers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    submit = commands.add_parser("submit", help="split a resume folder into chunks for one JD")
+    submit.add_argument("--resumes", required=True, help="folder of resumes (any supported format)")
+    submit.add_argument("--jd", required=True, help="JD file or parsed JD JSON")
+    submit.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    worker = commands.add_parser("worker", help="score chunks until the queue is drained")
+    worker.add_argument("--run", help="only this run")
+    worker.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+
+    status = commands.add_parser("status", help="chunk counts and failures")
+    status.add_argument("--run")
+
+    retry = commands.add_parser("retry", help="send the failed chunks of a run back to the queue")
+    retry.add_argument("--run", required=True)
+
+    merge = commands.add_parser("merge", help="store the results of a run in the evaluations DB")
+    merge.add_argument("--run", required=True)
+    merge.add_argument("--db", default=DB_FILE)
+    merge.add_argument("--output", help="also write every result to this .jsonl or .csv file")
+
+    run = commands.add_parser("run", help="submit + local workers + merge")
+    run.add_argument("--resumes", required=True)
+    run.add_argument("--jd", required=True)
+    run.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    run.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    run.add_argument("--db", default=DB_FILE)
+    run.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    queue = WorkQueue(args.queue)
+    if args.command in ("submit", "run"):
+        from ResumeJDMatching import compile_jd
+        paths = [path for _, path in iter_input_files(args.resumes, supported_extensions())]
+        run_id = queue.submit(paths, compile_jd(args.jd), args.chunk_size)
+        print(f"Run {run_id}: {len(paths)} resumes in {queue.status(run_id)[run_id]['chunks']['pending']} chunks")
+        if args.command == "submit":
+            return 0
+        start = time.perf_counter()
+        run_workers(args.queue, args.processes, run_id)
+        elapsed = time.perf_counter() - start
+        print(f"Scored in {elapsed:.1f}s ({len(paths) / elapsed:.1f} resumes/s with {args.processes} processes)")
+        args.run = run_id
+    if args.command == "worker":
+        run_workers(args.queue, args.processes, args.run)
+        return 0
+    if args.command == "retry":
+        print(f"{queue.retry_failed(args.run)} failed chunks queued again")
+        return 0
+    if args.command in ("merge", "run"):
+        from ResumeJDMatching import RESULT_FIELDS
+        from evaluation_store import EvaluationStore
+        report = queue.status(args.run)[args.run]
+        if report["chunks"]["pending"] or report["chunks"]["leased"]:
+            print(f"Run {args.run} is not finished: {report['chunks']}")
+            return 1
+        summary = queue.merge(args.run, EvaluationStore(args.db), args.output, RESULT_FIELDS)
+        print(json.dumps(summary, indent=4))
+        if report["chunks"]["failed"]:
+            print(f"{report['chunks']['failed']} chunks failed: {report['errors']}")
+            return 1
+        return 0
+    print(json.dumps(queue.status(args.run), indent=4))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())